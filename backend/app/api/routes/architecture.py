@@ -1,5 +1,6 @@
 import logging
 from fastapi import APIRouter, HTTPException, Depends
+from fastapi.responses import StreamingResponse
 from app.schemas.questionnaire import QuestionnaireRequest
 from app.schemas.architecture import ArchitectureResponse
 from app.services.architecture_service import ArchitectureService
@@ -32,6 +33,32 @@ async def generate_architecture(
             detail=f"Failed to generate architecture: {str(e)}"
         )
 
+# Template downloads stream section by section, so the client starts receiving the
+# document while later sections are still being rendered
+@router.post("/generate/terraform", response_class=StreamingResponse)
+async def generate_terraform(
+    questionnaire: QuestionnaireRequest,
+    generator: ArchitectureGenerator = Depends(get_architecture_generator)
+):
+    """Generate only the Terraform template for the questionnaire"""
+    return StreamingResponse(
+        generator.iter_terraform(questionnaire),
+        media_type="text/plain",
+        headers={"Content-Disposition": 'attachment; filename="main.tf"'}
+    )
+
+@router.post("/generate/cloudformation", response_class=StreamingResponse)
+async def generate_cloudformation(
+    questionnaire: QuestionnaireRequest,
+    generator: ArchitectureGenerator = Depends(get_architecture_generator)
+):
+    """Generate only the CloudFormation template for the questionnaire"""
+    return StreamingResponse(
+        generator.iter_cloudformation(questionnaire),
+        media_type="text/yaml",
+        headers={"Content-Disposition": 'attachment; filename="template.yaml"'}
+    )
+
 @router.get("/{architecture_id}", response_model=ArchitectureResponse)
 async def get_architecture(
     architecture_id: str,
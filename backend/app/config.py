@@ -11,15 +11,23 @@ class Settings(BaseSettings):
     HOST: str = "0.0.0.0"
     PORT: int = 8000
     DEBUG: bool = True
+    # Serve /docs, /redoc and the OpenAPI schema outside DEBUG as well
+    ENABLE_DOCS: bool = False
     
-    # CORS Settings - Simplified since nginx handles routing
+    # CORS Settings - nginx serves the frontend same-origin, so only the local dev
+    # server needs listing; "*" disables credentialed requests (see main.py)
     ALLOWED_HOSTS: List[str] = [
         "http://localhost",
         "http://localhost:80",
+        "http://localhost:3000",
         "http://127.0.0.1",
-        "*"  # Since nginx is handling the routing
     ]
     
+    # Optional routers with heavy dependencies; disable to skip importing them
+    ENABLE_INFRASTRUCTURE_IMPORT: bool = True
+    ENABLE_AI_ML_OPTIMIZATION: bool = True
+    ENABLE_PRODUCTION_INFRASTRUCTURE: bool = True
+    
     # AWS Settings (for future use)
     AWS_REGION: str = "us-west-2"
     AWS_ACCESS_KEY_ID: str = ""
@@ -14,6 +14,9 @@ import hashlib
 
 logger = logging.getLogger(__name__)
 
+# Compliance frameworks that force the "high" security level
+_HIGH_SECURITY_COMPLIANCE = frozenset({'hipaa', 'pci-dss', 'sox'})
+
 class SecurityRecommendationType(Enum):
     NEW_FEATURE = "new_feature"
     VULNERABILITY_FIX = "vulnerability_fix"
@@ -637,10 +640,10 @@ class AISecurityAdvisor:
     
     def _determine_security_level(self, questionnaire: QuestionnaireRequest) -> str:
         """Determine security level based on questionnaire"""
-        compliance = getattr(questionnaire, 'compliance_requirements', [])
+        compliance = getattr(questionnaire, 'compliance_requirements', ())
         data_sensitivity = getattr(questionnaire, 'data_sensitivity', '').lower()
         
-        if any(req in ['hipaa', 'pci-dss', 'sox'] for req in compliance) or 'high' in data_sensitivity:
+        if not _HIGH_SECURITY_COMPLIANCE.isdisjoint(compliance) or 'high' in data_sensitivity:
             return "high"
         elif 'medium' in data_sensitivity or len(compliance) > 0:
             return "medium"
@@ -1,5 +1,5 @@
 import uuid
-from typing import Dict, List
+from typing import Dict, Iterator, List
 from app.schemas.questionnaire import QuestionnaireRequest
 from app.schemas.architecture import ArchitectureResponse, DiagramData, CostBreakdown
 from app.core.aws_services import AWSServicesConfig
@@ -53,6 +53,14 @@ class ArchitectureGenerator:
             recommendations=recommendations
         )
     
+    def iter_terraform(self, questionnaire: QuestionnaireRequest) -> Iterator[str]:
+        """Yield only the Terraform template for the questionnaire, section by section"""
+        return self.template_generator.iter_terraform_template(questionnaire, self._select_services(questionnaire))
+    
+    def iter_cloudformation(self, questionnaire: QuestionnaireRequest) -> Iterator[str]:
+        """Yield only the CloudFormation template for the questionnaire, section by section"""
+        return self.template_generator.iter_cloudformation_template(questionnaire, self._select_services(questionnaire))
+    
     def generate_architecture(self, questionnaire: QuestionnaireRequest, user_preferences: Dict = None) -> Dict:
         """Generate architecture data as dictionary for storage"""
         response = self.generate(questionnaire, user_preferences)
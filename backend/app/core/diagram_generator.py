@@ -3,6 +3,9 @@ from app.schemas.questionnaire import QuestionnaireRequest
 from app.schemas.architecture import DiagramData, DiagramNode, DiagramEdge
 import json
 
+# Compliance frameworks that force the "high" security level in diagrams
+_HIGH_SECURITY_COMPLIANCE = frozenset({'hipaa', 'pci-dss', 'sox'})
+
 class DiagramGenerator:
     """Generate architecture diagram data for React Flow"""
     
@@ -82,10 +85,10 @@ class DiagramGenerator:
     
     def _determine_security_level(self, questionnaire: QuestionnaireRequest) -> str:
         """Determine security requirements based on questionnaire"""
-        compliance = getattr(questionnaire, 'compliance_requirements', [])
+        compliance = getattr(questionnaire, 'compliance_requirements', ())
         data_sensitivity = getattr(questionnaire, 'data_sensitivity', '').lower()
         
-        if any(req in ['hipaa', 'pci-dss', 'sox'] for req in compliance) or 'high' in data_sensitivity:
+        if not _HIGH_SECURITY_COMPLIANCE.isdisjoint(compliance) or 'high' in data_sensitivity:
             return "high"
         elif 'medium' in data_sensitivity or len(compliance) > 0:
             return "medium"
@@ -1,174 +1,67 @@
-from typing import Dict, List
+import io
+import sys
+from functools import cache, lru_cache
+from typing import TYPE_CHECKING, Callable, Dict, FrozenSet, Iterator, List, Optional, Tuple
 from app.schemas.questionnaire import QuestionnaireRequest
-from app.core.enhanced_security_templates import EnhancedSecurityTemplates
 
-class TemplateGenerator:
-    """Generate Infrastructure as Code templates with enhanced security hardening"""
-    
-    def __init__(self):
-        self.enhanced_security = EnhancedSecurityTemplates()
-        self.security_levels = {
-            "basic": ["encryption", "vpc", "enhanced_security_groups", "enhanced_nacls"],
-            "medium": ["encryption", "vpc", "enhanced_security_groups", "enhanced_nacls", "monitoring", "backup", "guardduty", "cloudtrail"],
-            "high": ["encryption", "vpc", "enhanced_security_groups", "enhanced_nacls", "monitoring", "backup", "waf", "secrets", "multi_az", "logging", "guardduty", "security_hub", "config", "inspector", "macie", "cloudhsm", "compliance_controls"]
-        }
-    
-    def _determine_security_level(self, questionnaire: QuestionnaireRequest) -> str:
-        """Determine security requirements based on questionnaire"""
-        compliance = getattr(questionnaire, 'compliance_requirements', [])
-        data_sensitivity = getattr(questionnaire, 'data_sensitivity', '').lower()
-        
-        # Enhanced security level determination
-        if any(req in ['hipaa', 'pci-dss', 'sox', 'fedramp'] for req in compliance) or 'high' in data_sensitivity:
-            return "high"
-        elif 'medium' in data_sensitivity or len(compliance) > 0 or any(req in ['gdpr'] for req in compliance):
-            return "medium"
-        else:
-            return "basic"
-    
-    def _determine_architecture_type(self, questionnaire: QuestionnaireRequest) -> str:
-        """Determine the type of architecture based on questionnaire responses"""
-        app_type = getattr(questionnaire, 'application_type', '').lower()
-        
-        if 'web' in app_type or 'frontend' in app_type:
-            return "web_application"
-        elif 'api' in app_type or 'backend' in app_type:
-            return "api_backend"
-        elif 'analytics' in app_type or 'data' in app_type or 'ml' in app_type:
-            return "data_analytics"
-        elif 'microservice' in app_type or 'container' in app_type:
-            return "microservices"
-        else:
-            return "web_application"
-    
-    def generate_terraform_template(self, questionnaire: QuestionnaireRequest, services: Dict[str, str]) -> str:
-        """Generate a security-hardened, project-specific Terraform template"""
-        project_name_clean = questionnaire.project_name.lower().replace(' ', '-').replace('_', '-')
-        security_level = self._determine_security_level(questionnaire)
-        arch_type = self._determine_architecture_type(questionnaire)
-        security_features = self.security_levels[security_level]
-        
-        # Build template sections
-        template_sections = []
-        
-        # Header and provider configuration
-        template_sections.append(self._generate_terraform_header(project_name_clean))
-        
-        # Variables
-        template_sections.append(self._generate_terraform_variables(security_level))
-        
-        # Data sources
-        template_sections.append(self._generate_terraform_data_sources())
-        
-        # Security components
-        if "encryption" in security_features:
-            template_sections.append(self._generate_terraform_kms(project_name_clean))
-        
-        if "secrets" in security_features:
-            template_sections.append(self._generate_terraform_secrets(project_name_clean))
-        
-        # Networking
-        template_sections.append(self._generate_terraform_vpc(project_name_clean, security_level))
-        
-        # Enhanced security groups and NACLs  
-        if "enhanced_security_groups" in security_features:
-            template_sections.append(self._generate_enhanced_terraform_security_groups(project_name_clean, services, security_level))
-        
-        if "enhanced_nacls" in security_features:
-            template_sections.append(self._generate_terraform_nacls(project_name_clean, security_level))
-        
-        # Enhanced WAF with advanced rules
-        if "waf" in security_features:
-            template_sections.append(self._generate_enhanced_terraform_waf(project_name_clean, security_level))
-        
-        # Load balancer
-        if "load_balancer" in services:
-            template_sections.append(self._generate_terraform_alb(project_name_clean, security_level))
-        
-        # Compute resources based on architecture type
-        if arch_type == "web_application":
-            template_sections.append(self._generate_terraform_ec2(project_name_clean, services, security_level))
-        elif arch_type == "api_backend":
-            template_sections.append(self._generate_terraform_lambda(project_name_clean, security_level))
-        elif arch_type == "microservices":
-            template_sections.append(self._generate_terraform_ecs(project_name_clean, security_level))
-        
-        # Database
-        if "database" in services:
-            template_sections.append(self._generate_terraform_database(project_name_clean, services, security_level))
-        
-        # Storage
-        template_sections.append(self._generate_terraform_s3(project_name_clean, security_level))
-        
-        # Enhanced security services
-        if "guardduty" in security_features:
-            template_sections.append(self._generate_terraform_guardduty(project_name_clean))
-        
-        if "security_hub" in security_features:
-            template_sections.append(self._generate_terraform_security_hub(project_name_clean))
-        
-        if "config" in security_features:
-            template_sections.append(self._generate_terraform_config(project_name_clean))
-        
-        if "inspector" in security_features:
-            template_sections.append(self._generate_terraform_inspector(project_name_clean))
-        
-        if "macie" in security_features:
-            template_sections.append(self._generate_terraform_macie(project_name_clean))
-        
-        if "cloudhsm" in security_features:
-            template_sections.append(self._generate_terraform_cloudhsm(project_name_clean))
-        
-        # Enhanced monitoring and logging
-        if "monitoring" in security_features:
-            template_sections.append(self._generate_enhanced_terraform_monitoring(project_name_clean, security_level))
-        
-        if "logging" in security_features:
-            template_sections.append(self._generate_enhanced_terraform_logging(project_name_clean, security_level))
-        
-        # Compliance controls
-        if "compliance_controls" in security_features:
-            compliance_frameworks = getattr(questionnaire, 'compliance_requirements', [])
-            template_sections.append(self._generate_terraform_compliance_controls(project_name_clean, compliance_frameworks))
-        
-        # Outputs
-        template_sections.append(self._generate_terraform_outputs())
-        
-        return "\n\n".join(template_sections)
-    
-    def _generate_terraform_header(self, project_name: str) -> str:
-        return f'''# Terraform configuration for {project_name}
+if TYPE_CHECKING:
+    from app.core.enhanced_security_templates import EnhancedSecurityTemplates
+
+# Compliance frameworks that always force the "high" security level
+_HIGH_SECURITY_COMPLIANCE = frozenset({'hipaa', 'pci-dss', 'sox', 'fedramp'})
+
+# Application type keywords mapped to an architecture type, checked in order
+_ARCHITECTURE_KEYWORDS = (
+    (('web', 'frontend'), "web_application"),
+    (('api', 'backend'), "api_backend"),
+    (('analytics', 'data', 'ml'), "data_analytics"),
+    (('microservice', 'container'), "microservices"),
+)
+
+# Engine versions pinned in generated database resources
+_DB_ENGINE_VERSIONS = {
+    "mysql": "8.0",
+    "postgres": "14.9",
+    "aurora-mysql": "8.0.mysql_aurora.3.02.0",
+    "aurora-postgresql": "14.9",
+}
+
+# Python booleans as HCL literals, which YAML also reads as booleans
+_HCL_BOOL = {True: "true", False: "false"}
+
+# Skeleton sections are module-level %-format strings, parsed once at import and filled
+# with a single parameter mapping per call (see enhanced_security_templates).
+_TERRAFORM_HEADER_TEMPLATE = '''# Terraform configuration for %(project_name)s
 # Generated with security best practices
 
-terraform {{
+terraform {
   required_version = ">= 1.5"
-  required_providers {{
-    aws = {{
+  required_providers {
+    aws = {
       source  = "hashicorp/aws"
       version = "~> 5.0"
-    }}
-    random = {{
+    }
+    random = {
       source  = "hashicorp/random"
       version = "~> 3.1"
-    }}
-  }}
-}}
+    }
+  }
+}
 
-provider "aws" {{
+provider "aws" {
   region = var.aws_region
   
-  default_tags {{
-    tags = {{
+  default_tags {
+    tags = {
       Project     = var.project_name
       Environment = var.environment
       ManagedBy   = "Terraform"
       CreatedBy   = "AWS-Architecture-Generator"
-    }}
-  }}
-}}'''
-    
-    def _generate_terraform_variables(self, security_level: str) -> str:
-        return '''# Variables
+    }
+  }
+}'''
+
+_TERRAFORM_VARIABLES = '''# Variables
 variable "aws_region" {
   description = "AWS region"
   type        = string
@@ -220,9 +113,8 @@ variable "enable_scp" {
   type        = bool
   default     = false
 }'''
-    
-    def _generate_terraform_data_sources(self) -> str:
-        return '''# Data Sources
+
+_TERRAFORM_DATA_SOURCES = '''# Data Sources
 data "aws_availability_zones" "available" {
   state = "available"
 }
@@ -230,273 +122,90 @@ data "aws_availability_zones" "available" {
 data "aws_caller_identity" "current" {}
 
 data "aws_region" "current" {}'''
-    
-    def _generate_terraform_kms(self, project_name: str) -> str:
-        return f'''# Random ID for unique resource naming
-resource "random_id" "suffix" {{
+
+_TERRAFORM_KMS_TEMPLATE = '''# Random ID for unique resource naming
+resource "random_id" "suffix" {
   byte_length = 4
-}}
+}
 
 # KMS Key for encryption
-resource "aws_kms_key" "main" {{
-  description             = "KMS key for {project_name}"
+resource "aws_kms_key" "main" {
+  description             = "KMS key for %(project_name)s"
   deletion_window_in_days = 7
   enable_key_rotation     = true
   
-  policy = jsonencode({{
+  policy = jsonencode({
     Version = "2012-10-17"
     Statement = [
-      {{
+      {
         Sid    = "Enable IAM User Permissions"
         Effect = "Allow"
-        Principal = {{
-          AWS = "arn:aws:iam::${{data.aws_caller_identity.current.account_id}}:root"
-        }}
+        Principal = {
+          AWS = "arn:aws:iam::${data.aws_caller_identity.current.account_id}:root"
+        }
         Action   = "kms:*"
         Resource = "*"
-      }}
+      }
     ]
-  }})
+  })
   
-  tags = {{
-    Name = "${{var.project_name}}-kms-key"
-  }}
-}}
+  tags = {
+    Name = "${var.project_name}-kms-key"
+  }
+}
 
-resource "aws_kms_alias" "main" {{
-  name          = "alias/${{var.project_name}}-key-${{random_id.suffix.hex}}"
+resource "aws_kms_alias" "main" {
+  name          = "alias/${var.project_name}-key-${random_id.suffix.hex}"
   target_key_id = aws_kms_key.main.key_id
-}}'''
-    
-    def _generate_terraform_secrets(self, project_name: str) -> str:
-        return f'''# Secrets Manager
-resource "aws_secretsmanager_secret" "db_credentials" {{
-  name                    = "${{var.project_name}}-db-credentials"
-  description             = "Database credentials for {project_name}"
+}'''
+
+_TERRAFORM_SECRETS_TEMPLATE = '''# Secrets Manager
+resource "aws_secretsmanager_secret" "db_credentials" {
+  name                    = "${var.project_name}-db-credentials"
+  description             = "Database credentials for %(project_name)s"
   kms_key_id              = aws_kms_key.main.arn
   recovery_window_in_days = 7
   
-  tags = {{
-    Name = "${{var.project_name}}-db-secret"
-  }}
-}}
+  tags = {
+    Name = "${var.project_name}-db-secret"
+  }
+}
 
-resource "aws_secretsmanager_secret_version" "db_credentials" {{
+resource "aws_secretsmanager_secret_version" "db_credentials" {
   secret_id = aws_secretsmanager_secret.db_credentials.id
-  secret_string = jsonencode({{
+  secret_string = jsonencode({
     username = "admin"
     password = random_password.db_password.result
-  }})
-}}
+  })
+}
 
-resource "random_password" "db_password" {{
+resource "random_password" "db_password" {
   length  = 32
   special = true
-}}'''
-    
-    def _generate_terraform_vpc(self, project_name: str, security_level: str) -> str:
-        # Always use multi-AZ since AWS requires minimum 2 AZs for ALB and RDS
-        multi_az = True
-        
-        vpc_config = f'''# Use Default VPC and its existing resources
-data "aws_vpc" "main" {{
-  default = true
-}}
-
-# Get default subnets (already exist in default VPC)
-data "aws_subnets" "default" {{
-  filter {{
-    name   = "vpc-id"
-    values = [data.aws_vpc.main.id]
-  }}
-}}
-
-data "aws_subnet" "default" {{
-  count = length(data.aws_subnets.default.ids)
-  id    = data.aws_subnets.default.ids[count.index]
-}}
-
-# Get existing internet gateway for default VPC
-data "aws_internet_gateway" "default" {{
-  filter {{
-    name   = "attachment.vpc-id"
-    values = [data.aws_vpc.main.id]
-  }}
-}}
-
-# Get existing route table for default VPC
-data "aws_route_table" "default" {{
-  vpc_id = data.aws_vpc.main.id
-  filter {{
-    name   = "association.main"
-    values = ["true"]
-  }}
-}}
-
-# Use default subnets for both public and private
-locals {{
-  # Use existing default subnets (they're all public by default)
-  public_subnet_ids = data.aws_subnets.default.ids
-  private_subnet_ids = data.aws_subnets.default.ids  # Same as public for simplicity
-}}'''
+}'''
 
-        # Default VPC already has internet connectivity for all subnets
-        # No additional NAT gateway or private route tables needed
-        
-        return vpc_config
-    
-    def _generate_terraform_security_groups(self, project_name: str, services: Dict[str, str]) -> str:
-        return f'''# Security Groups
-resource "aws_security_group" "alb" {{
-  name_prefix = "${{var.project_name}}-alb-"
-  vpc_id      = data.aws_vpc.main.id
-  description = "Security group for Application Load Balancer"
-  
-  ingress {{
-    description = "HTTPS"
-    from_port   = 443
-    to_port     = 443
-    protocol    = "tcp"
-    cidr_blocks = ["0.0.0.0/0"]
-  }}
-  
-  ingress {{
-    description = "HTTP (redirect to HTTPS)"
-    from_port   = 80
-    to_port     = 80
-    protocol    = "tcp"
-    cidr_blocks = ["0.0.0.0/0"]
-  }}
-  
-  egress {{
-    from_port   = 0
-    to_port     = 0
-    protocol    = "-1"
-    cidr_blocks = ["0.0.0.0/0"]
-  }}
-  
-  tags = {{
-    Name = "${{var.project_name}}-alb-sg"
-  }}
-  
-  lifecycle {{
-    create_before_destroy = true
-  }}
-}}
+# IAM trust policies shared by every role a section declares, keyed by service principal
+_TERRAFORM_ASSUME_ROLE_POLICY_TEMPLATE = '''jsonencode({
+    Version = "2012-10-17"
+    Statement = [
+      {
+        Action = "sts:AssumeRole"
+        Effect = "Allow"
+        Principal = {
+          Service = "%s"
+        }
+      }
+    ]
+  })'''
 
-resource "aws_security_group" "app" {{
-  name_prefix = "${{var.project_name}}-app-"
-  vpc_id      = data.aws_vpc.main.id
-  description = "Security group for application servers"
-  
-  ingress {{
-    description     = "Application traffic from ALB"
-    from_port       = 8080
-    to_port         = 8080
-    protocol        = "tcp"
-    security_groups = [aws_security_group.alb.id]
-  }}
-  
-  egress {{
-    from_port   = 0
-    to_port     = 0
-    protocol    = "-1"
-    cidr_blocks = ["0.0.0.0/0"]
-  }}
-  
-  tags = {{
-    Name = "${{var.project_name}}-app-sg"
-  }}
-}}
+_TERRAFORM_ASSUME_ROLE_POLICIES = {
+    service: _TERRAFORM_ASSUME_ROLE_POLICY_TEMPLATE % service
+    for service in ("ec2.amazonaws.com", "lambda.amazonaws.com", "ecs-tasks.amazonaws.com")
+}
 
-resource "aws_security_group" "database" {{
-  name_prefix = "${{var.project_name}}-db-"
-  vpc_id      = data.aws_vpc.main.id
-  description = "Security group for database"
-  
-  ingress {{
-    description     = "Database access from application"
-    from_port       = 3306
-    to_port         = 3306
-    protocol        = "tcp"
-    security_groups = [aws_security_group.app_tier.id]
-  }}
-  
-  tags = {{
-    Name = "${{var.project_name}}-db-sg"
-  }}
-}}'''
-    
-    def _generate_terraform_waf(self, project_name: str) -> str:
-        return f'''# WAF v2 Configuration
-resource "aws_wafv2_web_acl" "main" {{
-  name  = "${{var.project_name}}-waf"
-  scope = "REGIONAL"
-  
-  default_action {{
-    allow {{}}
-  }}
-  
-  # AWS Managed Rules
-  rule {{
-    name     = "AWSManagedRulesCommonRuleSet"
-    priority = 1
-    
-    override_action {{
-      none {{}}
-    }}
-    
-    statement {{
-      managed_rule_group_statement {{
-        name        = "AWSManagedRulesCommonRuleSet"
-        vendor_name = "AWS"
-      }}
-    }}
-    
-    visibility_config {{
-      cloudwatch_metrics_enabled = true
-      metric_name                 = "CommonRuleSetMetric"
-      sampled_requests_enabled    = true
-    }}
-  }}
-  
-  rule {{
-    name     = "AWSManagedRulesKnownBadInputsRuleSet"
-    priority = 2
-    
-    override_action {{
-      none {{}}
-    }}
-    
-    statement {{
-      managed_rule_group_statement {{
-        name        = "AWSManagedRulesKnownBadInputsRuleSet"
-        vendor_name = "AWS"
-      }}
-    }}
-    
-    visibility_config {{
-      cloudwatch_metrics_enabled = true
-      metric_name                 = "KnownBadInputsRuleSetMetric"
-      sampled_requests_enabled    = true
-    }}
-  }}
-  
-  tags = {{
-    Name = "${{var.project_name}}-waf"
-  }}
-  
-  visibility_config {{
-    cloudwatch_metrics_enabled = true
-    metric_name                 = "${{var.project_name}}-waf"
-    sampled_requests_enabled    = true
-  }}
-}}'''
-    
-    def _generate_terraform_alb(self, project_name: str, security_level: str) -> str:
-        return f'''# Application Load Balancer
-resource "aws_lb" "main" {{
-  name               = "${{var.project_name}}-alb-${{random_id.suffix.hex}}"
+_TERRAFORM_ALB_TEMPLATE = '''# Application Load Balancer
+resource "aws_lb" "main" {
+  name               = "${var.project_name}-alb-${random_id.suffix.hex}"
   internal           = false
   load_balancer_type = "application"
   security_groups    = [aws_security_group.alb.id]
@@ -504,20 +213,20 @@ resource "aws_lb" "main" {{
   
   enable_deletion_protection = var.enable_deletion_protection
   
-  {"associate_web_acl_arn = aws_wafv2_web_acl.main.arn" if security_level == "high" else ""}
+  %(web_acl_association)s
   
-  tags = {{
-    Name = "${{var.project_name}}-alb"
-  }}
-}}
+  tags = {
+    Name = "${var.project_name}-alb"
+  }
+}
 
-resource "aws_lb_target_group" "app" {{
-  name     = "${{var.project_name}}-tg-${{random_id.suffix.hex}}"
+resource "aws_lb_target_group" "app" {
+  name     = "${var.project_name}-tg-${random_id.suffix.hex}"
   port     = 8080
   protocol = "HTTP"
   vpc_id   = data.aws_vpc.main.id
   
-  health_check {{
+  health_check {
     enabled             = true
     healthy_threshold   = 2
     interval            = 30
@@ -527,417 +236,137 @@ resource "aws_lb_target_group" "app" {{
     protocol            = "HTTP"
     timeout             = 5
     unhealthy_threshold = 2
-  }}
+  }
   
-  tags = {{
-    Name = "${{var.project_name}}-tg"
-  }}
-}}
+  tags = {
+    Name = "${var.project_name}-tg"
+  }
+}
 
-resource "aws_lb_listener" "app" {{
+resource "aws_lb_listener" "app" {
   load_balancer_arn = aws_lb.main.arn
   port              = "80"
   protocol          = "HTTP"
   
-  default_action {{
+  default_action {
     type             = "forward"
     target_group_arn = aws_lb_target_group.app.arn
-  }}
-}}'''
-    
-    def _generate_terraform_ec2(self, project_name: str, services: Dict[str, str], security_level: str) -> str:
-        return f'''# Launch Template
-resource "aws_launch_template" "app" {{
-  name_prefix   = "${{var.project_name}}-"
-  image_id      = data.aws_ami.amazon_linux.id
-  instance_type = "t3.micro"
-  
-  vpc_security_group_ids = [aws_security_group.app_tier.id]
-  
-  {"key_name = aws_key_pair.main.key_name" if security_level in ["medium", "high"] else ""}
-  
-  iam_instance_profile {{
-    name = aws_iam_instance_profile.app.name
-  }}
+  }
+}'''
+
+_TERRAFORM_LAMBDA_TEMPLATE = '''# Lambda Functions for API Backend
+resource "aws_lambda_function" "api" {
+  filename         = "lambda_function.zip"
+  function_name    = "${var.project_name}-api-${random_id.suffix.hex}"
+  role            = aws_iam_role.lambda.arn
+  handler         = "index.handler"
+  runtime         = "python3.9"
+  timeout         = 30
   
-  block_device_mappings {{
-    device_name = "/dev/xvda"
-    ebs {{
-      volume_size = 20
-      volume_type = "gp3"
-      encrypted   = true
-      {"kms_key_id = aws_kms_key.main.arn" if security_level == "high" else ""}
-      delete_on_termination = true
-    }}
-  }}
+  %(kms_key_arn)s
   
-  metadata_options {{
-    http_endpoint = "enabled"
-    http_tokens   = "required"
-    http_put_response_hop_limit = 1
-  }}
+  environment {
+    variables = {
+      ENVIRONMENT = var.environment
+    }
+  }
   
-  tag_specifications {{
-    resource_type = "instance"
-    tags = {{
-      Name = "${{var.project_name}}-instance"
-    }}
-  }}
+  vpc_config {
+    subnet_ids         = local.private_subnet_ids
+    security_group_ids = [aws_security_group.lambda.id]
+  }
   
-  user_data = base64encode(<<-EOF
-#!/bin/bash
-yum update -y
-yum install -y amazon-cloudwatch-agent
-echo "Project: ${{var.project_name}}" > /home/ec2-user/project_info.txt
-EOF
-  )
-}}
+  tags = {
+    Name = "${var.project_name}-lambda"
+  }
+}
 
-# Auto Scaling Group
-resource "aws_autoscaling_group" "app" {{
-  name                = "${{var.project_name}}-asg-${{random_id.suffix.hex}}"
-  vpc_zone_identifier = local.private_subnet_ids
-  target_group_arns   = [aws_lb_target_group.app.arn]
-  health_check_type   = "ELB"
-  health_check_grace_period = 300
-  
-  min_size         = 1
-  max_size         = {3 if security_level == "high" else 2}
-  desired_capacity = {2 if security_level == "high" else 1}
-  
-  launch_template {{
-    id      = aws_launch_template.app.id
-    version = "$Latest"
-  }}
+# API Gateway
+resource "aws_api_gateway_rest_api" "main" {
+  name        = "${var.project_name}-api"
+  description = "API Gateway for %(project_name)s"
   
-  tag {{
-    key                 = "Name"
-    value               = "${{var.project_name}}-asg"
-    propagate_at_launch = false
-  }}
-}}
+  endpoint_configuration {
+    types = ["REGIONAL"]
+  }
+}
 
-# IAM Role for EC2 instances
-resource "aws_iam_role" "app" {{
-  name = "${{var.project_name}}-app-role-${{random_id.suffix.hex}}"
-  
-  assume_role_policy = jsonencode({{
-    Version = "2012-10-17"
-    Statement = [
-      {{
-        Action = "sts:AssumeRole"
-        Effect = "Allow"
-        Principal = {{
-          Service = "ec2.amazonaws.com"
-        }}
-      }}
-    ]
-  }})
-}}
+resource "aws_api_gateway_resource" "proxy" {
+  rest_api_id = aws_api_gateway_rest_api.main.id
+  parent_id   = aws_api_gateway_rest_api.main.root_resource_id
+  path_part   = "{proxy+}"
+}
 
-resource "aws_iam_instance_profile" "app" {{
-  name = "${{var.project_name}}-app-profile-${{random_id.suffix.hex}}"
-  role = aws_iam_role.app.name
-}}
+resource "aws_api_gateway_method" "proxy" {
+  rest_api_id   = aws_api_gateway_rest_api.main.id
+  resource_id   = aws_api_gateway_resource.proxy.id
+  http_method   = "ANY"
+  authorization = "NONE"
+}
 
-resource "aws_iam_role_policy" "app" {{
-  name = "${{var.project_name}}-app-policy-${{random_id.suffix.hex}}"
-  role = aws_iam_role.app.id
-  
-  policy = jsonencode({{
-    Version = "2012-10-17"
-    Statement = [
-      {{
-        Effect = "Allow"
-        Action = [
-          "s3:GetObject",
-          "s3:PutObject",
-          "s3:DeleteObject"
-        ]
-        Resource = "${{aws_s3_bucket.main.arn}}/*"
-      }}
-    ]
-  }})
-}}
-
-# AMI Data Source
-data "aws_ami" "amazon_linux" {{
-  most_recent = true
-  owners      = ["amazon"]
-  
-  filter {{
-    name   = "name"
-    values = ["amzn2-ami-hvm-*-x86_64-gp2"]
-  }}
-}}'''
-
-        ec2_config = f'''# Launch Template
-resource "aws_launch_template" "app" {{
-  name_prefix   = "${{var.project_name}}-"
-  image_id      = data.aws_ami.amazon_linux.id
-  instance_type = "t3.micro"
-  
-  vpc_security_group_ids = [aws_security_group.app_tier.id]
-  
-  {"key_name = aws_key_pair.main.key_name" if security_level in ["medium", "high"] else ""}
-  
-  iam_instance_profile {{
-    name = aws_iam_instance_profile.app.name
-  }}
-  
-  block_device_mappings {{
-    device_name = "/dev/xvda"
-    ebs {{
-      volume_size = 20
-      volume_type = "gp3"
-      encrypted   = true
-      {"kms_key_id = aws_kms_key.main.arn" if security_level == "high" else ""}
-      delete_on_termination = true
-    }}
-  }}
-  
-  metadata_options {{
-    http_endpoint = "enabled"
-    http_tokens   = "required"
-    http_put_response_hop_limit = 1
-  }}
-  
-  tag_specifications {{
-    resource_type = "instance"
-    tags = {{
-      Name = "${{var.project_name}}-instance"
-    }}
-  }}
-  
-  user_data = base64encode(<<-EOF
-#!/bin/bash
-yum update -y
-yum install -y amazon-cloudwatch-agent
-echo "Project: ${{var.project_name}}" > /home/ec2-user/project_info.txt
-EOF
-  )
-}}
-
-# Auto Scaling Group
-resource "aws_autoscaling_group" "app" {{
-  name                = "${{var.project_name}}-asg-${{random_id.suffix.hex}}"
-  vpc_zone_identifier = local.private_subnet_ids
-  target_group_arns   = [aws_lb_target_group.app.arn]
-  health_check_type   = "ELB"
-  health_check_grace_period = 300
-  
-  min_size         = 1
-  max_size         = {3 if security_level == "high" else 2}
-  desired_capacity = {2 if security_level == "high" else 1}
-  
-  launch_template {{
-    id      = aws_launch_template.app.id
-    version = "$Latest"
-  }}
-  
-  tag {{
-    key                 = "Name"
-    value               = "${{var.project_name}}-asg"
-    propagate_at_launch = false
-  }}
-}}
-
-# IAM Role for EC2 instances
-resource "aws_iam_role" "app" {{
-  name = "${{var.project_name}}-app-role-${{random_id.suffix.hex}}"
-  
-  assume_role_policy = jsonencode({{
-    Version = "2012-10-17"
-    Statement = [
-      {{
-        Action = "sts:AssumeRole"
-        Effect = "Allow"
-        Principal = {{
-          Service = "ec2.amazonaws.com"
-        }}
-      }}
-    ]
-  }})
-}}
-
-resource "aws_iam_instance_profile" "app" {{
-  name = "${{var.project_name}}-app-profile-${{random_id.suffix.hex}}"
-  role = aws_iam_role.app.name
-}}
-
-resource "aws_iam_role_policy" "app" {{
-  name = "${{var.project_name}}-app-policy-${{random_id.suffix.hex}}"
-  role = aws_iam_role.app.id
-  
-  policy = jsonencode({{
-    Version = "2012-10-17"
-    Statement = [
-      {{
-        Effect = "Allow"
-        Action = [
-          "s3:GetObject",
-          "s3:PutObject",
-          "s3:DeleteObject"
-        ]
-        Resource = "${{aws_s3_bucket.main.arn}}/*"
-      }}
-    ]
-  }})
-}}
-
-# AMI Data Source
-data "aws_ami" "amazon_linux" {{
-  most_recent = true
-  owners      = ["amazon"]
-  
-  filter {{
-    name   = "name"
-    values = ["amzn2-ami-hvm-*-x86_64-gp2"]
-  }}
-}}'''
-
-        if security_level in ["medium", "high"]:
-            ec2_config += '''
-
-# Key Pair for SSH access (if needed)
-resource "aws_key_pair" "main" {
-  key_name   = "${var.project_name}-key-${random_id.suffix.hex}"
-  public_key = file("${path.module}/public_key.pub")
-}'''
-        
-        return ec2_config
-    
-    def _generate_terraform_lambda(self, project_name: str, security_level: str) -> str:
-        return f'''# Lambda Functions for API Backend
-resource "aws_lambda_function" "api" {{
-  filename         = "lambda_function.zip"
-  function_name    = "${{var.project_name}}-api-${{random_id.suffix.hex}}"
-  role            = aws_iam_role.lambda.arn
-  handler         = "index.handler"
-  runtime         = "python3.9"
-  timeout         = 30
-  
-  {"kms_key_arn = aws_kms_key.main.arn" if security_level == "high" else ""}
-  
-  environment {{
-    variables = {{
-      ENVIRONMENT = var.environment
-    }}
-  }}
-  
-  vpc_config {{
-    subnet_ids         = local.private_subnet_ids
-    security_group_ids = [aws_security_group.lambda.id]
-  }}
-  
-  tags = {{
-    Name = "${{var.project_name}}-lambda"
-  }}
-}}
-
-# API Gateway
-resource "aws_api_gateway_rest_api" "main" {{
-  name        = "${{var.project_name}}-api"
-  description = "API Gateway for {project_name}"
-  
-  endpoint_configuration {{
-    types = ["REGIONAL"]
-  }}
-}}
-
-resource "aws_api_gateway_resource" "proxy" {{
-  rest_api_id = aws_api_gateway_rest_api.main.id
-  parent_id   = aws_api_gateway_rest_api.main.root_resource_id
-  path_part   = "{{proxy+}}"
-}}
-
-resource "aws_api_gateway_method" "proxy" {{
-  rest_api_id   = aws_api_gateway_rest_api.main.id
-  resource_id   = aws_api_gateway_resource.proxy.id
-  http_method   = "ANY"
-  authorization = "NONE"
-}}
-
-resource "aws_api_gateway_integration" "lambda" {{
-  rest_api_id = aws_api_gateway_rest_api.main.id
-  resource_id = aws_api_gateway_method.proxy.resource_id
-  http_method = aws_api_gateway_method.proxy.http_method
+resource "aws_api_gateway_integration" "lambda" {
+  rest_api_id = aws_api_gateway_rest_api.main.id
+  resource_id = aws_api_gateway_method.proxy.resource_id
+  http_method = aws_api_gateway_method.proxy.http_method
   
   integration_http_method = "POST"
   type                    = "AWS_PROXY"
   uri                     = aws_lambda_function.api.invoke_arn
-}}
+}
 
-resource "aws_api_gateway_deployment" "main" {{
+resource "aws_api_gateway_deployment" "main" {
   depends_on = [
     aws_api_gateway_integration.lambda,
   ]
   
   rest_api_id = aws_api_gateway_rest_api.main.id
   stage_name  = var.environment
-}}
+}
 
 # Lambda IAM Role
-resource "aws_iam_role" "lambda" {{
-  name = "${{var.project_name}}-lambda-role"
+resource "aws_iam_role" "lambda" {
+  name = "${var.project_name}-lambda-role"
   
-  assume_role_policy = jsonencode({{
-    Version = "2012-10-17"
-    Statement = [
-      {{
-        Action = "sts:AssumeRole"
-        Effect = "Allow"
-        Principal = {{
-          Service = "lambda.amazonaws.com"
-        }}
-      }}
-    ]
-  }})
-}}
+  assume_role_policy = %(assume_role_policy)s
+}
 
-resource "aws_iam_role_policy_attachment" "lambda_basic" {{
+resource "aws_iam_role_policy_attachment" "lambda_basic" {
   role       = aws_iam_role.lambda.name
   policy_arn = "arn:aws:iam::aws:policy/service-role/AWSLambdaVPCAccessExecutionRole"
-}}
+}
 
 # Lambda Security Group
-resource "aws_security_group" "lambda" {{
-  name_prefix = "${{var.project_name}}-lambda-"
+resource "aws_security_group" "lambda" {
+  name_prefix = "${var.project_name}-lambda-"
   vpc_id      = data.aws_vpc.main.id
   description = "Security group for Lambda functions"
   
-  egress {{
+  egress {
     from_port   = 0
     to_port     = 0
     protocol    = "-1"
     cidr_blocks = ["0.0.0.0/0"]
-  }}
+  }
   
-  tags = {{
-    Name = "${{var.project_name}}-lambda-sg"
-  }}
-}}'''
-    
-    def _generate_terraform_ecs(self, project_name: str, security_level: str) -> str:
-        container_insights = '''setting {
-    name  = "containerInsights"
-    value = "enabled"
-  }''' if security_level in ["medium", "high"] else ""
-        
-        return f'''# ECS Cluster
-resource "aws_ecs_cluster" "main" {{
-  name = "${{var.project_name}}-cluster-${{random_id.suffix.hex}}"
+  tags = {
+    Name = "${var.project_name}-lambda-sg"
+  }
+}'''
+
+_TERRAFORM_ECS_TEMPLATE = '''# ECS Cluster
+resource "aws_ecs_cluster" "main" {
+  name = "${var.project_name}-cluster-${random_id.suffix.hex}"
   
-  {container_insights}
+  %(container_insights)s
   
-  tags = {{
-    Name = "${{var.project_name}}-cluster"
-  }}
-}}
+  tags = {
+    Name = "${var.project_name}-cluster"
+  }
+}
 
 # ECS Task Definition
-resource "aws_ecs_task_definition" "app" {{
-  family                   = "${{var.project_name}}-app"
+resource "aws_ecs_task_definition" "app" {
+  family                   = "${var.project_name}-app"
   network_mode             = "awsvpc"
   requires_compatibilities = ["FARGATE"]
   cpu                      = 256
@@ -946,463 +375,448 @@ resource "aws_ecs_task_definition" "app" {{
   task_role_arn           = aws_iam_role.ecs_task.arn
   
   container_definitions = jsonencode([
-    {{
-      name  = "${{var.project_name}}-container"
+    {
+      name  = "${var.project_name}-container"
       image = "nginx:latest"
       
       portMappings = [
-        {{
+        {
           containerPort = 80
           protocol      = "tcp"
-        }}
+        }
       ]
       
-      logConfiguration = {{
+      logConfiguration = {
         logDriver = "awslogs"
-        options = {{
+        options = {
           "awslogs-group"         = aws_cloudwatch_log_group.app.name
           "awslogs-region"        = data.aws_region.current.name
           "awslogs-stream-prefix" = "ecs"
-        }}
-      }}
+        }
+      }
       
       environment = [
-        {{
+        {
           name  = "ENVIRONMENT"
           value = var.environment
-        }}
+        }
       ]
-    }}
+    }
   ])
   
-  tags = {{
-    Name = "${{var.project_name}}-task"
-  }}
-}}
+  tags = {
+    Name = "${var.project_name}-task"
+  }
+}
 
 # ECS Service
-resource "aws_ecs_service" "app" {{
-  name            = "${{var.project_name}}-service"
+resource "aws_ecs_service" "app" {
+  name            = "${var.project_name}-service"
   cluster         = aws_ecs_cluster.main.id
   task_definition = aws_ecs_task_definition.app.arn
-  desired_count   = {2 if security_level == "high" else 1}
+  desired_count   = %(desired_count)d
   launch_type     = "FARGATE"
   
-  network_configuration {{
+  network_configuration {
     subnets          = local.private_subnet_ids
     security_groups  = [aws_security_group.ecs.id]
     assign_public_ip = false
-  }}
+  }
   
-  load_balancer {{
+  load_balancer {
     target_group_arn = aws_lb_target_group.app.arn
-    container_name   = "${{var.project_name}}-container"
+    container_name   = "${var.project_name}-container"
     container_port   = 80
-  }}
+  }
   
   depends_on = [aws_lb_listener.app]
   
-  tags = {{
-    Name = "${{var.project_name}}-service"
-  }}
-}}
+  tags = {
+    Name = "${var.project_name}-service"
+  }
+}
 
 # ECS IAM Roles
-resource "aws_iam_role" "ecs_execution" {{
-  name = "${{var.project_name}}-ecs-execution-role"
+resource "aws_iam_role" "ecs_execution" {
+  name = "${var.project_name}-ecs-execution-role"
   
-  assume_role_policy = jsonencode({{
-    Version = "2012-10-17"
-    Statement = [
-      {{
-        Action = "sts:AssumeRole"
-        Effect = "Allow"
-        Principal = {{
-          Service = "ecs-tasks.amazonaws.com"
-        }}
-      }}
-    ]
-  }})
-}}
+  assume_role_policy = %(assume_role_policy)s
+}
 
-resource "aws_iam_role_policy_attachment" "ecs_execution" {{
+resource "aws_iam_role_policy_attachment" "ecs_execution" {
   role       = aws_iam_role.ecs_execution.name
   policy_arn = "arn:aws:iam::aws:policy/service-role/AmazonECSTaskExecutionRolePolicy"
-}}
+}
 
-resource "aws_iam_role" "ecs_task" {{
-  name = "${{var.project_name}}-ecs-task-role"
+resource "aws_iam_role" "ecs_task" {
+  name = "${var.project_name}-ecs-task-role"
   
-  assume_role_policy = jsonencode({{
-    Version = "2012-10-17"
-    Statement = [
-      {{
-        Action = "sts:AssumeRole"
-        Effect = "Allow"
-        Principal = {{
-          Service = "ecs-tasks.amazonaws.com"
-        }}
-      }}
-    ]
-  }})
-}}
+  assume_role_policy = %(assume_role_policy)s
+}
 
 # ECS Security Group
-resource "aws_security_group" "ecs" {{
-  name_prefix = "${{var.project_name}}-ecs-"
+resource "aws_security_group" "ecs" {
+  name_prefix = "${var.project_name}-ecs-"
   vpc_id      = data.aws_vpc.main.id
   description = "Security group for ECS tasks"
   
-  ingress {{
+  ingress {
     from_port       = 80
     to_port         = 80
     protocol        = "tcp"
     security_groups = [aws_security_group.alb.id]
-  }}
+  }
   
-  egress {{
+  egress {
     from_port   = 0
     to_port     = 0
     protocol    = "-1"
     cidr_blocks = ["0.0.0.0/0"]
-  }}
-  
-  tags = {{
-    Name = "${{var.project_name}}-ecs-sg"
-  }}
-}}'''
-    
-    def _generate_terraform_database(self, project_name: str, services: Dict[str, str], security_level: str) -> str:
-        db_service = services.get('database', 'none')
-        
-        # Generate appropriate database based on user selection
-        if 'dynamodb' in db_service.lower():
-            return self._generate_terraform_dynamodb(project_name, security_level)
-        elif 'postgres' in db_service.lower() or 'rds' in db_service.lower() or 'sql' in db_service.lower():
-            db_engine = 'postgres' if 'postgres' in db_service.lower() else 'mysql'
-            return self._generate_terraform_rds(project_name, db_engine, security_level)
-        elif 'mysql' in db_service.lower():
-            return self._generate_terraform_rds(project_name, 'mysql', security_level)
-        else:
-            # No database selected
-            return "# No database service selected"
-    
-    def _generate_terraform_rds(self, project_name: str, db_engine: str, security_level: str) -> str:
-            
-        # Always use multi-AZ since AWS requires minimum 2 AZs for RDS subnet groups
-        multi_az = True
-        
-        cloudwatch_logs = '''enabled_cloudwatch_logs_exports = ["error", "general", "slow-query"]''' if security_level in ["medium", "high"] else ""
-        
-        return f'''# RDS Database
-resource "aws_db_subnet_group" "main" {{
-  name       = "${{var.project_name}}-db-subnet-group-${{random_id.suffix.hex}}"
-  subnet_ids = local.private_subnet_ids
+  }
   
-  tags = {{
-    Name = "${{var.project_name}}-db-subnet-group"
-  }}
-}}
+  tags = {
+    Name = "${var.project_name}-ecs-sg"
+  }
+}'''
 
-resource "aws_db_instance" "main" {{
-  identifier = "${{var.project_name}}-database-${{random_id.suffix.hex}}"
-  
-  engine         = "{db_engine.lower()}"
-  engine_version = "{self._get_db_version(db_engine)}"
-  instance_class = "db.t3.micro"
-  
-  allocated_storage     = 20
-  max_allocated_storage = 100
-  storage_type          = "gp2"
-  storage_encrypted     = true
-  {"kms_key_id = aws_kms_key.main.arn" if security_level == "high" else ""}
+_TERRAFORM_VPC_TEMPLATE = '''# Use Default VPC and its existing resources
+data "aws_vpc" "main" {
+  default = true
+}
+
+# Get default subnets (already exist in default VPC)
+data "aws_subnets" "default" {
+  filter {
+    name   = "vpc-id"
+    values = [data.aws_vpc.main.id]
+  }
+}
+
+data "aws_subnet" "default" {
+  count = length(data.aws_subnets.default.ids)
+  id    = data.aws_subnets.default.ids[count.index]
+}
+
+# Get existing internet gateway for default VPC
+data "aws_internet_gateway" "default" {
+  filter {
+    name   = "attachment.vpc-id"
+    values = [data.aws_vpc.main.id]
+  }
+}
+
+# Get existing route table for default VPC
+data "aws_route_table" "default" {
+  vpc_id = data.aws_vpc.main.id
+  filter {
+    name   = "association.main"
+    values = ["true"]
+  }
+}
+
+# Use default subnets for both public and private
+locals {
+  # Use existing default subnets (they're all public by default)
+  public_subnet_ids = data.aws_subnets.default.ids
+  private_subnet_ids = data.aws_subnets.default.ids  # Same as public for simplicity
+}'''
+
+_TERRAFORM_EC2_TEMPLATE = '''# Launch Template
+resource "aws_launch_template" "app" {
+  name_prefix   = "${var.project_name}-"
+  image_id      = data.aws_ami.amazon_linux.id
+  instance_type = "t3.micro"
   
-  db_name  = "${{replace(var.project_name, \"-\", \"\")}}"
-  username = "admin"
-  manage_master_user_password = true
-  {"master_user_secret_kms_key_id = aws_kms_key.main.arn" if security_level == "high" else ""}
+  vpc_security_group_ids = [aws_security_group.app_tier.id]
   
-  vpc_security_group_ids = [aws_security_group.db_tier.id]
-  db_subnet_group_name   = aws_db_subnet_group.main.name
   
-  backup_retention_period = {7 if security_level in ["medium", "high"] else 1}
-  backup_window          = "03:00-04:00"
-  maintenance_window     = "sun:04:00-sun:05:00"
   
-  multi_az               = {str(multi_az).lower()}
-  publicly_accessible    = false
+  iam_instance_profile {
+    name = aws_iam_instance_profile.app.name
+  }
   
-  skip_final_snapshot = false
-  final_snapshot_identifier = "${{var.project_name}}-final-snapshot-${{formatdate("YYYY-MM-DD-hhmm", timestamp())}}"
+  block_device_mappings {
+    device_name = "/dev/xvda"
+    ebs {
+      volume_size = 20
+      volume_type = "gp3"
+      encrypted   = true
+      %(kms_key_id)s
+      delete_on_termination = true
+    }
+  }
   
-  deletion_protection = var.enable_deletion_protection
+  metadata_options {
+    http_endpoint = "enabled"
+    http_tokens   = "required"
+    http_put_response_hop_limit = 1
+  }
   
-  {cloudwatch_logs}
+  tag_specifications {
+    resource_type = "instance"
+    tags = {
+      Name = "${var.project_name}-instance"
+    }
+  }
   
-  tags = {{
-    Name = "${{var.project_name}}-database"
-  }}
-}}'''
-
-    def _generate_terraform_dynamodb(self, project_name: str, security_level: str) -> str:
-        """Generate DynamoDB table configuration"""
-        
-        # Enhanced features for higher security levels
-        point_in_time_recovery = "true" if security_level in ["medium", "high"] else "false"
-        deletion_protection = "true" if security_level == "high" else "false"
-        encryption_type = "CUSTOMER_MANAGED" if security_level == "high" else "DEFAULT"
-        
-        return f'''# DynamoDB Table
-resource "aws_dynamodb_table" "main" {{
-  name             = "${{var.project_name}}-table-${{random_id.suffix.hex}}"
-  billing_mode     = "PAY_PER_REQUEST"
-  hash_key         = "id"
-  deletion_protection_enabled = {deletion_protection}
-  
-  attribute {{
-    name = "id"
-    type = "S"
-  }}
-  
-  # Enable encryption
-  server_side_encryption {{
-    enabled     = true
-    kms_key_arn = {'"${{aws_kms_key.main.arn}}"' if security_level == "high" else 'null'}
-  }}
-  
-  # Enable point-in-time recovery
-  point_in_time_recovery {{
-    enabled = {point_in_time_recovery}
-  }}
-  
-  # Enable DynamoDB Streams for change capture
-  stream_enabled   = true
-  stream_view_type = "NEW_AND_OLD_IMAGES"
-  
-  tags = {{
-    Name = "${{var.project_name}}-dynamodb-table"
-  }}
-}}
+  user_data = base64encode(<<-EOF
+#!/bin/bash
+yum update -y
+yum install -y amazon-cloudwatch-agent
+echo "Project: ${var.project_name}" > /home/ec2-user/project_info.txt
+EOF
+  )
+}
 
-# DynamoDB Global Secondary Index (optional)
-resource "aws_dynamodb_table" "gsi_table" {{
-  count            = {1 if security_level in ["medium", "high"] else 0}
-  name             = "${{var.project_name}}-gsi-table-${{random_id.suffix.hex}}"
-  billing_mode     = "PAY_PER_REQUEST"
-  hash_key         = "gsi_id"
+# Auto Scaling Group
+resource "aws_autoscaling_group" "app" {
+  name                = "${var.project_name}-asg-${random_id.suffix.hex}"
+  vpc_zone_identifier = local.private_subnet_ids
+  target_group_arns   = [aws_lb_target_group.app.arn]
+  health_check_type   = "ELB"
+  health_check_grace_period = 300
   
-  attribute {{
-    name = "gsi_id"
-    type = "S"
-  }}
+  min_size         = 1
+  max_size         = %(max_size)d
+  desired_capacity = %(desired_capacity)d
   
-  attribute {{
-    name = "sort_key"
-    type = "S"
-  }}
+  launch_template {
+    id      = aws_launch_template.app.id
+    version = "$Latest"
+  }
   
-  global_secondary_index {{
-    name     = "GSI1"
-    hash_key = "gsi_id"
-    range_key = "sort_key"
-    projection_type = "ALL"
-  }}
+  tag {
+    key                 = "Name"
+    value               = "${var.project_name}-asg"
+    propagate_at_launch = false
+  }
+}
+
+# IAM Role for EC2 instances
+resource "aws_iam_role" "app" {
+  name = "${var.project_name}-app-role-${random_id.suffix.hex}"
   
-  server_side_encryption {{
-    enabled     = true
-    kms_key_arn = {'"${{aws_kms_key.main.arn}}"' if security_level == "high" else 'null'}
-  }}
+  assume_role_policy = %(assume_role_policy)s
+}
+
+resource "aws_iam_instance_profile" "app" {
+  name = "${var.project_name}-app-profile-${random_id.suffix.hex}"
+  role = aws_iam_role.app.name
+}
+
+resource "aws_iam_role_policy" "app" {
+  name = "${var.project_name}-app-policy-${random_id.suffix.hex}"
+  role = aws_iam_role.app.id
   
-  point_in_time_recovery {{
-    enabled = {point_in_time_recovery}
-  }}
+  policy = jsonencode({
+    Version = "2012-10-17"
+    Statement = [
+      {
+        Effect = "Allow"
+        Action = [
+          "s3:GetObject",
+          "s3:PutObject",
+          "s3:DeleteObject"
+        ]
+        Resource = "${aws_s3_bucket.main.arn}/*"
+      }
+    ]
+  })
+}
+
+# AMI Data Source
+data "aws_ami" "amazon_linux" {
+  most_recent = true
+  owners      = ["amazon"]
   
-  tags = {{
-    Name = "${{var.project_name}}-dynamodb-gsi-table"
-  }}
-}}'''
-    
-    def _generate_terraform_s3(self, project_name: str, security_level: str) -> str:
-        logging_config = '''resource "aws_s3_bucket_logging" "main" {
-  bucket = aws_s3_bucket.main.id
-  target_bucket = aws_s3_bucket.logs.id
-  target_prefix = "access-logs/"
-}''' if security_level in ["medium", "high"] else ""
-        
-        return f'''# S3 Bucket
-resource "aws_s3_bucket" "main" {{
-  bucket = "${{var.project_name}}-storage-${{random_id.bucket_suffix.hex}}"
+  filter {
+    name   = "name"
+    values = ["amzn2-ami-hvm-*-x86_64-gp2"]
+  }
+}'''
+
+_TERRAFORM_S3_TEMPLATE = '''# S3 Bucket
+resource "aws_s3_bucket" "main" {
+  bucket = "${var.project_name}-storage-${random_id.bucket_suffix.hex}"
   
-  tags = {{
-    Name = "${{var.project_name}}-storage"
-  }}
-}}
+  tags = {
+    Name = "${var.project_name}-storage"
+  }
+}
 
-resource "random_id" "bucket_suffix" {{
+resource "random_id" "bucket_suffix" {
   byte_length = 4
-}}
+}
 
 # S3 Bucket Configuration
-resource "aws_s3_bucket_versioning" "main" {{
+resource "aws_s3_bucket_versioning" "main" {
   bucket = aws_s3_bucket.main.id
-  versioning_configuration {{
+  versioning_configuration {
     status = "Enabled"
-  }}
-}}
+  }
+}
 
-resource "aws_s3_bucket_server_side_encryption_configuration" "main" {{
+resource "aws_s3_bucket_server_side_encryption_configuration" "main" {
   bucket = aws_s3_bucket.main.id
   
-  rule {{
-    apply_server_side_encryption_by_default {{
-      {"kms_master_key_id = aws_kms_key.main.arn" if security_level == "high" else ""}
-      sse_algorithm     = "{"aws:kms" if security_level == "high" else "AES256"}"
-    }}
+  rule {
+    apply_server_side_encryption_by_default {
+      %(kms_master_key_id)s
+      sse_algorithm     = "%(sse_algorithm)s"
+    }
     bucket_key_enabled = true
-  }}
-}}
+  }
+}
 
-resource "aws_s3_bucket_public_access_block" "main" {{
+resource "aws_s3_bucket_public_access_block" "main" {
   bucket = aws_s3_bucket.main.id
   
   block_public_acls       = true
   block_public_policy     = true
   ignore_public_acls      = true
   restrict_public_buckets = true
-}}
+}
 
-resource "aws_s3_bucket_lifecycle_configuration" "main" {{
+resource "aws_s3_bucket_lifecycle_configuration" "main" {
   bucket = aws_s3_bucket.main.id
   
-  rule {{
+  rule {
     id     = "lifecycle"
     status = "Enabled"
     
-    expiration {{
+    expiration {
       days = 90
-    }}
+    }
     
-    noncurrent_version_expiration {{
+    noncurrent_version_expiration {
       noncurrent_days = 30
-    }}
-  }}
-}}
-
-{logging_config}'''
-    
-    def _generate_terraform_monitoring(self, project_name: str) -> str:
-        return f'''# CloudWatch Log Groups
-resource "aws_cloudwatch_log_group" "app" {{
-  name              = "/aws/application/${{var.project_name}}-${{random_id.suffix.hex}}"
-  retention_in_days = 30
-  
-  tags = {{
-    Name = "${{var.project_name}}-logs"
-  }}
-}}
-
-# CloudWatch Alarms
-resource "aws_cloudwatch_metric_alarm" "high_cpu" {{
-  alarm_name          = "${{var.project_name}}-high-cpu"
-  comparison_operator = "GreaterThanThreshold"
-  evaluation_periods  = "2"
-  metric_name         = "CPUUtilization"
-  namespace           = "AWS/EC2"
-  period              = "120"
-  statistic           = "Average"
-  threshold           = "80"
-  alarm_description   = "This metric monitors ec2 cpu utilization"
-  
-  dimensions = {{
-    AutoScalingGroupName = aws_autoscaling_group.app.name
-  }}
-  
-  tags = {{
-    Name = "${{var.project_name}}-cpu-alarm"
-  }}
-}}
-
-# SNS Topic for Alerts
-resource "aws_sns_topic" "alerts" {{
-  name = "${{var.project_name}}-alerts"
-  
-  tags = {{
-    Name = "${{var.project_name}}-alerts"
-  }}
-}}'''
-    
-    def _generate_terraform_logging(self, project_name: str) -> str:
-        return f'''# CloudTrail for Audit Logging
-resource "aws_cloudtrail" "main" {{
-  name                          = "${{var.project_name}}-trail-${{random_id.suffix.hex}}"
-  s3_bucket_name               = aws_s3_bucket.logs.id
-  s3_key_prefix                = "cloudtrail"
-  include_global_service_events = true
-  is_multi_region_trail        = true
-  enable_logging               = true
-  
-  event_selector {{
-    read_write_type                 = "All"
-    include_management_events       = true
-    data_resource {{
-      type   = "AWS::S3::Object"
-      values = ["${{aws_s3_bucket.main.arn}}/*"]
-    }}
-  }}
-  
-  tags = {{
-    Name = "${{var.project_name}}-trail"
-  }}
-}}
-
-# S3 Bucket for Logs
-resource "aws_s3_bucket" "logs" {{
-  bucket = "${{var.project_name}}-logs-${{random_id.logs_suffix.hex}}"
-  
-  tags = {{
-    Name = "${{var.project_name}}-logs"
-  }}
-}}
-
-resource "random_id" "logs_suffix" {{
-  byte_length = 4
-}}
+    }
+  }
+}
 
-resource "aws_s3_bucket_policy" "cloudtrail_logs" {{
-  bucket = aws_s3_bucket.logs.id
+%(logging_config)s'''
+
+_TERRAFORM_RDS_TEMPLATE = '''# RDS Database
+resource "aws_db_subnet_group" "main" {
+  name       = "${var.project_name}-db-subnet-group-${random_id.suffix.hex}"
+  subnet_ids = local.private_subnet_ids
   
-  policy = jsonencode({{
-    Version = "2012-10-17"
-    Statement = [
-      {{
-        Sid    = "AWSCloudTrailAclCheck"
-        Effect = "Allow"
-        Principal = {{
-          Service = "cloudtrail.amazonaws.com"
-        }}
-        Action   = "s3:GetBucketAcl"
-        Resource = aws_s3_bucket.logs.arn
-      }},
-      {{
-        Sid    = "AWSCloudTrailWrite"
-        Effect = "Allow"
-        Principal = {{
-          Service = "cloudtrail.amazonaws.com"
-        }}
-        Action   = "s3:PutObject"
-        Resource = "${{aws_s3_bucket.logs.arn}}/cloudtrail/*"
-        Condition = {{
-          StringEquals = {{
-            "s3:x-amz-acl" = "bucket-owner-full-control"
-          }}
-        }}
-      }}
-    ]
-  }})
-}}'''
-    
-    def _generate_terraform_outputs(self) -> str:
-        return '''# Outputs
+  tags = {
+    Name = "${var.project_name}-db-subnet-group"
+  }
+}
+
+resource "aws_db_instance" "main" {
+  identifier = "${var.project_name}-database-${random_id.suffix.hex}"
+  
+  engine         = "%(engine)s"
+  engine_version = "%(engine_version)s"
+  instance_class = "db.t3.micro"
+  
+  allocated_storage     = 20
+  max_allocated_storage = 100
+  storage_type          = "gp2"
+  storage_encrypted     = true
+  %(kms_key_id)s
+  
+  db_name  = "${replace(var.project_name, "-", "")}"
+  username = "admin"
+  manage_master_user_password = true
+  %(master_user_secret_kms_key_id)s
+  
+  vpc_security_group_ids = [aws_security_group.db_tier.id]
+  db_subnet_group_name   = aws_db_subnet_group.main.name
+  
+  backup_retention_period = %(backup_retention_period)d
+  backup_window          = "03:00-04:00"
+  maintenance_window     = "sun:04:00-sun:05:00"
+  
+  multi_az               = %(multi_az)s
+  publicly_accessible    = false
+  
+  skip_final_snapshot = false
+  final_snapshot_identifier = "${var.project_name}-final-snapshot-${random_id.suffix.hex}"
+  
+  deletion_protection = var.enable_deletion_protection
+  
+  %(cloudwatch_logs)s
+  
+  tags = {
+    Name = "${var.project_name}-database"
+  }
+}'''
+
+_TERRAFORM_DYNAMODB_TEMPLATE = '''# DynamoDB Table
+resource "aws_dynamodb_table" "main" {
+  name             = "${var.project_name}-table-${random_id.suffix.hex}"
+  billing_mode     = "PAY_PER_REQUEST"
+  hash_key         = "id"
+  deletion_protection_enabled = %(deletion_protection)s
+  
+  attribute {
+    name = "id"
+    type = "S"
+  }
+  
+  # Enable encryption
+  server_side_encryption {
+    enabled     = true
+    kms_key_arn = %(kms_key_arn)s
+  }
+  
+  # Enable point-in-time recovery
+  point_in_time_recovery {
+    enabled = %(point_in_time_recovery)s
+  }
+  
+  # Enable DynamoDB Streams for change capture
+  stream_enabled   = true
+  stream_view_type = "NEW_AND_OLD_IMAGES"
+  
+  tags = {
+    Name = "${var.project_name}-dynamodb-table"
+  }
+}
+
+# DynamoDB Global Secondary Index (optional)
+resource "aws_dynamodb_table" "gsi_table" {
+  count            = %(gsi_count)d
+  name             = "${var.project_name}-gsi-table-${random_id.suffix.hex}"
+  billing_mode     = "PAY_PER_REQUEST"
+  hash_key         = "gsi_id"
+  
+  attribute {
+    name = "gsi_id"
+    type = "S"
+  }
+  
+  attribute {
+    name = "sort_key"
+    type = "S"
+  }
+  
+  global_secondary_index {
+    name     = "GSI1"
+    hash_key = "gsi_id"
+    range_key = "sort_key"
+    projection_type = "ALL"
+  }
+  
+  server_side_encryption {
+    enabled     = true
+    kms_key_arn = %(kms_key_arn)s
+  }
+  
+  point_in_time_recovery {
+    enabled = %(point_in_time_recovery)s
+  }
+  
+  tags = {
+    Name = "${var.project_name}-dynamodb-gsi-table"
+  }
+}'''
+
+_TERRAFORM_OUTPUTS = '''# Outputs
 output "vpc_id" {
   description = "ID of the VPC"
   value       = data.aws_vpc.main.id
@@ -1425,92 +839,10 @@ output "database_endpoint" {
 }
 
 '''
-    
-    def _get_db_version(self, engine: str) -> str:
-        """Get appropriate database version"""
-        versions = {
-            "mysql": "8.0",
-            "postgres": "14.9",
-            "aurora-mysql": "8.0.mysql_aurora.3.02.0",
-            "aurora-postgresql": "14.9"
-        }
-        return versions.get(engine.lower(), "8.0")
 
-    def generate_cloudformation_template(self, questionnaire: QuestionnaireRequest, services: Dict[str, str]) -> str:
-        """Generate a security-hardened, project-specific CloudFormation template"""
-        project_name_clean = questionnaire.project_name.lower().replace(' ', '-').replace('_', '-')
-        security_level = self._determine_security_level(questionnaire)
-        arch_type = self._determine_architecture_type(questionnaire)
-        security_features = self.security_levels[security_level]
-        
-        # Build template sections
-        template_sections = []
-        
-        # Header and metadata
-        template_sections.append(self._generate_cf_header(questionnaire.project_name))
-        
-        # Parameters
-        template_sections.append(self._generate_cf_parameters(security_level))
-        
-        # Mappings
-        template_sections.append(self._generate_cf_mappings())
-        
-        # Resources start
-        template_sections.append("Resources:")
-        
-        # Security components
-        if "encryption" in security_features:
-            template_sections.append(self._generate_cf_kms(project_name_clean))
-        
-        if "secrets" in security_features:
-            template_sections.append(self._generate_cf_secrets(project_name_clean))
-        
-        # Networking
-        template_sections.append(self._generate_cf_vpc(project_name_clean, security_level))
-        
-        # Security groups
-        if "security_groups" in security_features:
-            template_sections.append(self._generate_cf_security_groups(project_name_clean, services))
-        
-        # WAF (if high security)
-        if "waf" in security_features:
-            template_sections.append(self._generate_cf_waf(project_name_clean))
-        
-        # Load balancer
-        if "load_balancer" in services:
-            template_sections.append(self._generate_cf_alb(project_name_clean, security_level))
-        
-        # Compute resources based on architecture type
-        if arch_type == "web_application":
-            template_sections.append(self._generate_cf_ec2(project_name_clean, services, security_level))
-        elif arch_type == "api_backend":
-            template_sections.append(self._generate_cf_lambda(project_name_clean, security_level))
-        elif arch_type == "microservices":
-            template_sections.append(self._generate_cf_ecs(project_name_clean, security_level))
-        
-        # Database
-        if "database" in services:
-            template_sections.append(self._generate_cf_database(project_name_clean, services, security_level))
-        
-        # Storage
-        template_sections.append(self._generate_cf_s3(project_name_clean, security_level))
-        
-        # Monitoring and logging
-        if "monitoring" in security_features:
-            template_sections.append(self._generate_cf_monitoring(project_name_clean))
-        
-        if "logging" in security_features:
-            template_sections.append(self._generate_cf_logging(project_name_clean))
-        
-        # Outputs
-        template_sections.append(self._generate_cf_outputs())
-        
-        return "\n\n".join(template_sections)
-    
-    def _generate_cf_header(self, project_name: str) -> str:
-        return f'''AWSTemplateFormatVersion: '2010-09-09'
+_CF_HEADER_TEMPLATE = '''AWSTemplateFormatVersion: '2010-09-09'
 Description: >
-  CloudFormation template for {project_name} - Generated with security best practices
+  CloudFormation template for %(project_name)s - Generated with security best practices
   by AWS-Architecture-Generator
 
 Metadata:
@@ -1525,9 +857,8 @@ Metadata:
           default: "Security Configuration"
         Parameters:
           - EnableDeletionProtection'''
-    
-    def _generate_cf_parameters(self, security_level: str) -> str:
-        return '''Parameters:
+
+_CF_PARAMETERS = '''Parameters:
   ProjectName:
     Type: String
     Description: Project name for resource naming
@@ -1551,9 +882,8 @@ Metadata:
       - 'true'
       - 'false'
     Description: Enable deletion protection for critical resources'''
-    
-    def _generate_cf_mappings(self) -> str:
-        return '''Mappings:
+
+_CF_MAPPINGS = '''Mappings:
   RegionMap:
     us-east-1:
       AMI: ami-0c55b159cbfafe1d0
@@ -1561,417 +891,476 @@ Metadata:
       AMI: ami-0cb72367e98845d43
     eu-west-1:
       AMI: ami-0bbc25e23a7640b9b'''
-    
-    def _generate_cf_kms(self, project_name: str) -> str:
-        return f'''  # KMS Key for encryption
-  MainKMSKey:
-    Type: AWS::KMS::Key
-    Properties:
-      Description: !Sub "KMS key for ${{ProjectName}}"
-      EnableKeyRotation: true
-      KeyPolicy:
-        Version: '2012-10-17'
-        Statement:
-          - Sid: Enable IAM User Permissions
-            Effect: Allow
-            Principal:
-              AWS: !Sub "arn:aws:iam::${{AWS::AccountId}}:root"
-            Action: 'kms:*'
-            Resource: '*'
-      Tags:
-        - Key: Name
-          Value: !Sub "${{ProjectName}}-kms-key"
-        - Key: Environment
-          Value: !Ref Environment
-        - Key: ManagedBy
-          Value: CloudFormation
-  
+
+_CF_OUTPUTS = '''Outputs:
+  VPCId:
+    Description: ID of the VPC
+    Value: !Ref MainVPC
+    Export:
+      Name: !Sub "${AWS::StackName}-VPC-ID"
+  
+  LoadBalancerDNS:
+    Description: DNS name of the load balancer
+    Value: !GetAtt MainALB.DNSName
+    Export:
+      Name: !Sub "${AWS::StackName}-ALB-DNS"
+    Condition: LoadBalancerExists
+  
+  S3BucketName:
+    Description: Name of the S3 bucket
+    Value: !Ref MainS3Bucket
+    Export:
+      Name: !Sub "${AWS::StackName}-S3-Bucket"
+  
+  DatabaseEndpoint:
+    Description: Database endpoint
+    Value: !GetAtt MainDatabase.Endpoint.Address
+    Export:
+      Name: !Sub "${AWS::StackName}-DB-Endpoint"
+    Condition: DatabaseExists
+  
+  ApiGatewayURL:
+    Description: API Gateway URL
+    Value: !Sub "https://${ApiGateway}.execute-api.${AWS::Region}.amazonaws.com/${Environment}"
+    Export:
+      Name: !Sub "${AWS::StackName}-API-URL"
+    Condition: ApiGatewayExists
+
+Conditions:
+  LoadBalancerExists: !Not [!Equals [!Ref MainALB, ""]]
+  DatabaseExists: !Not [!Equals [!Ref MainDatabase, ""]]
+  ApiGatewayExists: !Not [!Equals [!Ref ApiGateway, ""]]'''
+
+_CF_KMS = '''  # KMS Key for encryption
+  MainKMSKey:
+    Type: AWS::KMS::Key
+    Properties:
+      Description: !Sub "KMS key for ${ProjectName}"
+      EnableKeyRotation: true
+      KeyPolicy:
+        Version: '2012-10-17'
+        Statement:
+          - Sid: Enable IAM User Permissions
+            Effect: Allow
+            Principal:
+              AWS: !Sub "arn:aws:iam::${AWS::AccountId}:root"
+            Action: 'kms:*'
+            Resource: '*'
+      Tags:
+        - Key: Name
+          Value: !Sub "${ProjectName}-kms-key"
+        - Key: Environment
+          Value: !Ref Environment
+        - Key: ManagedBy
+          Value: CloudFormation
+  
   MainKMSKeyAlias:
     Type: AWS::KMS::Alias
     Properties:
-      AliasName: !Sub "alias/${{ProjectName}}-key"
+      AliasName: !Sub "alias/${ProjectName}-key"
       TargetKeyId: !Ref MainKMSKey'''
-    
-    def _generate_cf_secrets(self, project_name: str) -> str:
-        return f'''  # Secrets Manager for database credentials
+
+_CF_SECRETS = '''  # Secrets Manager for database credentials
   DatabaseSecret:
     Type: AWS::SecretsManager::Secret
     Properties:
-      Name: !Sub "${{ProjectName}}-db-credentials"
-      Description: !Sub "Database credentials for ${{ProjectName}}"
+      Name: !Sub "${ProjectName}-db-credentials"
+      Description: !Sub "Database credentials for ${ProjectName}"
       KmsKeyId: !Ref MainKMSKey
       GenerateSecretString:
-        SecretStringTemplate: '{{"username": "admin"}}'
+        SecretStringTemplate: '{"username": "admin"}'
         GenerateStringKey: password
         PasswordLength: 32
         ExcludeCharacters: '"@/\\'
       Tags:
         - Key: Name
-          Value: !Sub "${{ProjectName}}-db-secret"
+          Value: !Sub "${ProjectName}-db-secret"
         - Key: Environment
           Value: !Ref Environment'''
-    
-    def _generate_cf_vpc(self, project_name: str, security_level: str) -> str:
-        multi_az = security_level == "high"
-        
-        vpc_template = f'''  # VPC Configuration
-  MainVPC:
-    Type: AWS::EC2::VPC
+
+_CF_WAF = '''  # WAF v2 Configuration
+  MainWebACL:
+    Type: AWS::WAFv2::WebACL
     Properties:
-      CidrBlock: 10.0.0.0/16
-      EnableDnsHostnames: true
-      EnableDnsSupport: true
+      Name: !Sub "${ProjectName}-waf"
+      Scope: REGIONAL
+      DefaultAction:
+        Allow: {}
+      Rules:
+        - Name: AWSManagedRulesCommonRuleSet
+          Priority: 1
+          OverrideAction:
+            None: {}
+          Statement:
+            ManagedRuleGroupStatement:
+              VendorName: AWS
+              Name: AWSManagedRulesCommonRuleSet
+          VisibilityConfig:
+            SampledRequestsEnabled: true
+            CloudWatchMetricsEnabled: true
+            MetricName: CommonRuleSetMetric
+        - Name: AWSManagedRulesKnownBadInputsRuleSet
+          Priority: 2
+          OverrideAction:
+            None: {}
+          Statement:
+            ManagedRuleGroupStatement:
+              VendorName: AWS
+              Name: AWSManagedRulesKnownBadInputsRuleSet
+          VisibilityConfig:
+            SampledRequestsEnabled: true
+            CloudWatchMetricsEnabled: true
+            MetricName: KnownBadInputsRuleSetMetric
+      VisibilityConfig:
+        SampledRequestsEnabled: true
+        CloudWatchMetricsEnabled: true
+        MetricName: !Sub "${ProjectName}-waf"
       Tags:
         - Key: Name
-          Value: !Sub "${{ProjectName}}-vpc"
+          Value: !Sub "${ProjectName}-waf"
         - Key: Environment
-          Value: !Ref Environment
-  
-  # Internet Gateway
-  MainIGW:
-    Type: AWS::EC2::InternetGateway
+          Value: !Ref Environment'''
+
+_CF_SECURITY_GROUPS = '''  # Security Groups
+  ALBSecurityGroup:
+    Type: AWS::EC2::SecurityGroup
     Properties:
+      GroupName: !Sub "${ProjectName}-alb-sg"
+      GroupDescription: Security group for Application Load Balancer
+      VpcId: !Ref MainVPC
+      SecurityGroupIngress:
+        - IpProtocol: tcp
+          FromPort: 443
+          ToPort: 443
+          CidrIp: 0.0.0.0/0
+          Description: HTTPS
+        - IpProtocol: tcp
+          FromPort: 80
+          ToPort: 80
+          CidrIp: 0.0.0.0/0
+          Description: HTTP (redirect to HTTPS)
+      SecurityGroupEgress:
+        - IpProtocol: -1
+          CidrIp: 0.0.0.0/0
+          Description: All outbound traffic
       Tags:
         - Key: Name
-          Value: !Sub "${{ProjectName}}-igw"
+          Value: !Sub "${ProjectName}-alb-sg"
         - Key: Environment
           Value: !Ref Environment
   
-  AttachGateway:
-    Type: AWS::EC2::VPCGatewayAttachment
-    Properties:
-      VpcId: !Ref MainVPC
-      InternetGatewayId: !Ref MainIGW
-  
-  # Public Subnets
-  PublicSubnet1:
-    Type: AWS::EC2::Subnet
+  AppSecurityGroup:
+    Type: AWS::EC2::SecurityGroup
     Properties:
+      GroupName: !Sub "${ProjectName}-app-sg"
+      GroupDescription: Security group for application servers
       VpcId: !Ref MainVPC
-      CidrBlock: 10.0.1.0/24
-      AvailabilityZone: !Select [0, !GetAZs '']
-      MapPublicIpOnLaunch: true
+      SecurityGroupIngress:
+        - IpProtocol: tcp
+          FromPort: 8080
+          ToPort: 8080
+          SourceSecurityGroupId: !Ref ALBSecurityGroup
+          Description: Application traffic from ALB
+      SecurityGroupEgress:
+        - IpProtocol: -1
+          CidrIp: 0.0.0.0/0
+          Description: All outbound traffic
       Tags:
         - Key: Name
-          Value: !Sub "${{ProjectName}}-public-1"
-        - Key: Type
-          Value: public
+          Value: !Sub "${ProjectName}-app-sg"
         - Key: Environment
-          Value: !Ref Environment'''
-
-        if multi_az:
-            vpc_template += '''
+          Value: !Ref Environment
   
-  PublicSubnet2:
-    Type: AWS::EC2::Subnet
+  DatabaseSecurityGroup:
+    Type: AWS::EC2::SecurityGroup
     Properties:
+      GroupName: !Sub "${ProjectName}-db-sg"
+      GroupDescription: Security group for database
       VpcId: !Ref MainVPC
-      CidrBlock: 10.0.2.0/24
-      AvailabilityZone: !Select [1, !GetAZs '']
-      MapPublicIpOnLaunch: true
+      SecurityGroupIngress:
+        - IpProtocol: tcp
+          FromPort: 3306
+          ToPort: 3306
+          SourceSecurityGroupId: !Ref AppSecurityGroup
+          Description: Database access from application
       Tags:
         - Key: Name
-          Value: !Sub "${ProjectName}-public-2"
-        - Key: Type
-          Value: public
+          Value: !Sub "${ProjectName}-db-sg"
         - Key: Environment
           Value: !Ref Environment'''
 
-        vpc_template += '''
-  
-  # Private Subnets
-  PrivateSubnet1:
-    Type: AWS::EC2::Subnet
+_CF_RDS_TEMPLATE = '''  # RDS Database
+  DBSubnetGroup:
+    Type: AWS::RDS::DBSubnetGroup
     Properties:
-      VpcId: !Ref MainVPC
-      CidrBlock: 10.0.10.0/24
-      AvailabilityZone: !Select [0, !GetAZs '']
+      DBSubnetGroupName: !Sub "${ProjectName}-db-subnet-group"
+      DBSubnetGroupDescription: Subnet group for database
+      SubnetIds:
+        - !Ref PrivateSubnet1%(subnet_config)s
       Tags:
         - Key: Name
-          Value: !Sub "${ProjectName}-private-1"
-        - Key: Type
-          Value: private
+          Value: !Sub "${ProjectName}-db-subnet-group"
         - Key: Environment
-          Value: !Ref Environment'''
-
-        if multi_az:
-            vpc_template += '''
+          Value: !Ref Environment
   
-  PrivateSubnet2:
-    Type: AWS::EC2::Subnet
+  MainDatabase:
+    Type: AWS::RDS::DBInstance
+    DeletionPolicy: Snapshot
     Properties:
-      VpcId: !Ref MainVPC
-      CidrBlock: 10.0.11.0/24
-      AvailabilityZone: !Select [1, !GetAZs '']
+      DBInstanceIdentifier: !Sub "${ProjectName}-database"
+      Engine: %(engine)s
+      EngineVersion: %(engine_version)s
+      DBInstanceClass: db.t3.micro
+      AllocatedStorage: 20
+      MaxAllocatedStorage: 100
+      StorageType: gp2
+      StorageEncrypted: true%(kms_encryption)s
+      DBName: !Sub "${ProjectName}"
+      MasterUsername: admin
+      ManageMasterUserPassword: true
+      VPCSecurityGroups:
+        - !Ref DatabaseSecurityGroup
+      DBSubnetGroupName: !Ref DBSubnetGroup
+      BackupRetentionPeriod: %(backup_retention_period)d
+      PreferredBackupWindow: "03:00-04:00"
+      PreferredMaintenanceWindow: "sun:04:00-sun:05:00"
+      MultiAZ: %(multi_az)s
+      PubliclyAccessible: false
+      DeletionProtection: !Ref EnableDeletionProtection%(monitoring_config)s
       Tags:
         - Key: Name
-          Value: !Sub "${ProjectName}-private-2"
-        - Key: Type
-          Value: private
+          Value: !Sub "${ProjectName}-database"
         - Key: Environment
           Value: !Ref Environment'''
 
-        vpc_template += '''
-  
-  # Route Tables
-  PublicRouteTable:
-    Type: AWS::EC2::RouteTable
+_CF_DYNAMODB_TEMPLATE = '''  # DynamoDB Table
+  DynamoDBTable:
+    Type: AWS::DynamoDB::Table
     Properties:
-      VpcId: !Ref MainVPC
+      TableName: !Sub "${ProjectName}-table"
+      BillingMode: PAY_PER_REQUEST
+      AttributeDefinitions:
+        - AttributeName: id
+          AttributeType: S
+      KeySchema:
+        - AttributeName: id
+          KeyType: HASH
+      DeletionProtectionEnabled: %(deletion_protection)s%(kms_encryption)s
+      PointInTimeRecoverySpecification:
+        PointInTimeRecoveryEnabled: %(point_in_time_recovery)s
+      StreamSpecification:
+        StreamViewType: NEW_AND_OLD_IMAGES
       Tags:
         - Key: Name
-          Value: !Sub "${ProjectName}-public-rt"
+          Value: !Sub "${ProjectName}-dynamodb-table"
         - Key: Environment
           Value: !Ref Environment
-  
-  PublicRoute:
-    Type: AWS::EC2::Route
-    DependsOn: AttachGateway
-    Properties:
-      RouteTableId: !Ref PublicRouteTable
-      DestinationCidrBlock: 0.0.0.0/0
-      GatewayId: !Ref MainIGW
-  
-  PublicSubnet1RouteTableAssociation:
-    Type: AWS::EC2::SubnetRouteTableAssociation
-    Properties:
-      SubnetId: !Ref PublicSubnet1
-      RouteTableId: !Ref PublicRouteTable'''
 
-        if multi_az:
-            vpc_template += '''
-  
-  PublicSubnet2RouteTableAssociation:
-    Type: AWS::EC2::SubnetRouteTableAssociation
-    Properties:
-      SubnetId: !Ref PublicSubnet2
-      RouteTableId: !Ref PublicRouteTable
-  
-  # NAT Gateways for high security
-  NATGateway1EIP:
-    Type: AWS::EC2::EIP
-    DependsOn: AttachGateway
+%(gsi_config)s'''
+
+_CF_DYNAMODB_GSI_TEMPLATE = '''
+  DynamoDBGSITable:
+    Type: AWS::DynamoDB::Table
     Properties:
-      Domain: vpc
+      TableName: !Sub "${ProjectName}-gsi-table"
+      BillingMode: PAY_PER_REQUEST
+      AttributeDefinitions:
+        - AttributeName: gsi_id
+          AttributeType: S
+        - AttributeName: sort_key
+          AttributeType: S
+      KeySchema:
+        - AttributeName: gsi_id
+          KeyType: HASH
+      GlobalSecondaryIndexes:
+        - IndexName: GSI1
+          KeySchema:
+            - AttributeName: gsi_id
+              KeyType: HASH
+            - AttributeName: sort_key
+              KeyType: RANGE
+          Projection:
+            ProjectionType: ALL%(kms_encryption)s
+      PointInTimeRecoverySpecification:
+        PointInTimeRecoveryEnabled: %(point_in_time_recovery)s
       Tags:
         - Key: Name
-          Value: !Sub "${ProjectName}-nat-eip-1"
-  
-  NATGateway2EIP:
-    Type: AWS::EC2::EIP
-    DependsOn: AttachGateway
-    Properties:
-      Domain: vpc
-      Tags:
-        - Key: Name
-          Value: !Sub "${ProjectName}-nat-eip-2"
-  
-  NATGateway1:
-    Type: AWS::EC2::NatGateway
+          Value: !Sub "${ProjectName}-dynamodb-gsi-table"
+        - Key: Environment
+          Value: !Ref Environment'''
+
+_CF_S3_TEMPLATE = '''  # S3 Bucket
+  MainS3Bucket:
+    Type: AWS::S3::Bucket
     Properties:
-      AllocationId: !GetAtt NATGateway1EIP.AllocationId
-      SubnetId: !Ref PublicSubnet1
+      BucketName: !Sub "${ProjectName}-storage-${AWS::AccountId}-${AWS::Region}"
+      BucketEncryption:
+        ServerSideEncryptionConfiguration:
+          - ServerSideEncryptionByDefault:%(kms_encryption)s
+            BucketKeyEnabled: true
+      PublicAccessBlockConfiguration:
+        BlockPublicAcls: true
+        BlockPublicPolicy: true
+        IgnorePublicAcls: true
+        RestrictPublicBuckets: true
+      VersioningConfiguration:
+        Status: Enabled
+      LifecycleConfiguration:
+        Rules:
+          - Id: lifecycle
+            Status: Enabled
+            ExpirationInDays: 90
+            NoncurrentVersionExpirationInDays: 30
       Tags:
         - Key: Name
-          Value: !Sub "${ProjectName}-nat-gw-1"
-  
-  NATGateway2:
-    Type: AWS::EC2::NatGateway
+          Value: !Sub "${ProjectName}-storage"
+        - Key: Environment
+          Value: !Ref Environment%(logging_config)s'''
+
+_CF_MONITORING = '''  # CloudWatch Log Group
+  AppLogGroup:
+    Type: AWS::Logs::LogGroup
     Properties:
-      AllocationId: !GetAtt NATGateway2EIP.AllocationId
-      SubnetId: !Ref PublicSubnet2
+      LogGroupName: !Sub "/aws/application/${ProjectName}"
+      RetentionInDays: 30
       Tags:
         - Key: Name
-          Value: !Sub "${ProjectName}-nat-gw-2"
+          Value: !Sub "${ProjectName}-logs"
+        - Key: Environment
+          Value: !Ref Environment
   
-  PrivateRouteTable1:
-    Type: AWS::EC2::RouteTable
+  # CloudWatch Alarms
+  HighCPUAlarm:
+    Type: AWS::CloudWatch::Alarm
     Properties:
-      VpcId: !Ref MainVPC
+      AlarmName: !Sub "${ProjectName}-high-cpu"
+      AlarmDescription: This metric monitors high CPU utilization
+      ComparisonOperator: GreaterThanThreshold
+      EvaluationPeriods: 2
+      MetricName: CPUUtilization
+      Namespace: AWS/EC2
+      Period: 120
+      Statistic: Average
+      Threshold: 80
+      Dimensions:
+        - Name: AutoScalingGroupName
+          Value: !Ref AppAutoScalingGroup
       Tags:
         - Key: Name
-          Value: !Sub "${ProjectName}-private-rt-1"
+          Value: !Sub "${ProjectName}-cpu-alarm"
+        - Key: Environment
+          Value: !Ref Environment
   
-  PrivateRouteTable2:
-    Type: AWS::EC2::RouteTable
+  # SNS Topic for Alerts
+  AlertsTopic:
+    Type: AWS::SNS::Topic
     Properties:
-      VpcId: !Ref MainVPC
+      TopicName: !Sub "${ProjectName}-alerts"
       Tags:
         - Key: Name
-          Value: !Sub "${ProjectName}-private-rt-2"
-  
-  PrivateRoute1:
-    Type: AWS::EC2::Route
-    Properties:
-      RouteTableId: !Ref PrivateRouteTable1
-      DestinationCidrBlock: 0.0.0.0/0
-      NatGatewayId: !Ref NATGateway1
-  
-  PrivateRoute2:
-    Type: AWS::EC2::Route
-    Properties:
-      RouteTableId: !Ref PrivateRouteTable2
-      DestinationCidrBlock: 0.0.0.0/0
-      NatGatewayId: !Ref NATGateway2
-  
-  PrivateSubnet1RouteTableAssociation:
-    Type: AWS::EC2::SubnetRouteTableAssociation
-    Properties:
-      SubnetId: !Ref PrivateSubnet1
-      RouteTableId: !Ref PrivateRouteTable1
-  
-  PrivateSubnet2RouteTableAssociation:
-    Type: AWS::EC2::SubnetRouteTableAssociation
-    Properties:
-      SubnetId: !Ref PrivateSubnet2
-      RouteTableId: !Ref PrivateRouteTable2'''
+          Value: !Sub "${ProjectName}-alerts"
+        - Key: Environment
+          Value: !Ref Environment'''
 
-        return vpc_template
-    
-    def _generate_cf_security_groups(self, project_name: str, services: Dict[str, str]) -> str:
-        return f'''  # Security Groups
-  ALBSecurityGroup:
-    Type: AWS::EC2::SecurityGroup
+_CF_LOGGING = '''  # CloudTrail for Audit Logging
+  MainCloudTrail:
+    Type: AWS::CloudTrail::Trail
     Properties:
-      GroupName: !Sub "${{ProjectName}}-alb-sg"
-      GroupDescription: Security group for Application Load Balancer
-      VpcId: !Ref MainVPC
-      SecurityGroupIngress:
-        - IpProtocol: tcp
-          FromPort: 443
-          ToPort: 443
-          CidrIp: 0.0.0.0/0
-          Description: HTTPS
-        - IpProtocol: tcp
-          FromPort: 80
-          ToPort: 80
-          CidrIp: 0.0.0.0/0
-          Description: HTTP (redirect to HTTPS)
-      SecurityGroupEgress:
-        - IpProtocol: -1
-          CidrIp: 0.0.0.0/0
-          Description: All outbound traffic
+      TrailName: !Sub "${ProjectName}-trail"
+      S3BucketName: !Ref CloudTrailLogsBucket
+      S3KeyPrefix: cloudtrail
+      IncludeGlobalServiceEvents: true
+      IsMultiRegionTrail: true
+      EnableLogFileValidation: true
+      EventSelectors:
+        - ReadWriteType: All
+          IncludeManagementEvents: true
+          DataResources:
+            - Type: AWS::S3::Object
+              Values:
+                - !Sub "${MainS3Bucket}/*"
       Tags:
         - Key: Name
-          Value: !Sub "${{ProjectName}}-alb-sg"
+          Value: !Sub "${ProjectName}-trail"
         - Key: Environment
           Value: !Ref Environment
   
-  AppSecurityGroup:
-    Type: AWS::EC2::SecurityGroup
+  # S3 Bucket for CloudTrail Logs
+  CloudTrailLogsBucket:
+    Type: AWS::S3::Bucket
     Properties:
-      GroupName: !Sub "${{ProjectName}}-app-sg"
-      GroupDescription: Security group for application servers
-      VpcId: !Ref MainVPC
-      SecurityGroupIngress:
-        - IpProtocol: tcp
-          FromPort: 8080
-          ToPort: 8080
-          SourceSecurityGroupId: !Ref ALBSecurityGroup
-          Description: Application traffic from ALB
-      SecurityGroupEgress:
-        - IpProtocol: -1
-          CidrIp: 0.0.0.0/0
-          Description: All outbound traffic
+      BucketName: !Sub "${ProjectName}-cloudtrail-${AWS::AccountId}-${AWS::Region}"
+      PublicAccessBlockConfiguration:
+        BlockPublicAcls: true
+        BlockPublicPolicy: true
+        IgnorePublicAcls: true
+        RestrictPublicBuckets: true
       Tags:
         - Key: Name
-          Value: !Sub "${{ProjectName}}-app-sg"
+          Value: !Sub "${ProjectName}-cloudtrail-logs"
         - Key: Environment
           Value: !Ref Environment
   
-  DatabaseSecurityGroup:
-    Type: AWS::EC2::SecurityGroup
-    Properties:
-      GroupName: !Sub "${{ProjectName}}-db-sg"
-      GroupDescription: Security group for database
-      VpcId: !Ref MainVPC
-      SecurityGroupIngress:
-        - IpProtocol: tcp
-          FromPort: 3306
-          ToPort: 3306
-          SourceSecurityGroupId: !Ref AppSecurityGroup
-          Description: Database access from application
-      Tags:
-        - Key: Name
-          Value: !Sub "${{ProjectName}}-db-sg"
-        - Key: Environment
-          Value: !Ref Environment'''
-    
-    def _generate_cf_waf(self, project_name: str) -> str:
-        return f'''  # WAF v2 Configuration
-  MainWebACL:
-    Type: AWS::WAFv2::WebACL
+  CloudTrailBucketPolicy:
+    Type: AWS::S3::BucketPolicy
     Properties:
-      Name: !Sub "${{ProjectName}}-waf"
-      Scope: REGIONAL
-      DefaultAction:
-        Allow: {{}}
-      Rules:
-        - Name: AWSManagedRulesCommonRuleSet
-          Priority: 1
-          OverrideAction:
-            None: {{}}
-          Statement:
-            ManagedRuleGroupStatement:
-              VendorName: AWS
-              Name: AWSManagedRulesCommonRuleSet
-          VisibilityConfig:
-            SampledRequestsEnabled: true
-            CloudWatchMetricsEnabled: true
-            MetricName: CommonRuleSetMetric
-        - Name: AWSManagedRulesKnownBadInputsRuleSet
-          Priority: 2
-          OverrideAction:
-            None: {{}}
-          Statement:
-            ManagedRuleGroupStatement:
-              VendorName: AWS
-              Name: AWSManagedRulesKnownBadInputsRuleSet
-          VisibilityConfig:
-            SampledRequestsEnabled: true
-            CloudWatchMetricsEnabled: true
-            MetricName: KnownBadInputsRuleSetMetric
-      VisibilityConfig:
-        SampledRequestsEnabled: true
-        CloudWatchMetricsEnabled: true
-        MetricName: !Sub "${{ProjectName}}-waf"
-      Tags:
-        - Key: Name
-          Value: !Sub "${{ProjectName}}-waf"
-        - Key: Environment
-          Value: !Ref Environment'''
-    
-    def _generate_cf_alb(self, project_name: str, security_level: str) -> str:
-        waf_association = '''
-      WebAclArn: !GetAtt MainWebACL.Arn''' if security_level == "high" else ""
-        
-        subnet_config = '''
-        - !Ref PublicSubnet2''' if security_level == "high" else ""
-        
-        return f'''  # Application Load Balancer
+      Bucket: !Ref CloudTrailLogsBucket
+      PolicyDocument:
+        Version: '2012-10-17'
+        Statement:
+          - Sid: AWSCloudTrailAclCheck
+            Effect: Allow
+            Principal:
+              Service: cloudtrail.amazonaws.com
+            Action: s3:GetBucketAcl
+            Resource: !GetAtt CloudTrailLogsBucket.Arn
+          - Sid: AWSCloudTrailWrite
+            Effect: Allow
+            Principal:
+              Service: cloudtrail.amazonaws.com
+            Action: s3:PutObject
+            Resource: !Sub "${CloudTrailLogsBucket.Arn}/cloudtrail/*"
+            Condition:
+              StringEquals:
+                's3:x-amz-acl': bucket-owner-full-control'''
+
+_CF_ASSUME_ROLE_POLICY_TEMPLATE = '''AssumeRolePolicyDocument:
+        Version: '2012-10-17'
+        Statement:
+          - Effect: Allow
+            Principal:
+              Service: %s
+            Action: sts:AssumeRole'''
+
+_CF_ASSUME_ROLE_POLICIES = {
+    service: _CF_ASSUME_ROLE_POLICY_TEMPLATE % service
+    for service in ("ec2.amazonaws.com", "lambda.amazonaws.com", "ecs-tasks.amazonaws.com")
+}
+
+_CF_ALB_TEMPLATE = '''  # Application Load Balancer
   MainALB:
     Type: AWS::ElasticLoadBalancingV2::LoadBalancer
     Properties:
-      Name: !Sub "${{ProjectName}}-alb"
+      Name: !Sub "${ProjectName}-alb"
       Type: application
       Scheme: internet-facing
       SecurityGroups:
         - !Ref ALBSecurityGroup
       Subnets:
-        - !Ref PublicSubnet1{subnet_config}
+        - !Ref PublicSubnet1%(subnet_config)s
       LoadBalancerAttributes:
         - Key: deletion_protection.enabled
-          Value: !Ref EnableDeletionProtection{waf_association}
+          Value: !Ref EnableDeletionProtection%(waf_association)s
       Tags:
         - Key: Name
-          Value: !Sub "${{ProjectName}}-alb"
+          Value: !Sub "${ProjectName}-alb"
         - Key: Environment
           Value: !Ref Environment
   
   ALBTargetGroup:
     Type: AWS::ElasticLoadBalancingV2::TargetGroup
     Properties:
-      Name: !Sub "${{ProjectName}}-tg"
+      Name: !Sub "${ProjectName}-tg"
       Port: 8080
       Protocol: HTTP
       VpcId: !Ref MainVPC
@@ -1987,7 +1376,7 @@ Metadata:
         HttpCode: 200
       Tags:
         - Key: Name
-          Value: !Sub "${{ProjectName}}-tg"
+          Value: !Sub "${ProjectName}-tg"
         - Key: Environment
           Value: !Ref Environment
   
@@ -2021,42 +1410,32 @@ Metadata:
   SSLCertificate:
     Type: AWS::CertificateManager::Certificate
     Properties:
-      DomainName: !Sub "${{ProjectName}}.example.com"
+      DomainName: !Sub "${ProjectName}.example.com"
       ValidationMethod: DNS
       Tags:
         - Key: Name
-          Value: !Sub "${{ProjectName}}-cert"
+          Value: !Sub "${ProjectName}-cert"
         - Key: Environment
           Value: !Ref Environment'''
-    
-    def _generate_cf_ec2(self, project_name: str, services: Dict[str, str], security_level: str) -> str:
-        key_name = '''
-      KeyName: !Ref EC2KeyPair''' if security_level in ["medium", "high"] else ""
-        
-        kms_encryption = '''
-            KmsKeyId: !Ref MainKMSKey''' if security_level == "high" else ""
-        
-        subnet_config = '''
-        - !Ref PrivateSubnet2''' if security_level == "high" else ""
-        
-        ec2_template = f'''  # Launch Template
+
+_CF_EC2_TEMPLATE = '''  # Launch Template
   AppLaunchTemplate:
     Type: AWS::EC2::LaunchTemplate
     Properties:
-      LaunchTemplateName: !Sub "${{ProjectName}}-lt"
+      LaunchTemplateName: !Sub "${ProjectName}-lt"
       LaunchTemplateData:
         ImageId: !FindInMap [RegionMap, !Ref "AWS::Region", AMI]
         InstanceType: t3.micro
         SecurityGroupIds:
           - !Ref AppSecurityGroup
         IamInstanceProfile:
-          Arn: !GetAtt AppInstanceProfile.Arn{key_name}
+          Arn: !GetAtt AppInstanceProfile.Arn%(key_name)s
         BlockDeviceMappings:
           - DeviceName: /dev/xvda
             Ebs:
               VolumeSize: 20
               VolumeType: gp3
-              Encrypted: true{kms_encryption}
+              Encrypted: true%(kms_encryption)s
               DeleteOnTermination: true
         MetadataOptions:
           HttpEndpoint: enabled
@@ -2066,7 +1445,7 @@ Metadata:
           - ResourceType: instance
             Tags:
               - Key: Name
-                Value: !Sub "${{ProjectName}}-instance"
+                Value: !Sub "${ProjectName}-instance"
               - Key: Environment
                 Value: !Ref Environment
         UserData:
@@ -2079,22 +1458,22 @@ Metadata:
   AppAutoScalingGroup:
     Type: AWS::AutoScaling::AutoScalingGroup
     Properties:
-      AutoScalingGroupName: !Sub "${{ProjectName}}-asg"
+      AutoScalingGroupName: !Sub "${ProjectName}-asg"
       VPCZoneIdentifier:
-        - !Ref PrivateSubnet1{subnet_config}
+        - !Ref PrivateSubnet1%(subnet_config)s
       LaunchTemplate:
         LaunchTemplateId: !Ref AppLaunchTemplate
         Version: !GetAtt AppLaunchTemplate.LatestVersionNumber
       MinSize: 1
-      MaxSize: {3 if security_level == "high" else 2}
-      DesiredCapacity: {2 if security_level == "high" else 1}
+      MaxSize: %(max_size)d
+      DesiredCapacity: %(desired_capacity)d
       TargetGroupARNs:
         - !Ref ALBTargetGroup
       HealthCheckType: ELB
       HealthCheckGracePeriod: 300
       Tags:
         - Key: Name
-          Value: !Sub "${{ProjectName}}-asg"
+          Value: !Sub "${ProjectName}-asg"
           PropagateAtLaunch: false
         - Key: Environment
           Value: !Ref Environment
@@ -2104,16 +1483,10 @@ Metadata:
   AppInstanceRole:
     Type: AWS::IAM::Role
     Properties:
-      RoleName: !Sub "${{ProjectName}}-app-role"
-      AssumeRolePolicyDocument:
-        Version: '2012-10-17'
-        Statement:
-          - Effect: Allow
-            Principal:
-              Service: ec2.amazonaws.com
-            Action: sts:AssumeRole
+      RoleName: !Sub "${ProjectName}-app-role"
+      %(assume_role_policy)s
       Policies:
-        - PolicyName: !Sub "${{ProjectName}}-app-policy"
+        - PolicyName: !Sub "${ProjectName}-app-policy"
           PolicyDocument:
             Version: '2012-10-17'
             Statement:
@@ -2122,26 +1495,25 @@ Metadata:
                   - s3:GetObject
                   - s3:PutObject
                   - s3:DeleteObject
-                Resource: !Sub "${{MainS3Bucket}}/*"
+                Resource: !Sub "${MainS3Bucket}/*"
               - Effect: Allow
                 Action:
                   - secretsmanager:GetSecretValue
                 Resource: !Ref DatabaseSecret
       Tags:
         - Key: Name
-          Value: !Sub "${{ProjectName}}-app-role"
+          Value: !Sub "${ProjectName}-app-role"
         - Key: Environment
           Value: !Ref Environment
   
   AppInstanceProfile:
     Type: AWS::IAM::InstanceProfile
     Properties:
-      InstanceProfileName: !Sub "${{ProjectName}}-app-profile"
+      InstanceProfileName: !Sub "${ProjectName}-app-profile"
       Roles:
         - !Ref AppInstanceRole'''
 
-        if security_level in ["medium", "high"]:
-            ec2_template += '''
+_CF_KEY_PAIR_TEMPLATE = '''
   
   # Key Pair for SSH access
   EC2KeyPair:
@@ -2154,26 +1526,114 @@ Metadata:
           Value: !Sub "${ProjectName}-key"
         - Key: Environment
           Value: !Ref Environment'''
-        
-        return ec2_template
-    
-    def _generate_cf_ecs(self, project_name: str, security_level: str) -> str:
-        container_insights = '''
-      ClusterSettings:
-        - Name: containerInsights
-          Value: enabled''' if security_level in ["medium", "high"] else ""
-        
-        subnet_config = '''
-            - !Ref PrivateSubnet2''' if security_level == "high" else ""
-        
-        return f'''  # ECS Cluster
+
+_CF_LAMBDA_TEMPLATE = '''  # Lambda Function for API Backend
+  ApiLambdaFunction:
+    Type: AWS::Lambda::Function
+    Properties:
+      FunctionName: !Sub "${ProjectName}-api"
+      Runtime: python3.9
+      Handler: index.handler
+      Role: !GetAtt LambdaExecutionRole.Arn
+      Code:
+        ZipFile: |
+          %(lambda_code)s
+      Timeout: 30%(kms_config)s
+      Environment:
+        Variables:
+          ENVIRONMENT: !Ref Environment
+      VpcConfig:
+        SubnetIds:
+          - !Ref PrivateSubnet1%(subnet_config)s
+        SecurityGroupIds:
+          - !Ref LambdaSecurityGroup
+      Tags:
+        - Key: Name
+          Value: !Sub "${ProjectName}-lambda"
+        - Key: Environment
+          Value: !Ref Environment
+  
+  # API Gateway
+  ApiGateway:
+    Type: AWS::ApiGateway::RestApi
+    Properties:
+      Name: !Sub "${ProjectName}-api"
+      Description: !Sub "API Gateway for ${ProjectName}"
+      EndpointConfiguration:
+        Types:
+          - REGIONAL
+      Tags:
+        - Key: Name
+          Value: !Sub "${ProjectName}-api"
+        - Key: Environment
+          Value: !Ref Environment
+  
+  ApiGatewayResource:
+    Type: AWS::ApiGateway::Resource
+    Properties:
+      RestApiId: !Ref ApiGateway
+      ParentId: !GetAtt ApiGateway.RootResourceId
+      PathPart: "{proxy+}"
+  
+  ApiGatewayMethod:
+    Type: AWS::ApiGateway::Method
+    Properties:
+      RestApiId: !Ref ApiGateway
+      ResourceId: !Ref ApiGatewayResource
+      HttpMethod: ANY
+      AuthorizationType: NONE
+      Integration:
+        Type: AWS_PROXY
+        IntegrationHttpMethod: POST
+        Uri: !Sub "arn:aws:apigateway:${AWS::Region}:lambda:path/2015-03-31/functions/${ApiLambdaFunction.Arn}/invocations"
+  
+  ApiGatewayDeployment:
+    Type: AWS::ApiGateway::Deployment
+    DependsOn:
+      - ApiGatewayMethod
+    Properties:
+      RestApiId: !Ref ApiGateway
+      StageName: !Ref Environment
+  
+  # Lambda IAM Role
+  LambdaExecutionRole:
+    Type: AWS::IAM::Role
+    Properties:
+      RoleName: !Sub "${ProjectName}-lambda-role"
+      %(assume_role_policy)s
+      ManagedPolicyArns:
+        - arn:aws:iam::aws:policy/service-role/AWSLambdaVPCAccessExecutionRole
+      Tags:
+        - Key: Name
+          Value: !Sub "${ProjectName}-lambda-role"
+        - Key: Environment
+          Value: !Ref Environment
+  
+  # Lambda Security Group
+  LambdaSecurityGroup:
+    Type: AWS::EC2::SecurityGroup
+    Properties:
+      GroupName: !Sub "${ProjectName}-lambda-sg"
+      GroupDescription: Security group for Lambda functions
+      VpcId: !Ref MainVPC
+      SecurityGroupEgress:
+        - IpProtocol: -1
+          CidrIp: 0.0.0.0/0
+          Description: All outbound traffic
+      Tags:
+        - Key: Name
+          Value: !Sub "${ProjectName}-lambda-sg"
+        - Key: Environment
+          Value: !Ref Environment'''
+
+_CF_ECS_TEMPLATE = '''  # ECS Cluster
   ECSCluster:
     Type: AWS::ECS::Cluster
     Properties:
-      ClusterName: !Sub "${{ProjectName}}-cluster"{container_insights}
+      ClusterName: !Sub "${ProjectName}-cluster"%(container_insights)s
       Tags:
         - Key: Name
-          Value: !Sub "${{ProjectName}}-cluster"
+          Value: !Sub "${ProjectName}-cluster"
         - Key: Environment
           Value: !Ref Environment
   
@@ -2181,7 +1641,7 @@ Metadata:
   ECSTaskDefinition:
     Type: AWS::ECS::TaskDefinition
     Properties:
-      Family: !Sub "${{ProjectName}}-app"
+      Family: !Sub "${ProjectName}-app"
       NetworkMode: awsvpc
       RequiresCompatibilities:
         - FARGATE
@@ -2190,7 +1650,7 @@ Metadata:
       ExecutionRoleArn: !GetAtt ECSExecutionRole.Arn
       TaskRoleArn: !GetAtt ECSTaskRole.Arn
       ContainerDefinitions:
-        - Name: !Sub "${{ProjectName}}-container"
+        - Name: !Sub "${ProjectName}-container"
           Image: nginx:latest
           PortMappings:
             - ContainerPort: 80
@@ -2206,7 +1666,7 @@ Metadata:
               Value: !Ref Environment
       Tags:
         - Key: Name
-          Value: !Sub "${{ProjectName}}-task"
+          Value: !Sub "${ProjectName}-task"
         - Key: Environment
           Value: !Ref Environment
   
@@ -2214,25 +1674,25 @@ Metadata:
   ECSService:
     Type: AWS::ECS::Service
     Properties:
-      ServiceName: !Sub "${{ProjectName}}-service"
+      ServiceName: !Sub "${ProjectName}-service"
       Cluster: !Ref ECSCluster
       TaskDefinition: !Ref ECSTaskDefinition
-      DesiredCount: {2 if security_level == "high" else 1}
+      DesiredCount: %(desired_count)d
       LaunchType: FARGATE
       NetworkConfiguration:
         AwsvpcConfiguration:
           Subnets:
-            - !Ref PrivateSubnet1{subnet_config}
+            - !Ref PrivateSubnet1%(subnet_config)s
           SecurityGroups:
             - !Ref ECSSecurityGroup
           AssignPublicIp: DISABLED
       LoadBalancers:
         - TargetGroupArn: !Ref ALBTargetGroup
-          ContainerName: !Sub "${{ProjectName}}-container"
+          ContainerName: !Sub "${ProjectName}-container"
           ContainerPort: 80
       Tags:
         - Key: Name
-          Value: !Sub "${{ProjectName}}-service"
+          Value: !Sub "${ProjectName}-service"
         - Key: Environment
           Value: !Ref Environment
   
@@ -2240,36 +1700,24 @@ Metadata:
   ECSExecutionRole:
     Type: AWS::IAM::Role
     Properties:
-      RoleName: !Sub "${{ProjectName}}-ecs-execution-role"
-      AssumeRolePolicyDocument:
-        Version: '2012-10-17'
-        Statement:
-          - Effect: Allow
-            Principal:
-              Service: ecs-tasks.amazonaws.com
-            Action: sts:AssumeRole
+      RoleName: !Sub "${ProjectName}-ecs-execution-role"
+      %(assume_role_policy)s
       ManagedPolicyArns:
         - arn:aws:iam::aws:policy/service-role/AmazonECSTaskExecutionRolePolicy
       Tags:
         - Key: Name
-          Value: !Sub "${{ProjectName}}-ecs-execution-role"
+          Value: !Sub "${ProjectName}-ecs-execution-role"
         - Key: Environment
           Value: !Ref Environment
   
   ECSTaskRole:
     Type: AWS::IAM::Role
     Properties:
-      RoleName: !Sub "${{ProjectName}}-ecs-task-role"
-      AssumeRolePolicyDocument:
-        Version: '2012-10-17'
-        Statement:
-          - Effect: Allow
-            Principal:
-              Service: ecs-tasks.amazonaws.com
-            Action: sts:AssumeRole
+      RoleName: !Sub "${ProjectName}-ecs-task-role"
+      %(assume_role_policy)s
       Tags:
         - Key: Name
-          Value: !Sub "${{ProjectName}}-ecs-task-role"
+          Value: !Sub "${ProjectName}-ecs-task-role"
         - Key: Environment
           Value: !Ref Environment
   
@@ -2277,7 +1725,7 @@ Metadata:
   ECSSecurityGroup:
     Type: AWS::EC2::SecurityGroup
     Properties:
-      GroupName: !Sub "${{ProjectName}}-ecs-sg"
+      GroupName: !Sub "${ProjectName}-ecs-sg"
       GroupDescription: Security group for ECS tasks
       VpcId: !Ref MainVPC
       SecurityGroupIngress:
@@ -2292,7 +1740,7 @@ Metadata:
           Description: All outbound traffic
       Tags:
         - Key: Name
-          Value: !Sub "${{ProjectName}}-ecs-sg"
+          Value: !Sub "${ProjectName}-ecs-sg"
         - Key: Environment
           Value: !Ref Environment
   
@@ -2300,372 +1748,813 @@ Metadata:
   ECSLogGroup:
     Type: AWS::Logs::LogGroup
     Properties:
-      LogGroupName: !Sub "/ecs/${{ProjectName}}"
+      LogGroupName: !Sub "/ecs/${ProjectName}"
       RetentionInDays: 30
       Tags:
         - Key: Name
-          Value: !Sub "${{ProjectName}}-ecs-logs"
+          Value: !Sub "${ProjectName}-ecs-logs"
         - Key: Environment
           Value: !Ref Environment'''
-    
-    def _generate_cf_database(self, project_name: str, services: Dict[str, str], security_level: str) -> str:
-        db_service = services.get('database', 'none')
-        
-        # Generate appropriate database based on user selection
-        if 'dynamodb' in db_service.lower():
-            return self._generate_cf_dynamodb(project_name, security_level)
-        elif 'postgres' in db_service.lower() or 'rds' in db_service.lower() or 'sql' in db_service.lower():
-            db_engine = 'postgres' if 'postgres' in db_service.lower() else 'mysql'
-            return self._generate_cf_rds(project_name, db_engine, security_level)
-        elif 'mysql' in db_service.lower():
-            return self._generate_cf_rds(project_name, 'mysql', security_level)
-        else:
-            # No database selected
-            return "  # No database service selected"
-    
-    def _generate_cf_rds(self, project_name: str, db_engine: str, security_level: str) -> str:
-        multi_az = security_level == "high"
-        
-        kms_encryption = '''
-      KmsKeyId: !Ref MainKMSKey''' if security_level == "high" else ""
-        
-        backup_retention = 7 if security_level in ["medium", "high"] else 1
-        
-        monitoring_config = '''
-      EnableCloudwatchLogsExports:
-        - error
-        - general
-        - slow-query''' if security_level in ["medium", "high"] else ""
-        
-        subnet_config = '''
-        - !Ref PrivateSubnet2''' if multi_az else ""
-        
-        return f'''  # RDS Database
-  DBSubnetGroup:
-    Type: AWS::RDS::DBSubnetGroup
-    Properties:
-      DBSubnetGroupName: !Sub "${{ProjectName}}-db-subnet-group"
-      DBSubnetGroupDescription: Subnet group for database
-      SubnetIds:
-        - !Ref PrivateSubnet1{subnet_config}
-      Tags:
-        - Key: Name
-          Value: !Sub "${{ProjectName}}-db-subnet-group"
-        - Key: Environment
-          Value: !Ref Environment
-  
-  MainDatabase:
-    Type: AWS::RDS::DBInstance
-    DeletionPolicy: Snapshot
+
+
+def _iter_separated(sections: Iterator[str]) -> Iterator[str]:
+    """Yield sections with a blank line between each, without joining them"""
+    yield next(sections)
+    for section in sections:
+        yield "\n\n"
+        yield section
+
+# One row per subnet: (number, CIDR block, AZ index). Single-AZ templates take the first row
+_CF_SUBNETS = {
+    "public": ((1, "10.0.1.0/24", 0), (2, "10.0.2.0/24", 1)),
+    "private": ((1, "10.0.10.0/24", 0), (2, "10.0.11.0/24", 1)),
+}
+
+_CF_SUBNET_TEMPLATE = '''  %(logical_prefix)sSubnet%(number)d:
+    Type: AWS::EC2::Subnet
     Properties:
-      DBInstanceIdentifier: !Sub "${{ProjectName}}-database"
-      Engine: {db_engine.lower()}
-      EngineVersion: {self._get_db_version(db_engine)}
-      DBInstanceClass: db.t3.micro
-      AllocatedStorage: 20
-      MaxAllocatedStorage: 100
-      StorageType: gp2
-      StorageEncrypted: true{kms_encryption}
-      DBName: !Sub "${{ProjectName}}"
-      MasterUsername: admin
-      ManageMasterUserPassword: true
-      VPCSecurityGroups:
-        - !Ref DatabaseSecurityGroup
-      DBSubnetGroupName: !Ref DBSubnetGroup
-      BackupRetentionPeriod: {backup_retention}
-      PreferredBackupWindow: "03:00-04:00"
-      PreferredMaintenanceWindow: "sun:04:00-sun:05:00"
-      MultiAZ: {str(multi_az).lower()}
-      PubliclyAccessible: false
-      DeletionProtection: !Ref EnableDeletionProtection{monitoring_config}
+      VpcId: !Ref MainVPC
+      CidrBlock: %(cidr)s
+      AvailabilityZone: !Select [%(az)d, !GetAZs '']%(map_public_ip)s
       Tags:
         - Key: Name
-          Value: !Sub "${{ProjectName}}-database"
+          Value: !Sub "${ProjectName}-%(kind)s-%(number)d"
+        - Key: Type
+          Value: %(kind)s
         - Key: Environment
           Value: !Ref Environment'''
 
-    def _generate_cf_dynamodb(self, project_name: str, security_level: str) -> str:
-        """Generate CloudFormation DynamoDB table configuration"""
-        
-        # Enhanced features for higher security levels
-        point_in_time_recovery = "true" if security_level in ["medium", "high"] else "false"
-        deletion_protection = "true" if security_level == "high" else "false"
-        
-        kms_encryption = '''
-      SSESpecification:
-        SSEEnabled: true
-        KMSMasterKeyId: !Ref MainKMSKey''' if security_level == "high" else '''
-      SSESpecification:
-        SSEEnabled: true'''
-        
-        gsi_config = '''
-  DynamoDBGSITable:
-    Type: AWS::DynamoDB::Table
-    Properties:
-      TableName: !Sub "${ProjectName}-gsi-table"
-      BillingMode: PAY_PER_REQUEST
-      AttributeDefinitions:
-        - AttributeName: gsi_id
-          AttributeType: S
-        - AttributeName: sort_key
-          AttributeType: S
-      KeySchema:
-        - AttributeName: gsi_id
-          KeyType: HASH
-      GlobalSecondaryIndexes:
-        - IndexName: GSI1
-          KeySchema:
-            - AttributeName: gsi_id
-              KeyType: HASH
-            - AttributeName: sort_key
-              KeyType: RANGE
-          Projection:
-            ProjectionType: ALL''' + kms_encryption + f'''
-      PointInTimeRecoverySpecification:
-        PointInTimeRecoveryEnabled: {point_in_time_recovery}
-      Tags:
-        - Key: Name
-          Value: !Sub "${{ProjectName}}-dynamodb-gsi-table"
-        - Key: Environment
-          Value: !Ref Environment''' if security_level in ["medium", "high"] else ""
-        
-        return f'''  # DynamoDB Table
-  DynamoDBTable:
-    Type: AWS::DynamoDB::Table
+def _render_cf_subnets(kind: str, az_count: int) -> str:
+    return "\n  \n".join(
+        _CF_SUBNET_TEMPLATE % {
+            "logical_prefix": kind.capitalize(),
+            "number": number,
+            "cidr": cidr,
+            "az": az,
+            "map_public_ip": "\n      MapPublicIpOnLaunch: true" if kind == "public" else "",
+            "kind": kind,
+        }
+        for number, cidr, az in _CF_SUBNETS[kind][:az_count]
+    )
+
+_CF_VPC_HEAD = '''  # VPC Configuration
+  MainVPC:
+    Type: AWS::EC2::VPC
     Properties:
-      TableName: !Sub "${{ProjectName}}-table"
-      BillingMode: PAY_PER_REQUEST
-      AttributeDefinitions:
-        - AttributeName: id
-          AttributeType: S
-      KeySchema:
-        - AttributeName: id
-          KeyType: HASH
-      DeletionProtectionEnabled: {deletion_protection}{kms_encryption}
-      PointInTimeRecoverySpecification:
-        PointInTimeRecoveryEnabled: {point_in_time_recovery}
-      StreamSpecification:
-        StreamViewType: NEW_AND_OLD_IMAGES
+      CidrBlock: 10.0.0.0/16
+      EnableDnsHostnames: true
+      EnableDnsSupport: true
       Tags:
         - Key: Name
-          Value: !Sub "${{ProjectName}}-dynamodb-table"
+          Value: !Sub "${ProjectName}-vpc"
         - Key: Environment
           Value: !Ref Environment
-
-{gsi_config}'''
-    
-    def _generate_cf_s3(self, project_name: str, security_level: str) -> str:
-        kms_encryption = '''
-            KMSMasterKeyID: !Ref MainKMSKey
-            SSEAlgorithm: aws:kms''' if security_level == "high" else '''
-            SSEAlgorithm: AES256'''
-        
-        logging_config = '''
   
-  MainS3BucketLogging:
-    Type: AWS::S3::Bucket
+  # Internet Gateway
+  MainIGW:
+    Type: AWS::EC2::InternetGateway
     Properties:
-      BucketName: !Sub "${ProjectName}-logs-${AWS::AccountId}-${AWS::Region}"
-      PublicAccessBlockConfiguration:
-        BlockPublicAcls: true
-        BlockPublicPolicy: true
-        IgnorePublicAcls: true
-        RestrictPublicBuckets: true
-      BucketEncryption:
-        ServerSideEncryptionConfiguration:
-          - ServerSideEncryptionByDefault:''' + kms_encryption + '''
-            BucketKeyEnabled: true
       Tags:
         - Key: Name
-          Value: !Sub "${ProjectName}-logs"
+          Value: !Sub "${ProjectName}-igw"
         - Key: Environment
           Value: !Ref Environment
   
-  S3BucketLoggingConfig:
-    Type: AWS::S3::Bucket
+  AttachGateway:
+    Type: AWS::EC2::VPCGatewayAttachment
     Properties:
-      LoggingConfiguration:
-        DestinationBucketName: !Ref MainS3BucketLogging
-        LogFilePrefix: access-logs/''' if security_level in ["medium", "high"] else ""
-        
-        return f'''  # S3 Bucket
-  MainS3Bucket:
-    Type: AWS::S3::Bucket
+      VpcId: !Ref MainVPC
+      InternetGatewayId: !Ref MainIGW
+  
+  # Public Subnets
+'''
+
+_CF_VPC_ROUTES = '''
+  
+  # Route Tables
+  PublicRouteTable:
+    Type: AWS::EC2::RouteTable
     Properties:
-      BucketName: !Sub "${{ProjectName}}-storage-${{AWS::AccountId}}-${{AWS::Region}}"
-      BucketEncryption:
-        ServerSideEncryptionConfiguration:
-          - ServerSideEncryptionByDefault:{kms_encryption}
-            BucketKeyEnabled: true
-      PublicAccessBlockConfiguration:
-        BlockPublicAcls: true
-        BlockPublicPolicy: true
-        IgnorePublicAcls: true
-        RestrictPublicBuckets: true
-      VersioningConfiguration:
-        Status: Enabled
-      LifecycleConfiguration:
-        Rules:
-          - Id: lifecycle
-            Status: Enabled
-            ExpirationInDays: 90
-            NoncurrentVersionExpirationInDays: 30
+      VpcId: !Ref MainVPC
       Tags:
         - Key: Name
-          Value: !Sub "${{ProjectName}}-storage"
+          Value: !Sub "${ProjectName}-public-rt"
         - Key: Environment
-          Value: !Ref Environment{logging_config}'''
+          Value: !Ref Environment
+  
+  PublicRoute:
+    Type: AWS::EC2::Route
+    DependsOn: AttachGateway
+    Properties:
+      RouteTableId: !Ref PublicRouteTable
+      DestinationCidrBlock: 0.0.0.0/0
+      GatewayId: !Ref MainIGW
+  
+  PublicSubnet1RouteTableAssociation:
+    Type: AWS::EC2::SubnetRouteTableAssociation
+    Properties:
+      SubnetId: !Ref PublicSubnet1
+      RouteTableId: !Ref PublicRouteTable'''
+
+# Second public subnet association, NAT gateways and private routing for multi-AZ VPCs
+_CF_VPC_MULTI_AZ = '''
+  
+  PublicSubnet2RouteTableAssociation:
+    Type: AWS::EC2::SubnetRouteTableAssociation
+    Properties:
+      SubnetId: !Ref PublicSubnet2
+      RouteTableId: !Ref PublicRouteTable
+  
+  # NAT Gateways for high security
+  NATGateway1EIP:
+    Type: AWS::EC2::EIP
+    DependsOn: AttachGateway
+    Properties:
+      Domain: vpc
+      Tags:
+        - Key: Name
+          Value: !Sub "${ProjectName}-nat-eip-1"
+  
+  NATGateway2EIP:
+    Type: AWS::EC2::EIP
+    DependsOn: AttachGateway
+    Properties:
+      Domain: vpc
+      Tags:
+        - Key: Name
+          Value: !Sub "${ProjectName}-nat-eip-2"
+  
+  NATGateway1:
+    Type: AWS::EC2::NatGateway
+    Properties:
+      AllocationId: !GetAtt NATGateway1EIP.AllocationId
+      SubnetId: !Ref PublicSubnet1
+      Tags:
+        - Key: Name
+          Value: !Sub "${ProjectName}-nat-gw-1"
+  
+  NATGateway2:
+    Type: AWS::EC2::NatGateway
+    Properties:
+      AllocationId: !GetAtt NATGateway2EIP.AllocationId
+      SubnetId: !Ref PublicSubnet2
+      Tags:
+        - Key: Name
+          Value: !Sub "${ProjectName}-nat-gw-2"
+  
+  PrivateRouteTable1:
+    Type: AWS::EC2::RouteTable
+    Properties:
+      VpcId: !Ref MainVPC
+      Tags:
+        - Key: Name
+          Value: !Sub "${ProjectName}-private-rt-1"
+  
+  PrivateRouteTable2:
+    Type: AWS::EC2::RouteTable
+    Properties:
+      VpcId: !Ref MainVPC
+      Tags:
+        - Key: Name
+          Value: !Sub "${ProjectName}-private-rt-2"
+  
+  PrivateRoute1:
+    Type: AWS::EC2::Route
+    Properties:
+      RouteTableId: !Ref PrivateRouteTable1
+      DestinationCidrBlock: 0.0.0.0/0
+      NatGatewayId: !Ref NATGateway1
+  
+  PrivateRoute2:
+    Type: AWS::EC2::Route
+    Properties:
+      RouteTableId: !Ref PrivateRouteTable2
+      DestinationCidrBlock: 0.0.0.0/0
+      NatGatewayId: !Ref NATGateway2
+  
+  PrivateSubnet1RouteTableAssociation:
+    Type: AWS::EC2::SubnetRouteTableAssociation
+    Properties:
+      SubnetId: !Ref PrivateSubnet1
+      RouteTableId: !Ref PrivateRouteTable1
+  
+  PrivateSubnet2RouteTableAssociation:
+    Type: AWS::EC2::SubnetRouteTableAssociation
+    Properties:
+      SubnetId: !Ref PrivateSubnet2
+      RouteTableId: !Ref PrivateRouteTable2'''
+
+def _render_cf_vpc(az_count: int) -> str:
+    parts = [_CF_VPC_HEAD, _render_cf_subnets("public", az_count)]
+    parts.append('''\n  \n  # Private Subnets\n''')
+    parts.append(_render_cf_subnets("private", az_count))
+    parts.append(_CF_VPC_ROUTES)
+    if az_count > 1:
+        parts.append(_CF_VPC_MULTI_AZ)
+    return "".join(parts)
+
+# The VPC section only varies by AZ count, so both shapes are rendered once at import
+_CF_VPC_SECTIONS = {az_count: _render_cf_vpc(az_count) for az_count in (1, 2)}
+
+class TemplateGenerator:
+    """Generate Infrastructure as Code templates with enhanced security hardening"""
+    
+    __slots__ = ("security_levels", "_terraform_security_services", "_terraform_compute", "_cf_compute", "_enhanced_security")
+    
+    def __init__(self) -> None:
+        self._enhanced_security: Optional["EnhancedSecurityTemplates"] = None
+        self.security_levels: Dict[str, FrozenSet[str]] = {
+            "basic": frozenset({"encryption", "vpc", "enhanced_security_groups", "enhanced_nacls"}),
+            "medium": frozenset({"encryption", "vpc", "enhanced_security_groups", "enhanced_nacls", "monitoring", "backup", "guardduty", "cloudtrail"}),
+            "high": frozenset({"encryption", "vpc", "enhanced_security_groups", "enhanced_nacls", "monitoring", "backup", "waf", "secrets", "multi_az", "logging", "guardduty", "security_hub", "config", "inspector", "macie", "cloudhsm", "compliance_controls"})
+        }
+        # Security service sections in output order, each gated by its feature flag
+        terraform_security_services: Tuple[Tuple[str, Callable[[str], str]], ...] = (
+            ("guardduty", self._generate_terraform_guardduty),
+            ("security_hub", self._generate_terraform_security_hub),
+            ("config", self._generate_terraform_config),
+            ("inspector", self._generate_terraform_inspector),
+            ("macie", self._generate_terraform_macie),
+            ("cloudhsm", self._generate_terraform_cloudhsm),
+        )
+        # Resolved once per security level, so generation only walks the sections it emits
+        self._terraform_security_services: Dict[str, Tuple[Callable[[str], str], ...]] = {
+            level: tuple(generate for feature, generate in terraform_security_services if feature in features)
+            for level, features in self.security_levels.items()
+        }
+        # Compute section per architecture type; other types emit no compute resources
+        self._terraform_compute: Dict[str, Callable[[str, Dict[str, str], str], str]] = {
+            "web_application": self._generate_terraform_ec2,
+            "api_backend": self._generate_terraform_lambda,
+            "microservices": self._generate_terraform_ecs,
+        }
+        self._cf_compute: Dict[str, Callable[[Dict[str, str], str], str]] = {
+            "web_application": self._generate_cf_ec2,
+            "api_backend": self._generate_cf_lambda,
+            "microservices": self._generate_cf_ecs,
+        }
+    
+    @property
+    def enhanced_security(self) -> "EnhancedSecurityTemplates":
+        """Enhanced security template builder, imported and constructed on first use"""
+        if self._enhanced_security is None:
+            from app.core.enhanced_security_templates import EnhancedSecurityTemplates
+            self._enhanced_security = EnhancedSecurityTemplates()
+        return self._enhanced_security
+    
+    @staticmethod
+    @cache
+    def _shared() -> "TemplateGenerator":
+        # Instances hold no per-caller state, so the class-level template caches render with one
+        return TemplateGenerator()
+    
+    @classmethod
+    def clear_caches(cls) -> None:
+        """Drop memoized templates"""
+        cls._generate_terraform_cached.cache_clear()
+        cls._generate_cloudformation_cached.cache_clear()
+        cls._cloudformation_body_cached.cache_clear()
+        cls._architecture_type_for.cache_clear()
+    
+    def _determine_security_level(self, questionnaire: QuestionnaireRequest) -> str:
+        """Determine security requirements based on questionnaire"""
+        compliance = getattr(questionnaire, 'compliance_requirements', ())
+        data_sensitivity = getattr(questionnaire, 'data_sensitivity', '').lower()
+        
+        # Enhanced security level determination
+        if not _HIGH_SECURITY_COMPLIANCE.isdisjoint(compliance) or 'high' in data_sensitivity:
+            return "high"
+        elif 'medium' in data_sensitivity or len(compliance) > 0:
+            return "medium"
+        else:
+            return "basic"
+    
+    def _determine_architecture_type(self, questionnaire: QuestionnaireRequest) -> str:
+        """Determine the type of architecture based on questionnaire responses"""
+        return self._architecture_type_for(getattr(questionnaire, 'application_type', '').lower())
+    
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def _architecture_type_for(app_type: str) -> str:
+        # First matching row wins, so the table order is the precedence order
+        for keywords, arch_type in _ARCHITECTURE_KEYWORDS:
+            if any(keyword in app_type for keyword in keywords):
+                return arch_type
+        return "web_application"
+    
+    def generate_terraform_template(self, questionnaire: QuestionnaireRequest, services: Dict[str, str]) -> str:
+        """Generate a security-hardened, project-specific Terraform template"""
+        return self._generate_terraform_cached(*self._terraform_inputs(questionnaire, services))
+    
+    def iter_terraform_template(self, questionnaire: QuestionnaireRequest, services: Dict[str, str]) -> Iterator[str]:
+        """Yield the Terraform template in chunks, e.g. for file.writelines() without building the full string"""
+        return _iter_separated(self._iter_terraform_sections(*self._terraform_inputs(questionnaire, services)))
+    
+    def _terraform_inputs(self, questionnaire: QuestionnaireRequest, services: Dict[str, str]) -> Tuple[str, str, str, Tuple[str, ...], Tuple[Tuple[str, str], ...]]:
+        """Everything the Terraform template depends on, as a hashable cache key"""
+        return (
+            sys.intern(questionnaire.project_name_clean),
+            self._determine_security_level(questionnaire),
+            self._determine_architecture_type(questionnaire),
+            tuple(getattr(questionnaire, 'compliance_requirements', ())),
+            tuple(sorted(services.items())),
+        )
+    
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def _generate_terraform_cached(project_name_clean: str, security_level: str, arch_type: str, compliance_frameworks: Tuple[str, ...], services: Tuple[Tuple[str, str], ...]) -> str:
+        # Sections are written straight into one buffer rather than collected into a list for join()
+        buf = io.StringIO()
+        buf.writelines(_iter_separated(TemplateGenerator._shared()._iter_terraform_sections(
+            project_name_clean, security_level, arch_type, compliance_frameworks, services
+        )))
+        return buf.getvalue()
+    
+    def _iter_terraform_sections(self, project_name_clean: str, security_level: str, arch_type: str, compliance_frameworks: Tuple[str, ...], service_items: Tuple[Tuple[str, str], ...]) -> Iterator[str]:
+        services = dict(service_items)
+        security_features = self.security_levels[security_level]
+        
+        # Header and provider configuration
+        yield self._generate_terraform_header(project_name_clean)
+        
+        # Variables
+        yield self._generate_terraform_variables(security_level)
+        
+        # Data sources
+        yield self._generate_terraform_data_sources()
+        
+        # Security components
+        if "encryption" in security_features:
+            yield self._generate_terraform_kms(project_name_clean)
+        
+        if "secrets" in security_features:
+            yield self._generate_terraform_secrets(project_name_clean)
+        
+        # Networking
+        yield self._generate_terraform_vpc(project_name_clean, security_level)
+        
+        # Enhanced security groups and NACLs  
+        if "enhanced_security_groups" in security_features:
+            yield self._generate_enhanced_terraform_security_groups(project_name_clean, services, security_level)
+        
+        if "enhanced_nacls" in security_features:
+            yield self._generate_terraform_nacls(project_name_clean, security_level)
+        
+        # Enhanced WAF with advanced rules
+        if "waf" in security_features:
+            yield self._generate_enhanced_terraform_waf(project_name_clean, security_level)
+        
+        # Load balancer
+        if "load_balancer" in services:
+            yield self._generate_terraform_alb(project_name_clean, security_level)
+        
+        # Compute resources based on architecture type
+        generate_compute = self._terraform_compute.get(arch_type)
+        if generate_compute is not None:
+            yield generate_compute(project_name_clean, services, security_level)
+        
+        # Database
+        if "database" in services:
+            yield self._generate_terraform_database(project_name_clean, services, security_level)
+        
+        # Storage
+        yield self._generate_terraform_s3(project_name_clean, security_level)
+        
+        # Enhanced security services
+        for generate in self._terraform_security_services[security_level]:
+            yield generate(project_name_clean)
+        
+        # Enhanced monitoring and logging
+        if "monitoring" in security_features:
+            yield self._generate_enhanced_terraform_monitoring(project_name_clean, security_level)
+        
+        if "logging" in security_features:
+            yield self._generate_enhanced_terraform_logging(project_name_clean, security_level)
+        
+        # Compliance controls
+        if "compliance_controls" in security_features:
+            yield self._generate_terraform_compliance_controls(project_name_clean, list(compliance_frameworks))
+        
+        # Outputs
+        yield self._generate_terraform_outputs()
+    
+    def _generate_terraform_header(self, project_name: str) -> str:
+        return _TERRAFORM_HEADER_TEMPLATE % {"project_name": project_name}
+    
+    def _generate_terraform_variables(self, security_level: str) -> str:
+        return _TERRAFORM_VARIABLES
+    
+    def _generate_terraform_data_sources(self) -> str:
+        return _TERRAFORM_DATA_SOURCES
+    
+    def _generate_terraform_kms(self, project_name: str) -> str:
+        return _TERRAFORM_KMS_TEMPLATE % {"project_name": project_name}
+    
+    def _generate_terraform_secrets(self, project_name: str) -> str:
+        return _TERRAFORM_SECRETS_TEMPLATE % {"project_name": project_name}
+    
+    def _generate_terraform_vpc(self, project_name: str, security_level: str) -> str:
+        # Always use multi-AZ since AWS requires minimum 2 AZs for ALB and RDS
+        multi_az = True
+        
+        vpc_config = _TERRAFORM_VPC_TEMPLATE
+
+        # Default VPC already has internet connectivity for all subnets
+        # No additional NAT gateway or private route tables needed
+        
+        return vpc_config
+    
+    def _generate_terraform_alb(self, project_name: str, security_level: str) -> str:
+        return _TERRAFORM_ALB_TEMPLATE % {
+            "web_acl_association": "associate_web_acl_arn = aws_wafv2_web_acl.main.arn" if security_level == "high" else "",
+        }
+    
+    def _generate_terraform_ec2(self, project_name: str, services: Dict[str, str], security_level: str) -> str:
+        # No SSH key pair is attached; nothing would supply its public key file
+        return _TERRAFORM_EC2_TEMPLATE % {
+            "assume_role_policy": _TERRAFORM_ASSUME_ROLE_POLICIES["ec2.amazonaws.com"],
+            "kms_key_id": "kms_key_id = aws_kms_key.main.arn" if security_level == "high" else "",
+            "max_size": 3 if security_level == "high" else 2,
+            "desired_capacity": 2 if security_level == "high" else 1,
+        }
+
+    def _generate_terraform_lambda(self, project_name: str, services: Dict[str, str], security_level: str) -> str:
+        return _TERRAFORM_LAMBDA_TEMPLATE % {
+            "assume_role_policy": _TERRAFORM_ASSUME_ROLE_POLICIES["lambda.amazonaws.com"],
+            "kms_key_arn": "kms_key_arn = aws_kms_key.main.arn" if security_level == "high" else "",
+            "project_name": project_name,
+        }
+    
+    def _generate_terraform_ecs(self, project_name: str, services: Dict[str, str], security_level: str) -> str:
+        container_insights = '''setting {
+    name  = "containerInsights"
+    value = "enabled"
+  }''' if security_level in ["medium", "high"] else ""
+        
+        return _TERRAFORM_ECS_TEMPLATE % {
+            "assume_role_policy": _TERRAFORM_ASSUME_ROLE_POLICIES["ecs-tasks.amazonaws.com"],
+            "container_insights": container_insights,
+            "desired_count": 2 if security_level == "high" else 1,
+        }
+    
+    def _generate_terraform_database(self, project_name: str, services: Dict[str, str], security_level: str) -> str:
+        db_service = services.get('database', 'none')
+        
+        # Generate appropriate database based on user selection
+        if 'dynamodb' in db_service.lower():
+            return self._generate_terraform_dynamodb(project_name, security_level)
+        elif 'postgres' in db_service.lower() or 'rds' in db_service.lower() or 'sql' in db_service.lower():
+            db_engine = 'postgres' if 'postgres' in db_service.lower() else 'mysql'
+            return self._generate_terraform_rds(project_name, db_engine, security_level)
+        elif 'mysql' in db_service.lower():
+            return self._generate_terraform_rds(project_name, 'mysql', security_level)
+        else:
+            # No database selected
+            return "# No database service selected"
+    
+    def _generate_terraform_rds(self, project_name: str, db_engine: str, security_level: str) -> str:
+            
+        # Always use multi-AZ since AWS requires minimum 2 AZs for RDS subnet groups
+        multi_az = True
+        
+        cloudwatch_logs = '''enabled_cloudwatch_logs_exports = ["error", "general", "slow-query"]''' if security_level in ["medium", "high"] else ""
+        
+        return _TERRAFORM_RDS_TEMPLATE % {
+            "engine": db_engine.lower(),
+            "engine_version": self._get_db_version(db_engine),
+            "kms_key_id": "kms_key_id = aws_kms_key.main.arn" if security_level == "high" else "",
+            "master_user_secret_kms_key_id": "master_user_secret_kms_key_id = aws_kms_key.main.arn" if security_level == "high" else "",
+            "backup_retention_period": 7 if security_level in ["medium", "high"] else 1,
+            "multi_az": _HCL_BOOL[multi_az],
+            "cloudwatch_logs": cloudwatch_logs,
+        }
+
+    def _generate_terraform_dynamodb(self, project_name: str, security_level: str) -> str:
+        """Generate DynamoDB table configuration"""
+        
+        # Enhanced features for higher security levels
+        point_in_time_recovery = "true" if security_level in ["medium", "high"] else "false"
+        deletion_protection = "true" if security_level == "high" else "false"
+        encryption_type = "CUSTOMER_MANAGED" if security_level == "high" else "DEFAULT"
+        
+        return _TERRAFORM_DYNAMODB_TEMPLATE % {
+            "deletion_protection": deletion_protection,
+            "point_in_time_recovery": point_in_time_recovery,
+            "gsi_count": 1 if security_level in ["medium", "high"] else 0,
+            "kms_key_arn": '"${{aws_kms_key.main.arn}}"' if security_level == "high" else 'null',
+        }
+    
+    def _generate_terraform_s3(self, project_name: str, security_level: str) -> str:
+        logging_config = '''resource "aws_s3_bucket_logging" "main" {
+  bucket = aws_s3_bucket.main.id
+  target_bucket = aws_s3_bucket.logs.id
+  target_prefix = "access-logs/"
+}''' if security_level in ["medium", "high"] else ""
+        
+        return _TERRAFORM_S3_TEMPLATE % {
+            "kms_master_key_id": "kms_master_key_id = aws_kms_key.main.arn" if security_level == "high" else "",
+            "sse_algorithm": "aws:kms" if security_level == "high" else "AES256",
+            "logging_config": logging_config,
+        }
+    
+    def _generate_terraform_outputs(self) -> str:
+        return _TERRAFORM_OUTPUTS
+    
+    @staticmethod
+    @cache
+    def _get_db_version(engine: str) -> str:
+        """Get appropriate database version"""
+        # Engines come from a fixed set of call sites, so the cache stays bounded
+        return _DB_ENGINE_VERSIONS.get(engine.lower(), "8.0")
+
+    def generate_cloudformation_template(self, questionnaire: QuestionnaireRequest, services: Dict[str, str]) -> str:
+        """Generate a security-hardened, project-specific CloudFormation template"""
+        return self._generate_cloudformation_cached(*self._cloudformation_inputs(questionnaire, services))
+    
+    def iter_cloudformation_template(self, questionnaire: QuestionnaireRequest, services: Dict[str, str]) -> Iterator[str]:
+        """Yield the CloudFormation template in chunks, e.g. for file.writelines() without building the full string"""
+        return _iter_separated(self._iter_cloudformation_sections(*self._cloudformation_inputs(questionnaire, services)))
+    
+    def _cloudformation_inputs(self, questionnaire: QuestionnaireRequest, services: Dict[str, str]) -> Tuple[str, str, str, Tuple[Tuple[str, str], ...]]:
+        """Everything the CloudFormation template depends on, as a hashable cache key"""
+        return (
+            questionnaire.project_name,
+            self._determine_security_level(questionnaire),
+            self._determine_architecture_type(questionnaire),
+            tuple(sorted(services.items())),
+        )
+    
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def _generate_cloudformation_cached(project_name: str, security_level: str, arch_type: str, services: Tuple[Tuple[str, str], ...]) -> str:
+        header = TemplateGenerator._shared()._generate_cf_header(project_name)
+        return header + "\n\n" + TemplateGenerator._cloudformation_body_cached(security_level, arch_type, services)
+    
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def _cloudformation_body_cached(security_level: str, arch_type: str, services: Tuple[Tuple[str, str], ...]) -> str:
+        # Resources refer to the project through the ProjectName parameter, so everything below
+        # the header is shared by all projects on the same security level, architecture and services.
+        # Sections are written straight into one buffer rather than collected into a list for join()
+        buf = io.StringIO()
+        buf.writelines(_iter_separated(TemplateGenerator._shared()._iter_cloudformation_body(security_level, arch_type, services)))
+        return buf.getvalue()
+    
+    def _iter_cloudformation_sections(self, project_name: str, security_level: str, arch_type: str, service_items: Tuple[Tuple[str, str], ...]) -> Iterator[str]:
+        # Header and metadata
+        yield self._generate_cf_header(project_name)
+        yield from self._iter_cloudformation_body(security_level, arch_type, service_items)
+    
+    def _iter_cloudformation_body(self, security_level: str, arch_type: str, service_items: Tuple[Tuple[str, str], ...]) -> Iterator[str]:
+        services = dict(service_items)
+        security_features = self.security_levels[security_level]
+        
+        # Parameters
+        yield self._generate_cf_parameters(security_level)
+        
+        # Mappings
+        yield self._generate_cf_mappings()
+        
+        # Resources start
+        yield "Resources:"
+        
+        # Security components
+        if "encryption" in security_features:
+            yield self._generate_cf_kms()
+        
+        if "secrets" in security_features:
+            yield self._generate_cf_secrets()
+        
+        # Networking
+        yield self._generate_cf_vpc(security_level)
+        
+        # Security groups
+        if "security_groups" in security_features:
+            yield self._generate_cf_security_groups(services)
+        
+        # WAF (if high security)
+        if "waf" in security_features:
+            yield self._generate_cf_waf()
+        
+        # Load balancer
+        if "load_balancer" in services:
+            yield self._generate_cf_alb(security_level)
+        
+        # Compute resources based on architecture type
+        generate_compute = self._cf_compute.get(arch_type)
+        if generate_compute is not None:
+            yield generate_compute(services, security_level)
+        
+        # Database
+        if "database" in services:
+            yield self._generate_cf_database(services, security_level)
+        
+        # Storage
+        yield self._generate_cf_s3(security_level)
+        
+        # Monitoring and logging
+        if "monitoring" in security_features:
+            yield self._generate_cf_monitoring()
+        
+        if "logging" in security_features:
+            yield self._generate_cf_logging()
+        
+        # Outputs
+        yield self._generate_cf_outputs()
+    
+    def _generate_cf_header(self, project_name: str) -> str:
+        return _CF_HEADER_TEMPLATE % {"project_name": project_name}
+    
+    def _generate_cf_parameters(self, security_level: str) -> str:
+        return _CF_PARAMETERS
+    
+    def _generate_cf_mappings(self) -> str:
+        return _CF_MAPPINGS
+    
+    def _generate_cf_kms(self) -> str:
+        return _CF_KMS
+    
+    def _generate_cf_secrets(self) -> str:
+        return _CF_SECRETS
+    
+    def _generate_cf_vpc(self, security_level: str) -> str:
+        return _CF_VPC_SECTIONS[2 if security_level == "high" else 1]
+    
+    def _generate_cf_security_groups(self, services: Dict[str, str]) -> str:
+        return _CF_SECURITY_GROUPS
+    
+    def _generate_cf_waf(self) -> str:
+        return _CF_WAF
+    
+    def _generate_cf_alb(self, security_level: str) -> str:
+        waf_association = '''
+      WebAclArn: !GetAtt MainWebACL.Arn''' if security_level == "high" else ""
+        
+        subnet_config = '''
+        - !Ref PublicSubnet2''' if security_level == "high" else ""
+        
+        return _CF_ALB_TEMPLATE % {
+            "subnet_config": subnet_config,
+            "waf_association": waf_association,
+        }
+    
+    def _generate_cf_ec2(self, services: Dict[str, str], security_level: str) -> str:
+        key_name = '''
+      KeyName: !Ref EC2KeyPair''' if security_level in ["medium", "high"] else ""
+        
+        kms_encryption = '''
+            KmsKeyId: !Ref MainKMSKey''' if security_level == "high" else ""
+        
+        subnet_config = '''
+        - !Ref PrivateSubnet2''' if security_level == "high" else ""
+        
+        ec2_template = _CF_EC2_TEMPLATE % {
+            "assume_role_policy": _CF_ASSUME_ROLE_POLICIES["ec2.amazonaws.com"],
+            "key_name": key_name,
+            "kms_encryption": kms_encryption,
+            "subnet_config": subnet_config,
+            "max_size": 3 if security_level == "high" else 2,
+            "desired_capacity": 2 if security_level == "high" else 1,
+        }
+        
+        if security_level in ["medium", "high"]:
+            ec2_template += _CF_KEY_PAIR_TEMPLATE
+        
+        return ec2_template
+    
+    def _generate_cf_ecs(self, services: Dict[str, str], security_level: str) -> str:
+        container_insights = '''
+      ClusterSettings:
+        - Name: containerInsights
+          Value: enabled''' if security_level in ["medium", "high"] else ""
+        
+        subnet_config = '''
+            - !Ref PrivateSubnet2''' if security_level == "high" else ""
+        
+        return _CF_ECS_TEMPLATE % {
+            "assume_role_policy": _CF_ASSUME_ROLE_POLICIES["ecs-tasks.amazonaws.com"],
+            "container_insights": container_insights,
+            "desired_count": 2 if security_level == "high" else 1,
+            "subnet_config": subnet_config,
+        }
+    
+    def _generate_cf_database(self, services: Dict[str, str], security_level: str) -> str:
+        db_service = services.get('database', 'none')
+        
+        # Generate appropriate database based on user selection
+        if 'dynamodb' in db_service.lower():
+            return self._generate_cf_dynamodb(security_level)
+        elif 'postgres' in db_service.lower() or 'rds' in db_service.lower() or 'sql' in db_service.lower():
+            db_engine = 'postgres' if 'postgres' in db_service.lower() else 'mysql'
+            return self._generate_cf_rds(db_engine, security_level)
+        elif 'mysql' in db_service.lower():
+            return self._generate_cf_rds('mysql', security_level)
+        else:
+            # No database selected
+            return "  # No database service selected"
     
-    def _generate_cf_monitoring(self, project_name: str) -> str:
-        return f'''  # CloudWatch Log Group
-  AppLogGroup:
-    Type: AWS::Logs::LogGroup
-    Properties:
-      LogGroupName: !Sub "/aws/application/${{ProjectName}}"
-      RetentionInDays: 30
-      Tags:
-        - Key: Name
-          Value: !Sub "${{ProjectName}}-logs"
-        - Key: Environment
-          Value: !Ref Environment
-  
-  # CloudWatch Alarms
-  HighCPUAlarm:
-    Type: AWS::CloudWatch::Alarm
-    Properties:
-      AlarmName: !Sub "${{ProjectName}}-high-cpu"
-      AlarmDescription: This metric monitors high CPU utilization
-      ComparisonOperator: GreaterThanThreshold
-      EvaluationPeriods: 2
-      MetricName: CPUUtilization
-      Namespace: AWS/EC2
-      Period: 120
-      Statistic: Average
-      Threshold: 80
-      Dimensions:
-        - Name: AutoScalingGroupName
-          Value: !Ref AppAutoScalingGroup
-      Tags:
-        - Key: Name
-          Value: !Sub "${{ProjectName}}-cpu-alarm"
-        - Key: Environment
-          Value: !Ref Environment
-  
-  # SNS Topic for Alerts
-  AlertsTopic:
-    Type: AWS::SNS::Topic
-    Properties:
-      TopicName: !Sub "${{ProjectName}}-alerts"
-      Tags:
-        - Key: Name
-          Value: !Sub "${{ProjectName}}-alerts"
-        - Key: Environment
-          Value: !Ref Environment'''
+    def _generate_cf_rds(self, db_engine: str, security_level: str) -> str:
+        multi_az = security_level == "high"
+        
+        kms_encryption = '''
+      KmsKeyId: !Ref MainKMSKey''' if security_level == "high" else ""
+        
+        backup_retention = 7 if security_level in ["medium", "high"] else 1
+        
+        monitoring_config = '''
+      EnableCloudwatchLogsExports:
+        - error
+        - general
+        - slow-query''' if security_level in ["medium", "high"] else ""
+        
+        subnet_config = '''
+        - !Ref PrivateSubnet2''' if multi_az else ""
+        
+        return _CF_RDS_TEMPLATE % {
+            "subnet_config": subnet_config,
+            "engine": db_engine.lower(),
+            "engine_version": self._get_db_version(db_engine),
+            "kms_encryption": kms_encryption,
+            "backup_retention_period": backup_retention,
+            "multi_az": _HCL_BOOL[multi_az],
+            "monitoring_config": monitoring_config,
+        }
+
+    def _generate_cf_dynamodb(self, security_level: str) -> str:
+        """Generate CloudFormation DynamoDB table configuration"""
+        
+        # Enhanced features for higher security levels
+        point_in_time_recovery = "true" if security_level in ["medium", "high"] else "false"
+        deletion_protection = "true" if security_level == "high" else "false"
+        
+        kms_encryption = '''
+      SSESpecification:
+        SSEEnabled: true
+        KMSMasterKeyId: !Ref MainKMSKey''' if security_level == "high" else '''
+      SSESpecification:
+        SSEEnabled: true'''
+        
+        gsi_config = _CF_DYNAMODB_GSI_TEMPLATE % {
+            "kms_encryption": kms_encryption,
+            "point_in_time_recovery": point_in_time_recovery,
+        } if security_level in ["medium", "high"] else ""
+        
+        return _CF_DYNAMODB_TEMPLATE % {
+            "deletion_protection": deletion_protection,
+            "kms_encryption": kms_encryption,
+            "point_in_time_recovery": point_in_time_recovery,
+            "gsi_config": gsi_config,
+        }
     
-    def _generate_cf_logging(self, project_name: str) -> str:
-        return f'''  # CloudTrail for Audit Logging
-  MainCloudTrail:
-    Type: AWS::CloudTrail::Trail
-    Properties:
-      TrailName: !Sub "${{ProjectName}}-trail"
-      S3BucketName: !Ref CloudTrailLogsBucket
-      S3KeyPrefix: cloudtrail
-      IncludeGlobalServiceEvents: true
-      IsMultiRegionTrail: true
-      EnableLogFileValidation: true
-      EventSelectors:
-        - ReadWriteType: All
-          IncludeManagementEvents: true
-          DataResources:
-            - Type: AWS::S3::Object
-              Values:
-                - !Sub "${{MainS3Bucket}}/*"
-      Tags:
-        - Key: Name
-          Value: !Sub "${{ProjectName}}-trail"
-        - Key: Environment
-          Value: !Ref Environment
+    def _generate_cf_s3(self, security_level: str) -> str:
+        kms_encryption = '''
+            KMSMasterKeyID: !Ref MainKMSKey
+            SSEAlgorithm: aws:kms''' if security_level == "high" else '''
+            SSEAlgorithm: AES256'''
+        
+        logging_config = '''
   
-  # S3 Bucket for CloudTrail Logs
-  CloudTrailLogsBucket:
+  MainS3BucketLogging:
     Type: AWS::S3::Bucket
     Properties:
-      BucketName: !Sub "${{ProjectName}}-cloudtrail-${{AWS::AccountId}}-${{AWS::Region}}"
+      BucketName: !Sub "${ProjectName}-logs-${AWS::AccountId}-${AWS::Region}"
       PublicAccessBlockConfiguration:
         BlockPublicAcls: true
         BlockPublicPolicy: true
         IgnorePublicAcls: true
         RestrictPublicBuckets: true
+      BucketEncryption:
+        ServerSideEncryptionConfiguration:
+          - ServerSideEncryptionByDefault:''' + kms_encryption + '''
+            BucketKeyEnabled: true
       Tags:
         - Key: Name
-          Value: !Sub "${{ProjectName}}-cloudtrail-logs"
+          Value: !Sub "${ProjectName}-logs"
         - Key: Environment
           Value: !Ref Environment
   
-  CloudTrailBucketPolicy:
-    Type: AWS::S3::BucketPolicy
+  S3BucketLoggingConfig:
+    Type: AWS::S3::Bucket
     Properties:
-      Bucket: !Ref CloudTrailLogsBucket
-      PolicyDocument:
-        Version: '2012-10-17'
-        Statement:
-          - Sid: AWSCloudTrailAclCheck
-            Effect: Allow
-            Principal:
-              Service: cloudtrail.amazonaws.com
-            Action: s3:GetBucketAcl
-            Resource: !GetAtt CloudTrailLogsBucket.Arn
-          - Sid: AWSCloudTrailWrite
-            Effect: Allow
-            Principal:
-              Service: cloudtrail.amazonaws.com
-            Action: s3:PutObject
-            Resource: !Sub "${{CloudTrailLogsBucket.Arn}}/cloudtrail/*"
-            Condition:
-              StringEquals:
-                's3:x-amz-acl': bucket-owner-full-control'''
+      LoggingConfiguration:
+        DestinationBucketName: !Ref MainS3BucketLogging
+        LogFilePrefix: access-logs/''' if security_level in ["medium", "high"] else ""
+        
+        return _CF_S3_TEMPLATE % {
+            "kms_encryption": kms_encryption,
+            "logging_config": logging_config,
+        }
+    
+    def _generate_cf_monitoring(self) -> str:
+        return _CF_MONITORING
+    
+    def _generate_cf_logging(self) -> str:
+        return _CF_LOGGING
     
     def _generate_cf_outputs(self) -> str:
-        return '''Outputs:
-  VPCId:
-    Description: ID of the VPC
-    Value: !Ref MainVPC
-    Export:
-      Name: !Sub "${AWS::StackName}-VPC-ID"
-  
-  LoadBalancerDNS:
-    Description: DNS name of the load balancer
-    Value: !GetAtt MainALB.DNSName
-    Export:
-      Name: !Sub "${AWS::StackName}-ALB-DNS"
-    Condition: LoadBalancerExists
-  
-  S3BucketName:
-    Description: Name of the S3 bucket
-    Value: !Ref MainS3Bucket
-    Export:
-      Name: !Sub "${AWS::StackName}-S3-Bucket"
-  
-  DatabaseEndpoint:
-    Description: Database endpoint
-    Value: !GetAtt MainDatabase.Endpoint.Address
-    Export:
-      Name: !Sub "${AWS::StackName}-DB-Endpoint"
-    Condition: DatabaseExists
-  
-  ApiGatewayURL:
-    Description: API Gateway URL
-    Value: !Sub "https://${ApiGateway}.execute-api.${AWS::Region}.amazonaws.com/${Environment}"
-    Export:
-      Name: !Sub "${AWS::StackName}-API-URL"
-    Condition: ApiGatewayExists
-
-Conditions:
-  LoadBalancerExists: !Not [!Equals [!Ref MainALB, ""]]
-  DatabaseExists: !Not [!Equals [!Ref MainDatabase, ""]]
-  ApiGatewayExists: !Not [!Equals [!Ref ApiGateway, ""]]'''
+        return _CF_OUTPUTS
     
-    def _generate_cf_lambda(self, project_name: str, security_level: str) -> str:
+    def _generate_cf_lambda(self, services: Dict[str, str], security_level: str) -> str:
         kms_config = '''
       KmsKeyArn: !GetAtt MainKMSKey.Arn''' if security_level == "high" else ""
         
@@ -2679,110 +2568,12 @@ Conditions:
                   'body': json.dumps('Hello from Lambda!')
               }'''
         
-        return f'''  # Lambda Function for API Backend
-  ApiLambdaFunction:
-    Type: AWS::Lambda::Function
-    Properties:
-      FunctionName: !Sub "${{ProjectName}}-api"
-      Runtime: python3.9
-      Handler: index.handler
-      Role: !GetAtt LambdaExecutionRole.Arn
-      Code:
-        ZipFile: |
-          {lambda_code}
-      Timeout: 30{kms_config}
-      Environment:
-        Variables:
-          ENVIRONMENT: !Ref Environment
-      VpcConfig:
-        SubnetIds:
-          - !Ref PrivateSubnet1{subnet_config}
-        SecurityGroupIds:
-          - !Ref LambdaSecurityGroup
-      Tags:
-        - Key: Name
-          Value: !Sub "${{ProjectName}}-lambda"
-        - Key: Environment
-          Value: !Ref Environment
-  
-  # API Gateway
-  ApiGateway:
-    Type: AWS::ApiGateway::RestApi
-    Properties:
-      Name: !Sub "${{ProjectName}}-api"
-      Description: !Sub "API Gateway for ${{ProjectName}}"
-      EndpointConfiguration:
-        Types:
-          - REGIONAL
-      Tags:
-        - Key: Name
-          Value: !Sub "${{ProjectName}}-api"
-        - Key: Environment
-          Value: !Ref Environment
-  
-  ApiGatewayResource:
-    Type: AWS::ApiGateway::Resource
-    Properties:
-      RestApiId: !Ref ApiGateway
-      ParentId: !GetAtt ApiGateway.RootResourceId
-      PathPart: "{{proxy+}}"
-  
-  ApiGatewayMethod:
-    Type: AWS::ApiGateway::Method
-    Properties:
-      RestApiId: !Ref ApiGateway
-      ResourceId: !Ref ApiGatewayResource
-      HttpMethod: ANY
-      AuthorizationType: NONE
-      Integration:
-        Type: AWS_PROXY
-        IntegrationHttpMethod: POST
-        Uri: !Sub "arn:aws:apigateway:${{AWS::Region}}:lambda:path/2015-03-31/functions/${{ApiLambdaFunction.Arn}}/invocations"
-  
-  ApiGatewayDeployment:
-    Type: AWS::ApiGateway::Deployment
-    DependsOn:
-      - ApiGatewayMethod
-    Properties:
-      RestApiId: !Ref ApiGateway
-      StageName: !Ref Environment
-  
-  # Lambda IAM Role
-  LambdaExecutionRole:
-    Type: AWS::IAM::Role
-    Properties:
-      RoleName: !Sub "${{ProjectName}}-lambda-role"
-      AssumeRolePolicyDocument:
-        Version: '2012-10-17'
-        Statement:
-          - Effect: Allow
-            Principal:
-              Service: lambda.amazonaws.com
-            Action: sts:AssumeRole
-      ManagedPolicyArns:
-        - arn:aws:iam::aws:policy/service-role/AWSLambdaVPCAccessExecutionRole
-      Tags:
-        - Key: Name
-          Value: !Sub "${{ProjectName}}-lambda-role"
-        - Key: Environment
-          Value: !Ref Environment
-  
-  # Lambda Security Group
-  LambdaSecurityGroup:
-    Type: AWS::EC2::SecurityGroup
-    Properties:
-      GroupName: !Sub "${{ProjectName}}-lambda-sg"
-      GroupDescription: Security group for Lambda functions
-      VpcId: !Ref MainVPC
-      SecurityGroupEgress:
-        - IpProtocol: -1
-          CidrIp: 0.0.0.0/0
-          Description: All outbound traffic
-      Tags:
-        - Key: Name
-          Value: !Sub "${{ProjectName}}-lambda-sg"
-        - Key: Environment
-          Value: !Ref Environment'''
+        return _CF_LAMBDA_TEMPLATE % {
+            "assume_role_policy": _CF_ASSUME_ROLE_POLICIES["lambda.amazonaws.com"],
+            "lambda_code": lambda_code,
+            "kms_config": kms_config,
+            "subnet_config": subnet_config,
+        }
     
     def _generate_enhanced_terraform_security_groups(self, project_name: str, services: Dict[str, str], security_level: str) -> str:
         """Generate enhanced security groups with comprehensive rules"""
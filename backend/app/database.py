@@ -1,15 +1,45 @@
-from sqlalchemy import create_engine, Column, String, Text, DateTime, JSON, Boolean, ForeignKey
+from sqlalchemy import create_engine, event, Column, String, Text, DateTime, JSON, Boolean, ForeignKey, Index
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker, relationship
+from sqlalchemy.orm import sessionmaker, relationship, deferred
 from datetime import datetime
 import json
+import orjson
 import hashlib
+import hmac
 import secrets
+import zlib
+from app.config import settings
 
 # SQLite database (simple, no extra setup needed)
 DATABASE_URL = "sqlite:///./architectures.db"
 
-engine = create_engine(DATABASE_URL, connect_args={"check_same_thread": False})
+def _json_serializer(obj) -> str:
+    """Serialize JSON columns with orjson, allowing non-str dict keys as json.dumps does"""
+    return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode()
+
+engine = create_engine(
+    DATABASE_URL,
+    connect_args={"check_same_thread": False},
+    # Keep as many connections warm as the default pool would ever open (5 + 10 overflow);
+    # memory is bounded per connection through cache_size below
+    pool_size=15,
+    json_serializer=_json_serializer,
+    json_deserializer=orjson.loads,
+)
+
+@event.listens_for(engine, "connect")
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """WAL lets API readers proceed while a request commits; NORMAL sync fsyncs per checkpoint, not per commit"""
+    cursor = dbapi_connection.cursor()
+    cursor.execute("PRAGMA journal_mode=WAL")
+    cursor.execute("PRAGMA synchronous=NORMAL")
+    cursor.execute("PRAGMA temp_store=MEMORY")
+    # 16MB page cache per connection, about 400MB with the pool and overflow all open; the 64MB mmap
+    # window is backed by the OS page cache and shared between connections
+    cursor.execute("PRAGMA mmap_size=67108864")
+    cursor.execute("PRAGMA cache_size=-16384")
+    cursor.close()
+
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
 
@@ -34,8 +64,12 @@ class UserDB(Base):
     projects = relationship("ProjectDB", back_populates="user")
     
     def verify_password(self, password: str) -> bool:
-        """Verify password against hash"""
-        return hashlib.sha256(password.encode()).hexdigest() == self.password_hash
+        """Verify password against hash in constant time"""
+        try:
+            stored_digest = bytes.fromhex(self.password_hash)
+        except (TypeError, ValueError):
+            return False
+        return hmac.compare_digest(hashlib.sha256(password.encode()).digest(), stored_digest)
     
     @staticmethod
     def hash_password(password: str) -> str:
@@ -51,6 +85,7 @@ class SessionDB(Base):
     expires_at = Column(DateTime)
     created_at = Column(DateTime, default=datetime.utcnow)
     is_active = Column(Boolean, default=True)
+
 class ProjectDB(Base):
     __tablename__ = "projects"
     
@@ -74,6 +109,11 @@ class ProjectDB(Base):
     
     # Relationships
     user = relationship("UserDB", back_populates="projects")
+    
+    # Per-user project listings, newest first
+    __table_args__ = (
+        Index("ix_projects_user_created", "user_id", "created_at"),
+    )
 
 class AWSAccountDB(Base):
     __tablename__ = "aws_accounts"
@@ -100,15 +140,16 @@ class DeploymentDB(Base):
     __tablename__ = "deployments"
     
     id = Column(String, primary_key=True, index=True)
-    project_id = Column(String, index=True)
+    project_id = Column(String)
     aws_account_id = Column(String, index=True)
     template_type = Column(String)  # terraform or cloudformation
     status = Column(String)  # pending, running, success, failed
     dry_run = Column(Boolean, default=True)
     
-    # Deployment results
-    output = Column(Text)
-    error = Column(Text)
+    # Deployment results; apply logs can run to megabytes, so they load only when
+    # accessed or when a query undefers the "logs" group
+    output = deferred(Column(Text), group="logs")
+    error = deferred(Column(Text), group="logs")
     
     # Deployment state tracking
     stack_name = Column(String)  # For CloudFormation stack name
@@ -117,11 +158,38 @@ class DeploymentDB(Base):
     # Metadata
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    
+    # Deployment history for a project, newest first
+    __table_args__ = (
+        Index("ix_deployments_project_created", "project_id", "created_at"),
+    )
+
+def _schema_fingerprint() -> int:
+    """Checksum of the declared tables, columns and indexes, stored in SQLite's user_version once applied"""
+    layout = ";".join(
+        f"{table.name}:{','.join(column.name for column in table.columns)}"
+        f":{','.join(sorted(index.name for index in table.indexes))}"
+        for table in Base.metadata.sorted_tables
+    )
+    # user_version is a signed 32-bit integer
+    return zlib.crc32(layout.encode()) & 0x7FFFFFFF
 
 # Create tables and demo user
 def create_tables():
+    schema_version = _schema_fingerprint()
+    with engine.connect() as conn:
+        if conn.exec_driver_sql("PRAGMA user_version").scalar() == schema_version:
+            # Warm start: schema already matches the models, skip per-table introspection
+            return
     Base.metadata.create_all(bind=engine)
-    create_demo_user()
+    # create_all skips tables that already exist, so add indexes declared since they were created
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=engine, checkfirst=True)
+    with engine.begin() as conn:
+        conn.exec_driver_sql(f"PRAGMA user_version = {schema_version}")
+    if settings.DEBUG:
+        create_demo_user()
 
 def create_demo_user():
     """Create demo user if it doesn't exist"""
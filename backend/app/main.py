@@ -1,98 +1,73 @@
+import asyncio
+import importlib
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from app.config import settings
-from app.api.routes import architecture, health, projects, aws_accounts, auth, architecture_modification, infrastructure_import, ai_ml_optimization, dynamic_security, dynamic_cost, production_infrastructure
-from app.api.v1.endpoints import cost_analysis, security_recommendations
-from app.database import create_tables
+
+# Routers in registration order: (module, path under API_V1_STR, tag, settings flag).
+# Modules are imported only when their router is enabled, so disabled routers never load
+# their dependencies (boto3 clients, ML libraries).
+_ROUTERS = (
+    ("app.api.routes.architecture", "/architecture", "architecture", None),
+    ("app.api.routes.projects", "/projects", "projects", None),
+    ("app.api.routes.health", "/health", "health", None),
+    ("app.api.routes.aws_accounts", "/aws-accounts", "aws-accounts", None),
+    ("app.api.v1.endpoints.cost_analysis", "/cost-analysis", "cost-analysis", None),
+    ("app.api.v1.endpoints.security_recommendations", "/security", "security-recommendations", None),
+    ("app.api.routes.auth", "/auth", "authentication", None),
+    ("app.api.routes.architecture_modification", "/architecture", "architecture-modification", None),
+    ("app.api.routes.infrastructure_import", "", "infrastructure-import", "ENABLE_INFRASTRUCTURE_IMPORT"),
+    ("app.api.routes.ai_ml_optimization", "", "ai-ml-optimization", "ENABLE_AI_ML_OPTIMIZATION"),
+    ("app.api.routes.dynamic_security", "/dynamic-security", "dynamic-security", None),
+    ("app.api.routes.dynamic_cost", "/dynamic-cost", "dynamic-cost", None),
+    ("app.api.routes.production_infrastructure", "/production-infrastructure", "production-infrastructure", "ENABLE_PRODUCTION_INFRASTRUCTURE"),
+)
+
+@asynccontextmanager
+async def lifespan(application: FastAPI):
+    # Create database tables on startup, off the event loop; importing the app stays DB-free
+    from app.database import create_tables
+    await asyncio.to_thread(create_tables)
+    yield
 
 def create_application() -> FastAPI:
+    # Without docs the OpenAPI schema for every route model is never built
+    docs_enabled = settings.DEBUG or settings.ENABLE_DOCS
     application = FastAPI(
         title=settings.PROJECT_NAME,
         version=settings.VERSION,
         description="Generate custom AWS architectures with Infrastructure as Code",
-        openapi_url=f"{settings.API_V1_STR}/openapi.json",
-        docs_url="/docs",
-        redoc_url="/redoc"
+        openapi_url=f"{settings.API_V1_STR}/openapi.json" if docs_enabled else None,
+        docs_url="/docs" if docs_enabled else None,
+        redoc_url="/redoc" if docs_enabled else None,
+        default_response_class=ORJSONResponse,
+        lifespan=lifespan
     )
 
-    # Create database tables on startup
-    create_tables()
+    # Compress generated templates and other large responses
+    application.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=6)
 
-    # CORS middleware
+    # CORS middleware; a wildcard origin must never be combined with credentials
     application.add_middleware(
         CORSMiddleware,
-        allow_origins=["*"],
-        allow_credentials=True,
+        allow_origins=settings.ALLOWED_HOSTS,
+        allow_credentials="*" not in settings.ALLOWED_HOSTS,
         allow_methods=["*"],
         allow_headers=["*"],
     )
 
     # Include routers
-    application.include_router(
-        architecture.router, 
-        prefix=f"{settings.API_V1_STR}/architecture",
-        tags=["architecture"]
-    )
-    application.include_router(
-        projects.router,  # Add projects router
-        prefix=f"{settings.API_V1_STR}/projects",
-        tags=["projects"]
-    )
-    application.include_router(
-        health.router, 
-        prefix=f"{settings.API_V1_STR}/health",
-        tags=["health"]
-    )
-    application.include_router(
-        aws_accounts.router,
-        prefix=f"{settings.API_V1_STR}/aws-accounts",
-        tags=["aws-accounts"]
-    )
-    application.include_router(
-        cost_analysis.router,
-        prefix=f"{settings.API_V1_STR}/cost-analysis",
-        tags=["cost-analysis"]
-    )
-    application.include_router(
-        security_recommendations.router,
-        prefix=f"{settings.API_V1_STR}/security",
-        tags=["security-recommendations"]
-    )
-    application.include_router(
-        auth.router,
-        prefix=f"{settings.API_V1_STR}/auth",
-        tags=["authentication"]
-    )
-    application.include_router(
-        architecture_modification.router,
-        prefix=f"{settings.API_V1_STR}/architecture",
-        tags=["architecture-modification"]
-    )
-    application.include_router(
-        infrastructure_import.router,
-        prefix=f"{settings.API_V1_STR}",
-        tags=["infrastructure-import"]
-    )
-    application.include_router(
-        ai_ml_optimization.router,
-        prefix=f"{settings.API_V1_STR}",
-        tags=["ai-ml-optimization"]
-    )
-    application.include_router(
-        dynamic_security.router,
-        prefix=f"{settings.API_V1_STR}/dynamic-security",
-        tags=["dynamic-security"]
-    )
-    application.include_router(
-        dynamic_cost.router,
-        prefix=f"{settings.API_V1_STR}/dynamic-cost",
-        tags=["dynamic-cost"]
-    )
-    application.include_router(
-        production_infrastructure.router,
-        prefix=f"{settings.API_V1_STR}/production-infrastructure",
-        tags=["production-infrastructure"]
-    )
+    for module_path, prefix, tag, flag in _ROUTERS:
+        if flag is not None and not getattr(settings, flag):
+            continue
+        application.include_router(
+            importlib.import_module(module_path).router,
+            prefix=f"{settings.API_V1_STR}{prefix}",
+            tags=[tag]
+        )
 
     return application
 
@@ -103,7 +78,7 @@ async def root():
     return {
         "message": "AWS Architecture Generator API",
         "version": settings.VERSION,
-        "docs": "/docs"
+        "docs": app.docs_url
     }
 
 if __name__ == "__main__":
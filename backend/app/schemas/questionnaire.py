@@ -2,6 +2,13 @@ from pydantic import BaseModel, Field, validator
 from typing import List, Dict, Optional
 from enum import Enum
 
+# Spaces and underscores both become hyphens in resource names
+_PROJECT_CLEAN_TBL = str.maketrans({' ': '-', '_': '-'})
+
+def clean_project_name(project_name: str) -> str:
+    """Normalize a project name for AWS resource names in a single translate pass"""
+    return project_name.lower().translate(_PROJECT_CLEAN_TBL)
+
 class TrafficVolume(str, Enum):
     LOW = "low"
     MEDIUM = "medium"
@@ -63,6 +70,11 @@ class QuestionnaireRequest(BaseModel):
             raise ValueError('Project name cannot be empty')
         return v.strip()
 
+    @property
+    def project_name_clean(self) -> str:
+        """Project name normalized for AWS resource names; derived on access so it tracks project_name"""
+        return clean_project_name(self.project_name)
+
     @validator('description')
     def validate_description(cls, v):
         if not v.strip():
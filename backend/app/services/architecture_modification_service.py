@@ -1,5 +1,6 @@
 from sqlalchemy.orm import Session
-from typing import Dict, Any, Optional
+from types import MappingProxyType
+from typing import Dict, Any, Mapping, Optional, Tuple
 import uuid
 from datetime import datetime
 
@@ -7,6 +8,75 @@ from app.database import ProjectDB
 from app.schemas.questionnaire import QuestionnaireRequest
 from app.core.architecture_generator import ArchitectureGenerator
 
+def _trusted_questionnaire(data: Dict[str, Any]) -> QuestionnaireRequest:
+    """Rebuild a questionnaire we validated before persisting it, skipping re-validation"""
+    return QuestionnaireRequest.model_construct(**data)
+
+# Configuration options per service type; read-only and shared by every request
+_SERVICE_CONFIGURATIONS: Mapping[str, Mapping[str, Any]] = MappingProxyType({
+    'rds': MappingProxyType({
+        'instance_classes': (
+            'db.t3.micro', 'db.t3.small', 'db.t3.medium', 'db.t3.large',
+            'db.t3.xlarge', 'db.t3.2xlarge', 'db.m5.large', 'db.m5.xlarge',
+            'db.m5.2xlarge', 'db.m5.4xlarge', 'db.r5.large', 'db.r5.xlarge'
+        ),
+        'engines': ('mysql', 'postgresql', 'mariadb', 'oracle', 'sqlserver'),
+        'storage_range': MappingProxyType({'min': 20, 'max': 16384, 'step': 1}),
+        'storage_types': ('gp2', 'gp3', 'io1', 'io2')
+    }),
+    'ec2': MappingProxyType({
+        'instance_types': (
+            't3.micro', 't3.small', 't3.medium', 't3.large', 't3.xlarge',
+            'm5.large', 'm5.xlarge', 'm5.2xlarge', 'm5.4xlarge',
+            'c5.large', 'c5.xlarge', 'c5.2xlarge', 'c5.4xlarge',
+            'r5.large', 'r5.xlarge', 'r5.2xlarge', 'r5.4xlarge'
+        ),
+        'storage_types': ('gp2', 'gp3', 'io1', 'io2', 'st1', 'sc1'),
+        'storage_range': MappingProxyType({'min': 8, 'max': 16384, 'step': 1})
+    }),
+    'lambda': MappingProxyType({
+        'memory_range': MappingProxyType({'min': 128, 'max': 10240, 'step': 64}),
+        'timeout_range': MappingProxyType({'min': 1, 'max': 900, 'step': 1}),
+        'runtimes': (
+            'python3.9', 'python3.10', 'python3.11', 'nodejs18.x', 'nodejs20.x',
+            'java11', 'java17', 'dotnet6', 'go1.x', 'ruby3.2'
+        )
+    }),
+    's3': MappingProxyType({
+        'storage_classes': (
+            'STANDARD', 'STANDARD_IA', 'ONEZONE_IA', 'REDUCED_REDUNDANCY',
+            'GLACIER', 'DEEP_ARCHIVE', 'INTELLIGENT_TIERING'
+        ),
+        'encryption_options': ('AES256', 'aws:kms'),
+        'versioning_options': ('Enabled', 'Suspended')
+    }),
+    'cloudfront': MappingProxyType({
+        'price_classes': ('PriceClass_All', 'PriceClass_200', 'PriceClass_100'),
+        'caching_behaviors': ('CachingOptimized', 'CachingDisabled', 'CachingOptimizedForUncompressedObjects')
+    })
+})
+
+_EMPTY_CONFIGURATION: Mapping[str, Any] = MappingProxyType({})
+
+# (service type, configuration key) -> user preference key
+_PREF_KEY_LOOKUP: Mapping[Tuple[str, str], str] = MappingProxyType({
+    ('rds', 'storage_gb'): 'rds_storage_gb',
+    ('rds', 'instance_class'): 'rds_instance_class',
+    ('rds', 'engine'): 'rds_engine',
+    ('rds', 'multi_az'): 'rds_multi_az',
+    ('ec2', 'instance_type'): 'ec2_instance_type',
+    ('ec2', 'storage_size'): 'ec2_storage_size',
+    ('ec2', 'storage_type'): 'ec2_storage_type',
+    ('lambda', 'memory_mb'): 'lambda_memory_mb',
+    ('lambda', 'timeout'): 'lambda_timeout',
+    ('lambda', 'runtime'): 'lambda_runtime',
+    ('s3', 'storage_class'): 's3_storage_class',
+    ('s3', 'versioning'): 's3_versioning',
+    ('s3', 'encryption'): 's3_encryption',
+    ('cloudfront', 'price_class'): 'cloudfront_price_class',
+    ('cloudfront', 'caching_behavior'): 'cloudfront_caching',
+})
+
 class ArchitectureModificationService:
     def __init__(self, db: Session):
         self.db = db
@@ -44,7 +114,11 @@ class ArchitectureModificationService:
         
         # Regenerate architecture if requested or if significant changes were made
         if regenerate or questionnaire_updates:
-            questionnaire = QuestionnaireRequest(**project.questionnaire_data)
+            # Caller-supplied updates still go through full validation
+            if questionnaire_updates:
+                questionnaire = QuestionnaireRequest(**project.questionnaire_data)
+            else:
+                questionnaire = _trusted_questionnaire(project.questionnaire_data)
             generator = ArchitectureGenerator()
             
             # Generate new architecture with user preferences
@@ -84,44 +158,14 @@ class ArchitectureModificationService:
         if not project.user_preferences:
             project.user_preferences = {}
         
-        # Map service types to preference keys
-        service_preference_map = {
-            'rds': {
-                'storage_gb': 'rds_storage_gb',
-                'instance_class': 'rds_instance_class',
-                'engine': 'rds_engine',
-                'multi_az': 'rds_multi_az'
-            },
-            'ec2': {
-                'instance_type': 'ec2_instance_type',
-                'storage_size': 'ec2_storage_size',
-                'storage_type': 'ec2_storage_type'
-            },
-            'lambda': {
-                'memory_mb': 'lambda_memory_mb',
-                'timeout': 'lambda_timeout',
-                'runtime': 'lambda_runtime'
-            },
-            's3': {
-                'storage_class': 's3_storage_class',
-                'versioning': 's3_versioning',
-                'encryption': 's3_encryption'
-            },
-            'cloudfront': {
-                'price_class': 'cloudfront_price_class',
-                'caching_behavior': 'cloudfront_caching'
-            }
-        }
-        
-        if service_type in service_preference_map:
-            service_mapping = service_preference_map[service_type]
-            for config_key, value in configuration.items():
-                if config_key in service_mapping:
-                    preference_key = service_mapping[config_key]
-                    project.user_preferences[preference_key] = value
+        # Map configuration keys to preference keys
+        for config_key, value in configuration.items():
+            preference_key = _PREF_KEY_LOOKUP.get((service_type, config_key))
+            if preference_key is not None:
+                project.user_preferences[preference_key] = value
         
         # Regenerate architecture with new preferences
-        questionnaire = QuestionnaireRequest(**project.questionnaire_data)
+        questionnaire = _trusted_questionnaire(project.questionnaire_data)
         generator = ArchitectureGenerator()
         
         architecture_data = generator.generate_architecture(
@@ -175,7 +219,10 @@ class ArchitectureModificationService:
                 new_project.user_preferences.update(modifications['user_preferences'])
             
             # Regenerate architecture with modifications
-            questionnaire = QuestionnaireRequest(**new_project.questionnaire_data)
+            if 'questionnaire_updates' in modifications:
+                questionnaire = QuestionnaireRequest(**new_project.questionnaire_data)
+            else:
+                questionnaire = _trusted_questionnaire(new_project.questionnaire_data)
             generator = ArchitectureGenerator()
             
             architecture_data = generator.generate_architecture(
@@ -191,50 +238,6 @@ class ArchitectureModificationService:
         
         return new_project
 
-    def get_available_configurations(self, service_type: str) -> Dict[str, Any]:
+    def get_available_configurations(self, service_type: str) -> Mapping[str, Any]:
         """Get available configuration options for a service type"""
-        
-        configurations = {
-            'rds': {
-                'instance_classes': [
-                    'db.t3.micro', 'db.t3.small', 'db.t3.medium', 'db.t3.large',
-                    'db.t3.xlarge', 'db.t3.2xlarge', 'db.m5.large', 'db.m5.xlarge',
-                    'db.m5.2xlarge', 'db.m5.4xlarge', 'db.r5.large', 'db.r5.xlarge'
-                ],
-                'engines': ['mysql', 'postgresql', 'mariadb', 'oracle', 'sqlserver'],
-                'storage_range': {'min': 20, 'max': 16384, 'step': 1},
-                'storage_types': ['gp2', 'gp3', 'io1', 'io2']
-            },
-            'ec2': {
-                'instance_types': [
-                    't3.micro', 't3.small', 't3.medium', 't3.large', 't3.xlarge',
-                    'm5.large', 'm5.xlarge', 'm5.2xlarge', 'm5.4xlarge',
-                    'c5.large', 'c5.xlarge', 'c5.2xlarge', 'c5.4xlarge',
-                    'r5.large', 'r5.xlarge', 'r5.2xlarge', 'r5.4xlarge'
-                ],
-                'storage_types': ['gp2', 'gp3', 'io1', 'io2', 'st1', 'sc1'],
-                'storage_range': {'min': 8, 'max': 16384, 'step': 1}
-            },
-            'lambda': {
-                'memory_range': {'min': 128, 'max': 10240, 'step': 64},
-                'timeout_range': {'min': 1, 'max': 900, 'step': 1},
-                'runtimes': [
-                    'python3.9', 'python3.10', 'python3.11', 'nodejs18.x', 'nodejs20.x',
-                    'java11', 'java17', 'dotnet6', 'go1.x', 'ruby3.2'
-                ]
-            },
-            's3': {
-                'storage_classes': [
-                    'STANDARD', 'STANDARD_IA', 'ONEZONE_IA', 'REDUCED_REDUNDANCY',
-                    'GLACIER', 'DEEP_ARCHIVE', 'INTELLIGENT_TIERING'
-                ],
-                'encryption_options': ['AES256', 'aws:kms'],
-                'versioning_options': ['Enabled', 'Suspended']
-            },
-            'cloudfront': {
-                'price_classes': ['PriceClass_All', 'PriceClass_200', 'PriceClass_100'],
-                'caching_behaviors': ['CachingOptimized', 'CachingDisabled', 'CachingOptimizedForUncompressedObjects']
-            }
-        }
-        
-        return configurations.get(service_type, {})
\ No newline at end of file
+        return _SERVICE_CONFIGURATIONS.get(service_type, _EMPTY_CONFIGURATION)
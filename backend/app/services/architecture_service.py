@@ -1,3 +1,4 @@
+import asyncio
 from typing import Dict, List, Optional
 from app.schemas.questionnaire import QuestionnaireRequest
 from app.schemas.architecture import ArchitectureResponse
@@ -20,8 +21,9 @@ class ArchitectureService:
         # Use provided generator or default one
         arch_generator = generator or self.generator
         
-        # Generate the architecture
-        architecture = arch_generator.generate(questionnaire)
+        # Generate the architecture on a worker thread; template rendering is CPU-bound and
+        # would otherwise stall every other request on the event loop
+        architecture = await asyncio.to_thread(arch_generator.generate, questionnaire)
         
         # Store in memory (replace with database in production)
         self.architectures_storage[architecture.id] = architecture
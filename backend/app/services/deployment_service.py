@@ -6,12 +6,13 @@ import threading
 import asyncio
 from datetime import datetime
 from typing import Optional
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, undefer_group
 
 from app.database import DeploymentDB
 from app.models.aws_account import DeploymentRequest, DeploymentResponse, DestroyRequest
 from app.services.aws_account_service import AWSAccountService
 from app.services.project_service import ProjectService
+from app.schemas.questionnaire import clean_project_name
 
 class DeploymentService:
     """Service for deploying infrastructure using Terraform or CloudFormation"""
@@ -114,7 +115,7 @@ class DeploymentService:
     
     def get_deployment_status(self, db: Session, deployment_id: str) -> Optional[DeploymentResponse]:
         """Get deployment status"""
-        deployment = db.query(DeploymentDB).filter(DeploymentDB.id == deployment_id).first()
+        deployment = db.query(DeploymentDB).options(undefer_group("logs")).filter(DeploymentDB.id == deployment_id).first()
         if not deployment:
             return None
         
@@ -242,7 +243,7 @@ class DeploymentService:
     
     def list_deployments(self, db: Session, project_id: str) -> list:
         """List all deployments for a project"""
-        deployments = db.query(DeploymentDB).filter(
+        deployments = db.query(DeploymentDB).options(undefer_group("logs")).filter(
             DeploymentDB.project_id == project_id
         ).order_by(DeploymentDB.created_at.desc()).all()
         
@@ -623,7 +624,7 @@ class DeploymentService:
         import json
         
         # Clean project name for AWS resource naming
-        project_name_clean = project.project_name.lower().replace(' ', '-').replace('_', '-')
+        project_name_clean = clean_project_name(project.project_name)
         
         # Start with basic project variables
         tfvars = f'''# Terraform variables for project: {project.project_name}
@@ -0,0 +1,80 @@
+import asyncio
+from pathlib import Path
+
+import httpx
+import pytest
+
+from app.core.template_generator import TemplateGenerator
+from app.schemas.questionnaire import QuestionnaireRequest
+
+GOLDEN_DIR = Path(__file__).parent / "golden"
+
+# One high-security containerised workload and one basic serverless workload; between
+# them they cover the compliance, RDS, ALB/ECS and Lambda/DynamoDB branches
+QUESTIONNAIRES = {
+    "containers_high": {
+        "project_name": "Demo Shop",
+        "description": "An online storefront for testing",
+        "traffic_volume": "medium",
+        "data_sensitivity": "confidential",
+        "compute_preference": "containers",
+        "database_type": "sql",
+        "storage_needs": "moderate",
+        "geographical_reach": "single_region",
+        "budget_range": "medium",
+        "compliance_requirements": ["hipaa", "pci"],
+    },
+    "serverless_basic": {
+        "project_name": "blog",
+        "description": "A small serverless blog",
+        "traffic_volume": "low",
+        "data_sensitivity": "public",
+        "compute_preference": "serverless",
+        "database_type": "nosql",
+        "storage_needs": "minimal",
+        "geographical_reach": "single_region",
+        "budget_range": "startup",
+    },
+}
+
+SERVICES = {
+    "containers_high": {
+        "compute": "Amazon ECS/Fargate",
+        "database": "Amazon RDS",
+        "storage": "Amazon S3",
+        "load_balancer": "Application Load Balancer",
+        "monitoring": "Amazon CloudWatch",
+    },
+    "serverless_basic": {
+        "compute": "AWS Lambda",
+        "database": "Amazon DynamoDB",
+        "storage": "Amazon S3",
+        "monitoring": "Amazon CloudWatch",
+    },
+}
+
+@pytest.fixture
+def make_questionnaire():
+    """Build a QuestionnaireRequest from one of the named cases, with optional overrides"""
+    def _make(case: str = "containers_high", **overrides) -> QuestionnaireRequest:
+        return QuestionnaireRequest(**{**QUESTIONNAIRES[case], **overrides})
+    return _make
+
+@pytest.fixture
+def template_generator():
+    """A TemplateGenerator whose class-level caches start and end empty"""
+    TemplateGenerator.clear_caches()
+    yield TemplateGenerator()
+    TemplateGenerator.clear_caches()
+
+@pytest.fixture
+def api_request():
+    """Send a request to the app in-process and return the response with its body read"""
+    from app.main import app
+
+    async def _request(method: str, url: str, **kwargs) -> httpx.Response:
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as client:
+            return await client.request(method, url, **kwargs)
+
+    return lambda method, url, **kwargs: asyncio.run(_request(method, url, **kwargs))
@@ -0,0 +1,1612 @@
+# Terraform configuration for demo-shop
+# Generated with security best practices
+
+terraform {
+  required_version = ">= 1.5"
+  required_providers {
+    aws = {
+      source  = "hashicorp/aws"
+      version = "~> 5.0"
+    }
+    random = {
+      source  = "hashicorp/random"
+      version = "~> 3.1"
+    }
+  }
+}
+
+provider "aws" {
+  region = var.aws_region
+  
+  default_tags {
+    tags = {
+      Project     = var.project_name
+      Environment = var.environment
+      ManagedBy   = "Terraform"
+      CreatedBy   = "AWS-Architecture-Generator"
+    }
+  }
+}
+
+# Variables
+variable "aws_region" {
+  description = "AWS region"
+  type        = string
+  default     = "us-west-2"
+}
+
+variable "environment" {
+  description = "Environment name (dev, staging, prod)"
+  type        = string
+  default     = "dev"
+  
+  validation {
+    condition     = contains(["dev", "staging", "prod"], var.environment)
+    error_message = "Environment must be dev, staging, or prod."
+  }
+}
+
+variable "project_name" {
+  description = "Project name"
+  type        = string
+}
+
+variable "enable_deletion_protection" {
+  description = "Enable deletion protection for critical resources"
+  type        = bool
+  default     = true
+}
+
+variable "services" {
+  description = "Map of services to enable"
+  type        = map(string)
+  default     = {}
+}
+
+variable "enable_bastion" {
+  description = "Enable bastion host for secure access"
+  type        = bool
+  default     = false
+}
+
+variable "allowed_ssh_cidrs" {
+  description = "CIDR blocks allowed for SSH access"
+  type        = list(string)
+  default     = ["10.0.0.0/8"]
+}
+
+variable "enable_scp" {
+  description = "Enable Service Control Policies"
+  type        = bool
+  default     = false
+}
+
+# Data Sources
+data "aws_availability_zones" "available" {
+  state = "available"
+}
+
+data "aws_caller_identity" "current" {}
+
+data "aws_region" "current" {}
+
+# Random ID for unique resource naming
+resource "random_id" "suffix" {
+  byte_length = 4
+}
+
+# KMS Key for encryption
+resource "aws_kms_key" "main" {
+  description             = "KMS key for demo-shop"
+  deletion_window_in_days = 7
+  enable_key_rotation     = true
+  
+  policy = jsonencode({
+    Version = "2012-10-17"
+    Statement = [
+      {
+        Sid    = "Enable IAM User Permissions"
+        Effect = "Allow"
+        Principal = {
+          AWS = "arn:aws:iam::${data.aws_caller_identity.current.account_id}:root"
+        }
+        Action   = "kms:*"
+        Resource = "*"
+      }
+    ]
+  })
+  
+  tags = {
+    Name = "${var.project_name}-kms-key"
+  }
+}
+
+resource "aws_kms_alias" "main" {
+  name          = "alias/${var.project_name}-key-${random_id.suffix.hex}"
+  target_key_id = aws_kms_key.main.key_id
+}
+
+# Secrets Manager
+resource "aws_secretsmanager_secret" "db_credentials" {
+  name                    = "${var.project_name}-db-credentials"
+  description             = "Database credentials for demo-shop"
+  kms_key_id              = aws_kms_key.main.arn
+  recovery_window_in_days = 7
+  
+  tags = {
+    Name = "${var.project_name}-db-secret"
+  }
+}
+
+resource "aws_secretsmanager_secret_version" "db_credentials" {
+  secret_id = aws_secretsmanager_secret.db_credentials.id
+  secret_string = jsonencode({
+    username = "admin"
+    password = random_password.db_password.result
+  })
+}
+
+resource "random_password" "db_password" {
+  length  = 32
+  special = true
+}
+
+# Use Default VPC and its existing resources
+data "aws_vpc" "main" {
+  default = true
+}
+
+# Get default subnets (already exist in default VPC)
+data "aws_subnets" "default" {
+  filter {
+    name   = "vpc-id"
+    values = [data.aws_vpc.main.id]
+  }
+}
+
+data "aws_subnet" "default" {
+  count = length(data.aws_subnets.default.ids)
+  id    = data.aws_subnets.default.ids[count.index]
+}
+
+# Get existing internet gateway for default VPC
+data "aws_internet_gateway" "default" {
+  filter {
+    name   = "attachment.vpc-id"
+    values = [data.aws_vpc.main.id]
+  }
+}
+
+# Get existing route table for default VPC
+data "aws_route_table" "default" {
+  vpc_id = data.aws_vpc.main.id
+  filter {
+    name   = "association.main"
+    values = ["true"]
+  }
+}
+
+# Use default subnets for both public and private
+locals {
+  # Use existing default subnets (they're all public by default)
+  public_subnet_ids = data.aws_subnets.default.ids
+  private_subnet_ids = data.aws_subnets.default.ids  # Same as public for simplicity
+}
+
+
+# Enhanced Security Groups with Least Privilege Access
+# Generated for security level: high
+
+# Web tier security group
+resource "aws_security_group" "web_tier" {
+  name_prefix = "demo-shop-web-"
+  description = "Security group for web tier with enhanced controls"
+  vpc_id      = data.aws_vpc.main.id
+
+  # HTTPS traffic
+  ingress {
+    description = "HTTPS"
+    from_port   = 443
+    to_port     = 443
+    protocol    = "tcp"
+    cidr_blocks = ["0.0.0.0/0"]
+  }
+
+  # HTTP traffic (redirect to HTTPS)
+  ingress {
+    description = "HTTP"
+    from_port   = 80
+    to_port     = 80
+    protocol    = "tcp"
+    cidr_blocks = ["0.0.0.0/0"]
+  }
+
+  # Outbound traffic
+  egress {
+    from_port   = 0
+    to_port     = 0
+    protocol    = "-1"
+    cidr_blocks = ["0.0.0.0/0"]
+  }
+
+  tags = {
+    Name        = "demo-shop-web-sg"
+    Environment = var.environment
+    Tier        = "web"
+  }
+}
+
+# Application tier security group
+resource "aws_security_group" "app_tier" {
+  name_prefix = "demo-shop-app-"
+  description = "Security group for application tier"
+  vpc_id      = data.aws_vpc.main.id
+
+  # Allow traffic from web tier
+  ingress {
+    description     = "App traffic from web tier"
+    from_port       = 8080
+    to_port         = 8080
+    protocol        = "tcp"
+    security_groups = [aws_security_group.web_tier.id]
+  }
+
+  # Allow traffic from ALB (using VPC CIDR to avoid circular dependency)
+  ingress {
+    description = "App traffic from ALB"
+    from_port   = 80
+    to_port     = 80
+    protocol    = "tcp"
+    cidr_blocks = [data.aws_vpc.main.cidr_block]
+  }
+
+  # Outbound traffic
+  egress {
+    from_port   = 0
+    to_port     = 0
+    protocol    = "-1"
+    cidr_blocks = ["0.0.0.0/0"]
+  }
+
+  tags = {
+    Name        = "demo-shop-app-sg"
+    Environment = var.environment
+    Tier        = "application"
+  }
+}
+
+# Database tier security group
+resource "aws_security_group" "db_tier" {
+  name_prefix = "demo-shop-db-"
+  description = "Security group for database tier"
+  vpc_id      = data.aws_vpc.main.id
+
+  # MySQL/Aurora
+  ingress {
+    description     = "MySQL/Aurora"
+    from_port       = 3306
+    to_port         = 3306
+    protocol        = "tcp"
+    security_groups = [aws_security_group.app_tier.id]
+  }
+
+  # PostgreSQL
+  ingress {
+    description     = "PostgreSQL"
+    from_port       = 5432
+    to_port         = 5432
+    protocol        = "tcp"
+    security_groups = [aws_security_group.app_tier.id]
+  }
+
+  # Redis
+  ingress {
+    description     = "Redis"
+    from_port       = 6379
+    to_port         = 6379
+    protocol        = "tcp"
+    security_groups = [aws_security_group.app_tier.id]
+  }
+
+  # No outbound rules - databases shouldn't initiate connections
+  tags = {
+    Name        = "demo-shop-db-sg"
+    Environment = var.environment
+    Tier        = "database"
+  }
+}
+
+# ALB security group
+resource "aws_security_group" "alb" {
+  name_prefix = "demo-shop-alb-"
+  description = "Security group for Application Load Balancer"
+  vpc_id      = data.aws_vpc.main.id
+
+  # HTTPS traffic
+  ingress {
+    description = "HTTPS"
+    from_port   = 443
+    to_port     = 443
+    protocol    = "tcp"
+    cidr_blocks = ["0.0.0.0/0"]
+  }
+
+  # HTTP traffic
+  ingress {
+    description = "HTTP"
+    from_port   = 80
+    to_port     = 80
+    protocol    = "tcp"
+    cidr_blocks = ["0.0.0.0/0"]
+  }
+
+  # Outbound traffic
+  egress {
+    from_port   = 0
+    to_port     = 0
+    protocol    = "-1"
+    cidr_blocks = ["0.0.0.0/0"]
+  }
+
+  tags = {
+    Name        = "demo-shop-alb-sg"
+    Environment = var.environment
+    Type        = "load-balancer"
+  }
+}
+
+
+# Lambda security group (if using VPC Lambda)
+resource "aws_security_group" "lambda" {
+  count       = length(keys(var.services)) > 0 && contains(keys(var.services), "lambda") ? 1 : 0
+  name_prefix = "demo-shop-lambda-"
+  description = "Security group for Lambda functions"
+  vpc_id      = data.aws_vpc.main.id
+
+  # Outbound traffic for Lambda
+  egress {
+    from_port   = 443
+    to_port     = 443
+    protocol    = "tcp"
+    cidr_blocks = ["0.0.0.0/0"]
+    description = "HTTPS outbound"
+  }
+
+  egress {
+    from_port       = 3306
+    to_port         = 3306
+    protocol        = "tcp"
+    security_groups = [aws_security_group.db_tier.id]
+    description     = "MySQL access"
+  }
+
+  egress {
+    from_port       = 5432
+    to_port         = 5432
+    protocol        = "tcp"
+    security_groups = [aws_security_group.db_tier.id]
+    description     = "PostgreSQL access"
+  }
+
+  tags = {
+    Name        = "demo-shop-lambda-sg"
+    Environment = var.environment
+    Type        = "lambda"
+  }
+}
+
+# Bastion host security group (for secure access)
+resource "aws_security_group" "bastion" {
+  count       = try(var.enable_bastion, false) ? 1 : 0
+  name_prefix = "demo-shop-bastion-"
+  description = "Security group for bastion host"
+  vpc_id      = data.aws_vpc.main.id
+
+  # SSH access from specific IP ranges
+  ingress {
+    description = "SSH from office"
+    from_port   = 22
+    to_port     = 22
+    protocol    = "tcp"
+    cidr_blocks = try(var.allowed_ssh_cidrs, ["10.0.0.0/8"])
+  }
+
+  # Outbound SSH to private subnets
+  egress {
+    description = "SSH to private instances"
+    from_port   = 22
+    to_port     = 22
+    protocol    = "tcp"
+    cidr_blocks = [for subnet in data.aws_subnet.default : subnet.cidr_block]
+  }
+
+  tags = {
+    Name        = "demo-shop-bastion-sg"
+    Environment = var.environment
+    Type        = "bastion"
+  }
+}
+
+
+
+# Network ACLs - Using Default VPC's Existing Network ACLs
+# Default VPC already has a default network ACL that allows all traffic
+# For production use, consider adding custom network ACL rules
+# Security Level: high
+
+# Note: Default VPC subnets already have network ACL associations
+# Custom network ACLs are disabled to avoid conflicts with existing associations
+
+
+
+# Enhanced AWS WAF Configuration
+
+# AWS managed rule groups attached to the Web ACL; trim per environment without regenerating
+variable "waf_managed_rules" {
+  description = "AWS managed rule groups evaluated by the Web ACL"
+  type = list(object({
+    name           = string
+    priority       = number
+    rule_set       = string
+    metric_suffix  = string
+    excluded_rules = list(string)
+  }))
+  default = [
+    # Core Rule Set (OWASP Top 10)
+    {
+      name           = "AWSManagedRulesCore"
+      priority       = 1
+      rule_set       = "AWSManagedRulesCommonRuleSet"
+      metric_suffix  = "core-rules"
+      excluded_rules = ["SizeRestrictions_BODY", "GenericRFI_BODY"]
+    },
+    # Known Bad Inputs
+    {
+      name           = "AWSManagedRulesKnownBadInputs"
+      priority       = 2
+      rule_set       = "AWSManagedRulesKnownBadInputsRuleSet"
+      metric_suffix  = "bad-inputs"
+      excluded_rules = []
+    },
+    # SQL Database Protection
+    {
+      name           = "AWSManagedRulesSQLi"
+      priority       = 3
+      rule_set       = "AWSManagedRulesSQLiRuleSet"
+      metric_suffix  = "sqli"
+      excluded_rules = []
+    },
+    # Linux Operating System Protection
+    {
+      name           = "AWSManagedRulesLinux"
+      priority       = 4
+      rule_set       = "AWSManagedRulesLinuxRuleSet"
+      metric_suffix  = "linux"
+      excluded_rules = []
+    },
+    # Windows Operating System Protection
+    {
+      name           = "AWSManagedRulesWindows"
+      priority       = 5
+      rule_set       = "AWSManagedRulesWindowsRuleSet"
+      metric_suffix  = "windows"
+      excluded_rules = []
+    },
+    # IP Reputation
+    {
+      name           = "IPReputationRule"
+      priority       = 8
+      rule_set       = "AWSManagedRulesAmazonIpReputationList"
+      metric_suffix  = "ip-reputation"
+      excluded_rules = []
+    }
+  ]
+}
+
+# WAF Web ACL for comprehensive web application protection
+resource "aws_wafv2_web_acl" "main" {
+  name        = "demo-shop-waf"
+  description = "Enhanced WAF protection for demo-shop"
+  scope       = "REGIONAL"
+  
+  default_action {
+    allow {}
+  }
+  
+  # AWS Managed Rules - one rule per entry in var.waf_managed_rules
+  dynamic "rule" {
+    for_each = var.waf_managed_rules
+    content {
+      name     = rule.value.name
+      priority = rule.value.priority
+      
+      override_action {
+        none {}
+      }
+      
+      statement {
+        managed_rule_group_statement {
+          name        = rule.value.rule_set
+          vendor_name = "AWS"
+          
+          # Exclude rules that might cause false positives
+          dynamic "excluded_rule" {
+            for_each = rule.value.excluded_rules
+            content {
+              name = excluded_rule.value
+            }
+          }
+        }
+      }
+      
+      visibility_config {
+        cloudwatch_metrics_enabled = true
+        metric_name                = "demo-shop-waf-${rule.value.metric_suffix}"
+        sampled_requests_enabled   = true
+      }
+    }
+  }
+  
+  # Rate Limiting Rule
+  rule {
+    name     = "RateLimitRule"
+    priority = 6
+    
+    action {
+      block {}
+    }
+    
+    statement {
+      rate_based_statement {
+        limit              = 2000
+        aggregate_key_type = "IP"
+        
+        scope_down_statement {
+          geo_match_statement {
+            country_codes = ["US", "CA", "GB", "DE", "FR", "AU", "JP"]
+          }
+        }
+      }
+    }
+    
+    visibility_config {
+      cloudwatch_metrics_enabled = true
+      metric_name                = "demo-shop-waf-rate-limit"
+      sampled_requests_enabled   = true
+    }
+  }
+  
+  # Geographic Blocking Rule (block high-risk countries)
+  rule {
+    name     = "GeoBlockRule"
+    priority = 7
+    
+    action {
+      block {}
+    }
+    
+    statement {
+      geo_match_statement {
+        country_codes = ["CN", "RU", "KP", "IR"]  # Customize based on your needs
+      }
+    }
+    
+    visibility_config {
+      cloudwatch_metrics_enabled = true
+      metric_name                = "demo-shop-waf-geo-block"
+      sampled_requests_enabled   = true
+    }
+  }
+  
+  # Bot Control Rule (if security level is high)
+  dynamic "rule" {
+    for_each = var.security_level == "high" ? [1] : []
+    content {
+      name     = "BotControlRule"
+      priority = 9
+      
+      override_action {
+        none {}
+      }
+      
+      statement {
+        managed_rule_group_statement {
+          name        = "AWSManagedRulesBotControlRuleSet"
+          vendor_name = "AWS"
+        }
+      }
+      
+      visibility_config {
+        cloudwatch_metrics_enabled = true
+        metric_name                = "demo-shop-waf-bot-control"
+        sampled_requests_enabled   = true
+      }
+    }
+  }
+  
+  tags = {
+    Name        = "demo-shop-waf"
+    Environment = var.environment
+    Purpose     = "web-application-firewall"
+  }
+  
+  visibility_config {
+    cloudwatch_metrics_enabled = true
+    metric_name                = "demo-shop-waf"
+    sampled_requests_enabled   = true
+  }
+}
+
+# WAF Logging Configuration
+resource "aws_wafv2_web_acl_logging_configuration" "main" {
+  resource_arn            = aws_wafv2_web_acl.main.arn
+  log_destination_configs = [aws_cloudwatch_log_group.waf_logs.arn]
+  
+  redacted_fields {
+    single_header {
+      name = "authorization"
+    }
+  }
+  
+  redacted_fields {
+    single_header {
+      name = "cookie"
+    }
+  }
+  
+  depends_on = [aws_cloudwatch_log_group.waf_logs]
+}
+
+# CloudWatch Log Group for WAF Logs
+resource "aws_cloudwatch_log_group" "waf_logs" {
+  name              = "/aws/wafv2/demo-shop"
+  retention_in_days = 30
+  
+  tags = {
+    Name        = "demo-shop-waf-logs"
+    Environment = var.environment
+  }
+}
+
+# WAF IP Set for Allowed IPs (can be customized)
+resource "aws_wafv2_ip_set" "allowed_ips" {
+  name               = "demo-shop-allowed-ips"
+  description        = "Allowed IP addresses for demo-shop"
+  scope              = "REGIONAL"
+  ip_address_version = "IPV4"
+  
+  addresses = var.allowed_ip_addresses
+  
+  tags = {
+    Name        = "demo-shop-allowed-ips"
+    Environment = var.environment
+  }
+}
+
+# WAF IP Set for Blocked IPs
+resource "aws_wafv2_ip_set" "blocked_ips" {
+  name               = "demo-shop-blocked-ips"
+  description        = "Blocked IP addresses for demo-shop"
+  scope              = "REGIONAL"
+  ip_address_version = "IPV4"
+  
+  addresses = var.blocked_ip_addresses
+  
+  tags = {
+    Name        = "demo-shop-blocked-ips"
+    Environment = var.environment
+  }
+}
+
+# CloudWatch Dashboard for WAF Metrics
+resource "aws_cloudwatch_dashboard" "waf_dashboard" {
+  dashboard_name = "demo-shop-waf-dashboard"
+  
+  dashboard_body = jsonencode({
+    widgets = [
+      {
+        type   = "metric"
+        x      = 0
+        y      = 0
+        width  = 12
+        height = 6
+        
+        properties = {
+          metrics = [
+            ["AWS/WAFV2", "AllowedRequests", "WebACL", "demo-shop-waf", "Region", "us-east-1", "Rule", "ALL"],
+            [".", "BlockedRequests", ".", ".", ".", ".", ".", "."]
+          ]
+          view    = "timeSeries"
+          stacked = false
+          region  = "us-east-1"
+          title   = "WAF Requests Overview"
+          period  = 300
+        }
+      },
+      {
+        type   = "metric"
+        x      = 0
+        y      = 6
+        width  = 12
+        height = 6
+        
+        properties = {
+          metrics = [
+            ["AWS/WAFV2", "BlockedRequests", "WebACL", "demo-shop-waf", "Region", "us-east-1", "Rule", "RateLimitRule"],
+            [".", ".", ".", ".", ".", ".", ".", "GeoBlockRule"],
+            [".", ".", ".", ".", ".", ".", ".", "IPReputationRule"]
+          ]
+          view    = "timeSeries"
+          stacked = false
+          region  = "us-east-1"
+          title   = "WAF Rule Blocks"
+          period  = 300
+        }
+      }
+    ]
+  })
+}
+
+
+# Application Load Balancer
+resource "aws_lb" "main" {
+  name               = "${var.project_name}-alb-${random_id.suffix.hex}"
+  internal           = false
+  load_balancer_type = "application"
+  security_groups    = [aws_security_group.alb.id]
+  subnets            = local.public_subnet_ids
+  
+  enable_deletion_protection = var.enable_deletion_protection
+  
+  associate_web_acl_arn = aws_wafv2_web_acl.main.arn
+  
+  tags = {
+    Name = "${var.project_name}-alb"
+  }
+}
+
+resource "aws_lb_target_group" "app" {
+  name     = "${var.project_name}-tg-${random_id.suffix.hex}"
+  port     = 8080
+  protocol = "HTTP"
+  vpc_id   = data.aws_vpc.main.id
+  
+  health_check {
+    enabled             = true
+    healthy_threshold   = 2
+    interval            = 30
+    matcher             = "200"
+    path                = "/health"
+    port                = "traffic-port"
+    protocol            = "HTTP"
+    timeout             = 5
+    unhealthy_threshold = 2
+  }
+  
+  tags = {
+    Name = "${var.project_name}-tg"
+  }
+}
+
+resource "aws_lb_listener" "app" {
+  load_balancer_arn = aws_lb.main.arn
+  port              = "80"
+  protocol          = "HTTP"
+  
+  default_action {
+    type             = "forward"
+    target_group_arn = aws_lb_target_group.app.arn
+  }
+}
+
+# Launch Template
+resource "aws_launch_template" "app" {
+  name_prefix   = "${var.project_name}-"
+  image_id      = data.aws_ami.amazon_linux.id
+  instance_type = "t3.micro"
+  
+  vpc_security_group_ids = [aws_security_group.app_tier.id]
+  
+  
+  
+  iam_instance_profile {
+    name = aws_iam_instance_profile.app.name
+  }
+  
+  block_device_mappings {
+    device_name = "/dev/xvda"
+    ebs {
+      volume_size = 20
+      volume_type = "gp3"
+      encrypted   = true
+      kms_key_id = aws_kms_key.main.arn
+      delete_on_termination = true
+    }
+  }
+  
+  metadata_options {
+    http_endpoint = "enabled"
+    http_tokens   = "required"
+    http_put_response_hop_limit = 1
+  }
+  
+  tag_specifications {
+    resource_type = "instance"
+    tags = {
+      Name = "${var.project_name}-instance"
+    }
+  }
+  
+  user_data = base64encode(<<-EOF
+#!/bin/bash
+yum update -y
+yum install -y amazon-cloudwatch-agent
+echo "Project: ${var.project_name}" > /home/ec2-user/project_info.txt
+EOF
+  )
+}
+
+# Auto Scaling Group
+resource "aws_autoscaling_group" "app" {
+  name                = "${var.project_name}-asg-${random_id.suffix.hex}"
+  vpc_zone_identifier = local.private_subnet_ids
+  target_group_arns   = [aws_lb_target_group.app.arn]
+  health_check_type   = "ELB"
+  health_check_grace_period = 300
+  
+  min_size         = 1
+  max_size         = 3
+  desired_capacity = 2
+  
+  launch_template {
+    id      = aws_launch_template.app.id
+    version = "$Latest"
+  }
+  
+  tag {
+    key                 = "Name"
+    value               = "${var.project_name}-asg"
+    propagate_at_launch = false
+  }
+}
+
+# IAM Role for EC2 instances
+resource "aws_iam_role" "app" {
+  name = "${var.project_name}-app-role-${random_id.suffix.hex}"
+  
+  assume_role_policy = jsonencode({
+    Version = "2012-10-17"
+    Statement = [
+      {
+        Action = "sts:AssumeRole"
+        Effect = "Allow"
+        Principal = {
+          Service = "ec2.amazonaws.com"
+        }
+      }
+    ]
+  })
+}
+
+resource "aws_iam_instance_profile" "app" {
+  name = "${var.project_name}-app-profile-${random_id.suffix.hex}"
+  role = aws_iam_role.app.name
+}
+
+resource "aws_iam_role_policy" "app" {
+  name = "${var.project_name}-app-policy-${random_id.suffix.hex}"
+  role = aws_iam_role.app.id
+  
+  policy = jsonencode({
+    Version = "2012-10-17"
+    Statement = [
+      {
+        Effect = "Allow"
+        Action = [
+          "s3:GetObject",
+          "s3:PutObject",
+          "s3:DeleteObject"
+        ]
+        Resource = "${aws_s3_bucket.main.arn}/*"
+      }
+    ]
+  })
+}
+
+# AMI Data Source
+data "aws_ami" "amazon_linux" {
+  most_recent = true
+  owners      = ["amazon"]
+  
+  filter {
+    name   = "name"
+    values = ["amzn2-ami-hvm-*-x86_64-gp2"]
+  }
+}
+
+# RDS Database
+resource "aws_db_subnet_group" "main" {
+  name       = "${var.project_name}-db-subnet-group-${random_id.suffix.hex}"
+  subnet_ids = local.private_subnet_ids
+  
+  tags = {
+    Name = "${var.project_name}-db-subnet-group"
+  }
+}
+
+resource "aws_db_instance" "main" {
+  identifier = "${var.project_name}-database-${random_id.suffix.hex}"
+  
+  engine         = "mysql"
+  engine_version = "8.0"
+  instance_class = "db.t3.micro"
+  
+  allocated_storage     = 20
+  max_allocated_storage = 100
+  storage_type          = "gp2"
+  storage_encrypted     = true
+  kms_key_id = aws_kms_key.main.arn
+  
+  db_name  = "${replace(var.project_name, "-", "")}"
+  username = "admin"
+  manage_master_user_password = true
+  master_user_secret_kms_key_id = aws_kms_key.main.arn
+  
+  vpc_security_group_ids = [aws_security_group.db_tier.id]
+  db_subnet_group_name   = aws_db_subnet_group.main.name
+  
+  backup_retention_period = 7
+  backup_window          = "03:00-04:00"
+  maintenance_window     = "sun:04:00-sun:05:00"
+  
+  multi_az               = true
+  publicly_accessible    = false
+  
+  skip_final_snapshot = false
+  final_snapshot_identifier = "${var.project_name}-final-snapshot-${random_id.suffix.hex}"
+  
+  deletion_protection = var.enable_deletion_protection
+  
+  enabled_cloudwatch_logs_exports = ["error", "general", "slow-query"]
+  
+  tags = {
+    Name = "${var.project_name}-database"
+  }
+}
+
+# S3 Bucket
+resource "aws_s3_bucket" "main" {
+  bucket = "${var.project_name}-storage-${random_id.bucket_suffix.hex}"
+  
+  tags = {
+    Name = "${var.project_name}-storage"
+  }
+}
+
+resource "random_id" "bucket_suffix" {
+  byte_length = 4
+}
+
+# S3 Bucket Configuration
+resource "aws_s3_bucket_versioning" "main" {
+  bucket = aws_s3_bucket.main.id
+  versioning_configuration {
+    status = "Enabled"
+  }
+}
+
+resource "aws_s3_bucket_server_side_encryption_configuration" "main" {
+  bucket = aws_s3_bucket.main.id
+  
+  rule {
+    apply_server_side_encryption_by_default {
+      kms_master_key_id = aws_kms_key.main.arn
+      sse_algorithm     = "aws:kms"
+    }
+    bucket_key_enabled = true
+  }
+}
+
+resource "aws_s3_bucket_public_access_block" "main" {
+  bucket = aws_s3_bucket.main.id
+  
+  block_public_acls       = true
+  block_public_policy     = true
+  ignore_public_acls      = true
+  restrict_public_buckets = true
+}
+
+resource "aws_s3_bucket_lifecycle_configuration" "main" {
+  bucket = aws_s3_bucket.main.id
+  
+  rule {
+    id     = "lifecycle"
+    status = "Enabled"
+    
+    expiration {
+      days = 90
+    }
+    
+    noncurrent_version_expiration {
+      noncurrent_days = 30
+    }
+  }
+}
+
+resource "aws_s3_bucket_logging" "main" {
+  bucket = aws_s3_bucket.main.id
+  target_bucket = aws_s3_bucket.logs.id
+  target_prefix = "access-logs/"
+}
+
+# Amazon GuardDuty - Threat Detection
+resource "aws_guardduty_detector" "main" {
+  enable = true
+  
+  datasources {
+    s3_logs {
+      enable = true
+    }
+    kubernetes {
+      audit_logs {
+        enable = true
+      }
+    }
+    malware_protection {
+      scan_ec2_instance_with_findings {
+        ebs_volumes {
+          enable = true
+        }
+      }
+    }
+  }
+  
+  tags = {
+    Name = "${var.project_name}-guardduty"
+  }
+}
+
+# GuardDuty S3 Protection
+resource "aws_guardduty_s3_detector" "main" {
+  detector_id = aws_guardduty_detector.main.id
+  enable      = true
+}
+
+# AWS Security Hub - Central Security Dashboard
+resource "aws_securityhub_account" "main" {
+  enable_default_standards = true
+}
+
+# Security Standards Subscriptions
+resource "aws_securityhub_standards_subscription" "aws_foundational" {
+  standards_arn = "arn:aws:securityhub:::ruleset/finding-format/aws-foundational-security-standard/v/1.0.0"
+  depends_on    = [aws_securityhub_account.main]
+}
+
+resource "aws_securityhub_standards_subscription" "cis" {
+  standards_arn = "arn:aws:securityhub:::ruleset/finding-format/cis-aws-foundations-benchmark/v/1.2.0"
+  depends_on    = [aws_securityhub_account.main]
+}
+
+resource "aws_securityhub_standards_subscription" "pci_dss" {
+  standards_arn = "arn:aws:securityhub:::ruleset/finding-format/pci-dss/v/3.2.1"
+  depends_on    = [aws_securityhub_account.main]
+}
+
+# AWS Config - Compliance Monitoring
+resource "aws_config_configuration_recorder" "main" {
+  name     = "${var.project_name}-config-recorder"
+  role_arn = aws_iam_role.config.arn
+  
+  recording_group {
+    all_supported                 = true
+    include_global_resource_types = true
+  }
+}
+
+resource "aws_config_delivery_channel" "main" {
+  name           = "${var.project_name}-config-delivery-channel"
+  s3_bucket_name = aws_s3_bucket.config.bucket
+  depends_on     = [aws_config_configuration_recorder.main]
+}
+
+# Config S3 Bucket
+resource "aws_s3_bucket" "config" {
+  bucket        = "${var.project_name}-config-${random_id.config_suffix.hex}"
+  force_destroy = true
+  
+  tags = {
+    Name = "${var.project_name}-config-bucket"
+  }
+}
+
+# Config IAM Role
+resource "aws_iam_role" "config" {
+  name = "${var.project_name}-config-role"
+  
+  assume_role_policy = jsonencode({
+    Version = "2012-10-17"
+    Statement = [
+      {
+        Action = "sts:AssumeRole"
+        Effect = "Allow"
+        Principal = {
+          Service = "config.amazonaws.com"
+        }
+      }
+    ]
+  })
+}
+
+resource "aws_iam_role_policy_attachment" "config" {
+  role       = aws_iam_role.config.name
+  policy_arn = "arn:aws:iam::aws:policy/service-role/ConfigRole"
+}
+
+# Amazon Inspector - Vulnerability Assessments
+resource "aws_inspector2_enabler" "main" {
+  account_ids    = [data.aws_caller_identity.current.account_id]
+  resource_types = ["EC2", "ECR"]
+}
+
+# Inspector Assessment Target
+resource "aws_inspector_assessment_target" "main" {
+  name = "${var.project_name}-assessment-target"
+}
+
+# Inspector Assessment Template
+resource "aws_inspector_assessment_template" "main" {
+  name       = "${var.project_name}-assessment-template"
+  target_arn = aws_inspector_assessment_target.main.arn
+  duration   = 3600
+  
+  rules_package_arns = [
+    "arn:aws:inspector:${data.aws_region.current.name}:316112463485:rulespackage/0-R01qwB5Q", # Security Best Practices
+    "arn:aws:inspector:${data.aws_region.current.name}:316112463485:rulespackage/0-gEjTy7T7", # Runtime Behavior Analysis
+    "arn:aws:inspector:${data.aws_region.current.name}:316112463485:rulespackage/0-rExsr2X8", # Common Vulnerabilities
+    "arn:aws:inspector:${data.aws_region.current.name}:316112463485:rulespackage/0-SnojL3Z6"  # Network Reachability
+  ]
+  
+  tags = {
+    Name = "${var.project_name}-inspector-template"
+  }
+}
+
+# Amazon Macie - Data Security and Privacy
+resource "aws_macie2_account" "main" {
+  finding_publishing_frequency = "FIFTEEN_MINUTES"
+  status                       = "ENABLED"
+}
+
+# Macie S3 Bucket Classification Job
+resource "aws_macie2_classification_job" "s3_scan" {
+  job_type = "ONE_TIME"
+  name     = "${var.project_name}-s3-classification"
+  
+  s3_job_definition {
+    bucket_definitions {
+      account_id = data.aws_caller_identity.current.account_id
+      buckets    = [aws_s3_bucket.main.bucket]
+    }
+  }
+  
+  depends_on = [aws_macie2_account.main]
+  
+  tags = {
+    Name = "${var.project_name}-macie-job"
+  }
+}
+
+# AWS CloudHSM - FIPS 140-2 Level 3 Compliance
+resource "aws_cloudhsm_v2_cluster" "main" {
+  hsm_type   = "hsm1.medium"
+  subnet_ids = data.aws_subnet.default[*].id
+  
+  tags = {
+    Name = "${var.project_name}-hsm-cluster"
+  }
+}
+
+resource "aws_cloudhsm_v2_hsm" "main" {
+  cluster_id        = aws_cloudhsm_v2_cluster.main.cluster_id
+  subnet_id         = data.aws_subnet.default[0].id
+  availability_zone = data.aws_availability_zones.available.names[0]
+  
+  tags = {
+    Name = "${var.project_name}-hsm"
+  }
+}
+
+# CloudHSM Client Security Group
+resource "aws_security_group" "cloudhsm_client" {
+  name_prefix = "${var.project_name}-hsm-client-"
+  vpc_id      = data.aws_vpc.main.id
+  description = "Security group for CloudHSM client"
+  
+  egress {
+    description = "CloudHSM NTLS"
+    from_port   = 2223
+    to_port     = 2225
+    protocol    = "tcp"
+    cidr_blocks = ["10.0.0.0/16"]
+  }
+  
+  tags = {
+    Name = "${var.project_name}-hsm-client-sg"
+  }
+}
+
+# Enhanced CloudWatch Monitoring
+resource "aws_cloudwatch_log_group" "app" {
+  name              = "/aws/application/${var.project_name}"
+  retention_in_days = 90
+  kms_key_id        = aws_kms_key.main.arn
+  
+  tags = {
+    Name = "${var.project_name}-app-logs"
+    SecurityLevel = "high"
+  }
+}
+
+# Security-focused CloudWatch Dashboard
+resource "aws_cloudwatch_dashboard" "security" {
+  dashboard_name = "${var.project_name}-security-dashboard"
+  
+  dashboard_body = jsonencode({
+    widgets = [
+      {
+        type   = "metric"
+        width  = 12
+        height = 6
+        properties = {
+          metrics = [
+            ["AWS/ApplicationELB", "TargetResponseTime", "LoadBalancer", aws_lb.main.arn_suffix],
+            ["AWS/ApplicationELB", "RequestCount", "LoadBalancer", aws_lb.main.arn_suffix],
+            ["AWS/ApplicationELB", "HTTPCode_ELB_4XX_Count", "LoadBalancer", aws_lb.main.arn_suffix],
+            ["AWS/ApplicationELB", "HTTPCode_ELB_5XX_Count", "LoadBalancer", aws_lb.main.arn_suffix]
+          ]
+          period = 300
+          stat   = "Sum"
+          region = data.aws_region.current.name
+          title  = "Load Balancer Metrics"
+        }
+      }
+    ]
+  })
+}
+
+# SNS Topic for Security Alerts
+resource "aws_sns_topic" "security_alerts" {
+  name = "${var.project_name}-security-alerts"
+  
+  tags = {
+    Name = "${var.project_name}-security-alerts"
+  }
+}
+
+# CloudWatch Alarms for Security Events
+resource "aws_cloudwatch_metric_alarm" "high_cpu" {
+  alarm_name          = "${var.project_name}-high-cpu"
+  comparison_operator = "GreaterThanThreshold"
+  evaluation_periods  = "2"
+  metric_name         = "CPUUtilization"
+  namespace           = "AWS/EC2"
+  period              = "120"
+  statistic           = "Average"
+  threshold           = "80"
+  alarm_description   = "This metric monitors ec2 cpu utilization"
+  alarm_actions       = [aws_sns_topic.security_alerts.arn]
+  
+  tags = {
+    Name = "${var.project_name}-cpu-alarm"
+  }
+}
+
+resource "aws_cloudwatch_metric_alarm" "disk_usage" {
+  alarm_name          = "${var.project_name}-high-disk-usage"
+  comparison_operator = "GreaterThanThreshold"
+  evaluation_periods  = "2"
+  metric_name         = "DiskSpaceUtilization"
+  namespace           = "System/Linux"
+  period              = "300"
+  statistic           = "Average"
+  threshold           = "85"
+  alarm_description   = "This metric monitors disk space utilization"
+  alarm_actions       = [aws_sns_topic.security_alerts.arn]
+  
+  tags = {
+    Name = "${var.project_name}-disk-alarm"
+  }
+}
+
+# Custom Security Metrics
+resource "aws_cloudwatch_log_metric_filter" "failed_logins" {
+  name           = "${var.project_name}-failed-logins"
+  log_group_name = aws_cloudwatch_log_group.app.name
+  pattern        = "[timestamp, request_id, ip, status_code=401, ...]"
+  
+  metric_transformation {
+    name      = "FailedLogins"
+    namespace = "${var.project_name}/Security"
+    value     = "1"
+  }
+}
+
+resource "aws_cloudwatch_metric_alarm" "failed_login_threshold" {
+  alarm_name          = "${var.project_name}-excessive-failed-logins"
+  comparison_operator = "GreaterThanThreshold"
+  evaluation_periods  = "2"
+  metric_name         = "FailedLogins"
+  namespace           = "${var.project_name}/Security"
+  period              = "300"
+  statistic           = "Sum"
+  threshold           = "10"
+  alarm_description   = "This metric monitors excessive failed login attempts"
+  alarm_actions       = [aws_sns_topic.security_alerts.arn]
+  
+  tags = {
+    Name = "${var.project_name}-failed-login-alarm"
+  }
+}
+
+# Anomaly Detection
+resource "aws_cloudwatch_anomaly_detector" "api_traffic" {
+  metric_math_anomaly_detector {
+    metric_data_queries {
+      id = "m1"
+      return_data = true
+      metric_stat {
+        metric {
+          metric_name = "RequestCount"
+          namespace   = "AWS/ApplicationELB"
+          
+          dimensions = {
+            LoadBalancer = aws_lb.main.arn_suffix
+          }
+        }
+        period = 300
+        stat   = "Average"
+      }
+    }
+  }
+}
+
+# Enhanced CloudTrail Configuration
+resource "aws_cloudtrail" "main" {
+  name                          = "${var.project_name}-trail-enhanced"
+  s3_bucket_name               = aws_s3_bucket.cloudtrail_logs.id
+  s3_key_prefix                = "cloudtrail"
+  include_global_service_events = true
+  is_multi_region_trail        = true
+  enable_logging               = true
+  enable_log_file_validation   = true
+  kms_key_id                   = aws_kms_key.main.arn
+  
+  # Enhanced data events
+  event_selector {
+    read_write_type                 = "All"
+    include_management_events       = true
+    
+    data_resource {
+      type   = "AWS::S3::Object"
+      values = ["${aws_s3_bucket.main.arn}/*"]
+    }
+    
+    data_resource {
+      type   = "AWS::Lambda::Function"
+      values = ["arn:aws:lambda:*"]
+    }
+  }
+  
+  # Insights for anomaly detection
+  insight_selector {
+    insight_type = "ApiCallRateInsight"
+  }
+  
+  tags = {
+    Name = "${var.project_name}-trail-enhanced"
+    SecurityLevel = "high"
+  }
+}
+
+# VPC Flow Logs
+resource "aws_flow_log" "vpc" {
+  iam_role_arn    = aws_iam_role.flow_logs.arn
+  log_destination = aws_cloudwatch_log_group.vpc_flow_logs.arn
+  traffic_type    = "ALL"
+  vpc_id          = data.aws_vpc.main.id
+  
+  tags = {
+    Name = "${var.project_name}-vpc-flow-logs"
+  }
+}
+
+resource "aws_cloudwatch_log_group" "vpc_flow_logs" {
+  name              = "/aws/vpc/flowlogs/${var.project_name}"
+  retention_in_days = 90
+  kms_key_id        = aws_kms_key.main.arn
+  
+  tags = {
+    Name = "${var.project_name}-vpc-flow-logs"
+  }
+}
+
+# Enhanced S3 Bucket for CloudTrail Logs
+resource "aws_s3_bucket" "cloudtrail_logs" {
+  bucket        = "${var.project_name}-cloudtrail-logs-${random_id.logs_suffix.hex}"
+  force_destroy = false
+  
+  tags = {
+    Name = "${var.project_name}-cloudtrail-logs"
+    SecurityLevel = "high"
+  }
+}
+
+resource "aws_s3_bucket_encryption_configuration" "cloudtrail_logs" {
+  bucket = aws_s3_bucket.cloudtrail_logs.id
+  
+  rule {
+    apply_server_side_encryption_by_default {
+      kms_master_key_id = aws_kms_key.main.arn
+      sse_algorithm     = "aws:kms"
+    }
+    bucket_key_enabled = true
+  }
+}
+
+resource "aws_s3_bucket_public_access_block" "cloudtrail_logs" {
+  bucket = aws_s3_bucket.cloudtrail_logs.id
+  
+  block_public_acls       = true
+  block_public_policy     = true
+  ignore_public_acls      = true
+  restrict_public_buckets = true
+}
+
+# IAM Role for Flow Logs
+resource "aws_iam_role" "flow_logs" {
+  name = "${var.project_name}-flow-logs-role"
+  
+  assume_role_policy = jsonencode({
+    Version = "2012-10-17"
+    Statement = [
+      {
+        Action = "sts:AssumeRole"
+        Effect = "Allow"
+        Principal = {
+          Service = "vpc-flow-logs.amazonaws.com"
+        }
+      }
+    ]
+  })
+}
+
+resource "aws_iam_role_policy" "flow_logs" {
+  name = "${var.project_name}-flow-logs-policy"
+  role = aws_iam_role.flow_logs.id
+  
+  policy = jsonencode({
+    Version = "2012-10-17"
+    Statement = [
+      {
+        Action = [
+          "logs:CreateLogGroup",
+          "logs:CreateLogStream",
+          "logs:PutLogEvents",
+          "logs:DescribeLogGroups",
+          "logs:DescribeLogStreams"
+        ]
+        Effect   = "Allow"
+        Resource = "*"
+      }
+    ]
+  })
+}
+
+resource "random_id" "logs_suffix" {
+  byte_length = 4
+}
+
+
+# HIPAA Compliance Controls
+# Reference: HIPAA Security Rule (45 CFR Part 164)
+
+locals {
+  hipaa_tags = {
+    Compliance = "HIPAA"
+  }
+}
+
+# Access Control (§164.312(a)(1))
+resource "aws_iam_policy" "hipaa_access_control" {
+  name        = "demo-shop-hipaa-access-control"
+  description = "HIPAA compliant access control policy"
+  
+  policy = jsonencode({
+    Version = "2012-10-17"
+    Statement = [
+      {
+        Effect = "Deny"
+        Action = "*"
+        Resource = "*"
+        Condition = {
+          Bool = {
+            "aws:MultiFactorAuthPresent" = "false"
+          }
+        }
+      }
+    ]
+  })
+}
+
+# Audit Controls (§164.312(b))
+resource "aws_cloudwatch_log_group" "hipaa_audit" {
+  name              = "/aws/hipaa/demo-shop/audit"
+  retention_in_days = 2555  # 7 years retention for HIPAA
+  kms_key_id        = aws_kms_key.main.arn
+  
+  tags = merge(local.hipaa_tags, {
+    Name    = "demo-shop-hipaa-audit-logs"
+    Purpose = "Audit Trail"
+  })
+}
+
+# Data Backup and Recovery (§164.308(a)(7)(ii)(A))
+resource "aws_backup_vault" "hipaa" {
+  name        = "demo-shop-hipaa-backup"
+  kms_key_arn = aws_kms_key.main.arn
+  
+  tags = merge(local.hipaa_tags, {
+    Name = "demo-shop-hipaa-backup"
+  })
+}
+
+resource "aws_backup_plan" "hipaa" {
+  name = "demo-shop-hipaa-backup-plan"
+  
+  rule {
+    rule_name         = "hipaa_daily_backup"
+    target_vault_name = aws_backup_vault.hipaa.name
+    schedule          = "cron(0 5 ? * * *)"
+    
+    recovery_point_tags = local.hipaa_tags
+    
+    lifecycle {
+      cold_storage_after = 30
+      delete_after       = 2555  # 7 years
+    }
+    
+    copy_action {
+      destination_vault_arn = aws_backup_vault.hipaa.arn
+      
+      lifecycle {
+        cold_storage_after = 30
+        delete_after       = 2555
+      }
+    }
+  }
+}
+
+
+# Outputs
+output "vpc_id" {
+  description = "ID of the VPC"
+  value       = data.aws_vpc.main.id
+}
+
+output "load_balancer_dns" {
+  description = "DNS name of the load balancer"
+  value       = try(aws_lb.main.dns_name, "")
+}
+
+output "s3_bucket_name" {
+  description = "Name of the S3 bucket"
+  value       = aws_s3_bucket.main.bucket
+}
+
+output "database_endpoint" {
+  description = "Database endpoint"
+  value       = try(aws_db_instance.main.endpoint, "")
+  sensitive   = true
+}
+
@@ -0,0 +1,693 @@
+# Terraform configuration for blog
+# Generated with security best practices
+
+terraform {
+  required_version = ">= 1.5"
+  required_providers {
+    aws = {
+      source  = "hashicorp/aws"
+      version = "~> 5.0"
+    }
+    random = {
+      source  = "hashicorp/random"
+      version = "~> 3.1"
+    }
+  }
+}
+
+provider "aws" {
+  region = var.aws_region
+  
+  default_tags {
+    tags = {
+      Project     = var.project_name
+      Environment = var.environment
+      ManagedBy   = "Terraform"
+      CreatedBy   = "AWS-Architecture-Generator"
+    }
+  }
+}
+
+# Variables
+variable "aws_region" {
+  description = "AWS region"
+  type        = string
+  default     = "us-west-2"
+}
+
+variable "environment" {
+  description = "Environment name (dev, staging, prod)"
+  type        = string
+  default     = "dev"
+  
+  validation {
+    condition     = contains(["dev", "staging", "prod"], var.environment)
+    error_message = "Environment must be dev, staging, or prod."
+  }
+}
+
+variable "project_name" {
+  description = "Project name"
+  type        = string
+}
+
+variable "enable_deletion_protection" {
+  description = "Enable deletion protection for critical resources"
+  type        = bool
+  default     = true
+}
+
+variable "services" {
+  description = "Map of services to enable"
+  type        = map(string)
+  default     = {}
+}
+
+variable "enable_bastion" {
+  description = "Enable bastion host for secure access"
+  type        = bool
+  default     = false
+}
+
+variable "allowed_ssh_cidrs" {
+  description = "CIDR blocks allowed for SSH access"
+  type        = list(string)
+  default     = ["10.0.0.0/8"]
+}
+
+variable "enable_scp" {
+  description = "Enable Service Control Policies"
+  type        = bool
+  default     = false
+}
+
+# Data Sources
+data "aws_availability_zones" "available" {
+  state = "available"
+}
+
+data "aws_caller_identity" "current" {}
+
+data "aws_region" "current" {}
+
+# Random ID for unique resource naming
+resource "random_id" "suffix" {
+  byte_length = 4
+}
+
+# KMS Key for encryption
+resource "aws_kms_key" "main" {
+  description             = "KMS key for blog"
+  deletion_window_in_days = 7
+  enable_key_rotation     = true
+  
+  policy = jsonencode({
+    Version = "2012-10-17"
+    Statement = [
+      {
+        Sid    = "Enable IAM User Permissions"
+        Effect = "Allow"
+        Principal = {
+          AWS = "arn:aws:iam::${data.aws_caller_identity.current.account_id}:root"
+        }
+        Action   = "kms:*"
+        Resource = "*"
+      }
+    ]
+  })
+  
+  tags = {
+    Name = "${var.project_name}-kms-key"
+  }
+}
+
+resource "aws_kms_alias" "main" {
+  name          = "alias/${var.project_name}-key-${random_id.suffix.hex}"
+  target_key_id = aws_kms_key.main.key_id
+}
+
+# Use Default VPC and its existing resources
+data "aws_vpc" "main" {
+  default = true
+}
+
+# Get default subnets (already exist in default VPC)
+data "aws_subnets" "default" {
+  filter {
+    name   = "vpc-id"
+    values = [data.aws_vpc.main.id]
+  }
+}
+
+data "aws_subnet" "default" {
+  count = length(data.aws_subnets.default.ids)
+  id    = data.aws_subnets.default.ids[count.index]
+}
+
+# Get existing internet gateway for default VPC
+data "aws_internet_gateway" "default" {
+  filter {
+    name   = "attachment.vpc-id"
+    values = [data.aws_vpc.main.id]
+  }
+}
+
+# Get existing route table for default VPC
+data "aws_route_table" "default" {
+  vpc_id = data.aws_vpc.main.id
+  filter {
+    name   = "association.main"
+    values = ["true"]
+  }
+}
+
+# Use default subnets for both public and private
+locals {
+  # Use existing default subnets (they're all public by default)
+  public_subnet_ids = data.aws_subnets.default.ids
+  private_subnet_ids = data.aws_subnets.default.ids  # Same as public for simplicity
+}
+
+
+# Enhanced Security Groups with Least Privilege Access
+# Generated for security level: basic
+
+# Web tier security group
+resource "aws_security_group" "web_tier" {
+  name_prefix = "blog-web-"
+  description = "Security group for web tier with enhanced controls"
+  vpc_id      = data.aws_vpc.main.id
+
+  # HTTPS traffic
+  ingress {
+    description = "HTTPS"
+    from_port   = 443
+    to_port     = 443
+    protocol    = "tcp"
+    cidr_blocks = ["0.0.0.0/0"]
+  }
+
+  # HTTP traffic (redirect to HTTPS)
+  ingress {
+    description = "HTTP"
+    from_port   = 80
+    to_port     = 80
+    protocol    = "tcp"
+    cidr_blocks = ["0.0.0.0/0"]
+  }
+
+  # Outbound traffic
+  egress {
+    from_port   = 0
+    to_port     = 0
+    protocol    = "-1"
+    cidr_blocks = ["0.0.0.0/0"]
+  }
+
+  tags = {
+    Name        = "blog-web-sg"
+    Environment = var.environment
+    Tier        = "web"
+  }
+}
+
+# Application tier security group
+resource "aws_security_group" "app_tier" {
+  name_prefix = "blog-app-"
+  description = "Security group for application tier"
+  vpc_id      = data.aws_vpc.main.id
+
+  # Allow traffic from web tier
+  ingress {
+    description     = "App traffic from web tier"
+    from_port       = 8080
+    to_port         = 8080
+    protocol        = "tcp"
+    security_groups = [aws_security_group.web_tier.id]
+  }
+
+  # Allow traffic from ALB (using VPC CIDR to avoid circular dependency)
+  ingress {
+    description = "App traffic from ALB"
+    from_port   = 80
+    to_port     = 80
+    protocol    = "tcp"
+    cidr_blocks = [data.aws_vpc.main.cidr_block]
+  }
+
+  # Outbound traffic
+  egress {
+    from_port   = 0
+    to_port     = 0
+    protocol    = "-1"
+    cidr_blocks = ["0.0.0.0/0"]
+  }
+
+  tags = {
+    Name        = "blog-app-sg"
+    Environment = var.environment
+    Tier        = "application"
+  }
+}
+
+# Database tier security group
+resource "aws_security_group" "db_tier" {
+  name_prefix = "blog-db-"
+  description = "Security group for database tier"
+  vpc_id      = data.aws_vpc.main.id
+
+  # MySQL/Aurora
+  ingress {
+    description     = "MySQL/Aurora"
+    from_port       = 3306
+    to_port         = 3306
+    protocol        = "tcp"
+    security_groups = [aws_security_group.app_tier.id]
+  }
+
+  # PostgreSQL
+  ingress {
+    description     = "PostgreSQL"
+    from_port       = 5432
+    to_port         = 5432
+    protocol        = "tcp"
+    security_groups = [aws_security_group.app_tier.id]
+  }
+
+  # Redis
+  ingress {
+    description     = "Redis"
+    from_port       = 6379
+    to_port         = 6379
+    protocol        = "tcp"
+    security_groups = [aws_security_group.app_tier.id]
+  }
+
+  # No outbound rules - databases shouldn't initiate connections
+  tags = {
+    Name        = "blog-db-sg"
+    Environment = var.environment
+    Tier        = "database"
+  }
+}
+
+# ALB security group
+resource "aws_security_group" "alb" {
+  name_prefix = "blog-alb-"
+  description = "Security group for Application Load Balancer"
+  vpc_id      = data.aws_vpc.main.id
+
+  # HTTPS traffic
+  ingress {
+    description = "HTTPS"
+    from_port   = 443
+    to_port     = 443
+    protocol    = "tcp"
+    cidr_blocks = ["0.0.0.0/0"]
+  }
+
+  # HTTP traffic
+  ingress {
+    description = "HTTP"
+    from_port   = 80
+    to_port     = 80
+    protocol    = "tcp"
+    cidr_blocks = ["0.0.0.0/0"]
+  }
+
+  # Outbound traffic
+  egress {
+    from_port   = 0
+    to_port     = 0
+    protocol    = "-1"
+    cidr_blocks = ["0.0.0.0/0"]
+  }
+
+  tags = {
+    Name        = "blog-alb-sg"
+    Environment = var.environment
+    Type        = "load-balancer"
+  }
+}
+
+
+# Lambda security group (if using VPC Lambda)
+resource "aws_security_group" "lambda" {
+  count       = length(keys(var.services)) > 0 && contains(keys(var.services), "lambda") ? 1 : 0
+  name_prefix = "blog-lambda-"
+  description = "Security group for Lambda functions"
+  vpc_id      = data.aws_vpc.main.id
+
+  # Outbound traffic for Lambda
+  egress {
+    from_port   = 443
+    to_port     = 443
+    protocol    = "tcp"
+    cidr_blocks = ["0.0.0.0/0"]
+    description = "HTTPS outbound"
+  }
+
+  egress {
+    from_port       = 3306
+    to_port         = 3306
+    protocol        = "tcp"
+    security_groups = [aws_security_group.db_tier.id]
+    description     = "MySQL access"
+  }
+
+  egress {
+    from_port       = 5432
+    to_port         = 5432
+    protocol        = "tcp"
+    security_groups = [aws_security_group.db_tier.id]
+    description     = "PostgreSQL access"
+  }
+
+  tags = {
+    Name        = "blog-lambda-sg"
+    Environment = var.environment
+    Type        = "lambda"
+  }
+}
+
+# Bastion host security group (for secure access)
+resource "aws_security_group" "bastion" {
+  count       = try(var.enable_bastion, false) ? 1 : 0
+  name_prefix = "blog-bastion-"
+  description = "Security group for bastion host"
+  vpc_id      = data.aws_vpc.main.id
+
+  # SSH access from specific IP ranges
+  ingress {
+    description = "SSH from office"
+    from_port   = 22
+    to_port     = 22
+    protocol    = "tcp"
+    cidr_blocks = try(var.allowed_ssh_cidrs, ["10.0.0.0/8"])
+  }
+
+  # Outbound SSH to private subnets
+  egress {
+    description = "SSH to private instances"
+    from_port   = 22
+    to_port     = 22
+    protocol    = "tcp"
+    cidr_blocks = [for subnet in data.aws_subnet.default : subnet.cidr_block]
+  }
+
+  tags = {
+    Name        = "blog-bastion-sg"
+    Environment = var.environment
+    Type        = "bastion"
+  }
+}
+
+
+
+# Network ACLs - Using Default VPC's Existing Network ACLs
+# Default VPC already has a default network ACL that allows all traffic
+# For production use, consider adding custom network ACL rules
+# Security Level: basic
+
+# Note: Default VPC subnets already have network ACL associations
+# Custom network ACLs are disabled to avoid conflicts with existing associations
+
+
+# Launch Template
+resource "aws_launch_template" "app" {
+  name_prefix   = "${var.project_name}-"
+  image_id      = data.aws_ami.amazon_linux.id
+  instance_type = "t3.micro"
+  
+  vpc_security_group_ids = [aws_security_group.app_tier.id]
+  
+  
+  
+  iam_instance_profile {
+    name = aws_iam_instance_profile.app.name
+  }
+  
+  block_device_mappings {
+    device_name = "/dev/xvda"
+    ebs {
+      volume_size = 20
+      volume_type = "gp3"
+      encrypted   = true
+      
+      delete_on_termination = true
+    }
+  }
+  
+  metadata_options {
+    http_endpoint = "enabled"
+    http_tokens   = "required"
+    http_put_response_hop_limit = 1
+  }
+  
+  tag_specifications {
+    resource_type = "instance"
+    tags = {
+      Name = "${var.project_name}-instance"
+    }
+  }
+  
+  user_data = base64encode(<<-EOF
+#!/bin/bash
+yum update -y
+yum install -y amazon-cloudwatch-agent
+echo "Project: ${var.project_name}" > /home/ec2-user/project_info.txt
+EOF
+  )
+}
+
+# Auto Scaling Group
+resource "aws_autoscaling_group" "app" {
+  name                = "${var.project_name}-asg-${random_id.suffix.hex}"
+  vpc_zone_identifier = local.private_subnet_ids
+  target_group_arns   = [aws_lb_target_group.app.arn]
+  health_check_type   = "ELB"
+  health_check_grace_period = 300
+  
+  min_size         = 1
+  max_size         = 2
+  desired_capacity = 1
+  
+  launch_template {
+    id      = aws_launch_template.app.id
+    version = "$Latest"
+  }
+  
+  tag {
+    key                 = "Name"
+    value               = "${var.project_name}-asg"
+    propagate_at_launch = false
+  }
+}
+
+# IAM Role for EC2 instances
+resource "aws_iam_role" "app" {
+  name = "${var.project_name}-app-role-${random_id.suffix.hex}"
+  
+  assume_role_policy = jsonencode({
+    Version = "2012-10-17"
+    Statement = [
+      {
+        Action = "sts:AssumeRole"
+        Effect = "Allow"
+        Principal = {
+          Service = "ec2.amazonaws.com"
+        }
+      }
+    ]
+  })
+}
+
+resource "aws_iam_instance_profile" "app" {
+  name = "${var.project_name}-app-profile-${random_id.suffix.hex}"
+  role = aws_iam_role.app.name
+}
+
+resource "aws_iam_role_policy" "app" {
+  name = "${var.project_name}-app-policy-${random_id.suffix.hex}"
+  role = aws_iam_role.app.id
+  
+  policy = jsonencode({
+    Version = "2012-10-17"
+    Statement = [
+      {
+        Effect = "Allow"
+        Action = [
+          "s3:GetObject",
+          "s3:PutObject",
+          "s3:DeleteObject"
+        ]
+        Resource = "${aws_s3_bucket.main.arn}/*"
+      }
+    ]
+  })
+}
+
+# AMI Data Source
+data "aws_ami" "amazon_linux" {
+  most_recent = true
+  owners      = ["amazon"]
+  
+  filter {
+    name   = "name"
+    values = ["amzn2-ami-hvm-*-x86_64-gp2"]
+  }
+}
+
+# DynamoDB Table
+resource "aws_dynamodb_table" "main" {
+  name             = "${var.project_name}-table-${random_id.suffix.hex}"
+  billing_mode     = "PAY_PER_REQUEST"
+  hash_key         = "id"
+  deletion_protection_enabled = false
+  
+  attribute {
+    name = "id"
+    type = "S"
+  }
+  
+  # Enable encryption
+  server_side_encryption {
+    enabled     = true
+    kms_key_arn = null
+  }
+  
+  # Enable point-in-time recovery
+  point_in_time_recovery {
+    enabled = false
+  }
+  
+  # Enable DynamoDB Streams for change capture
+  stream_enabled   = true
+  stream_view_type = "NEW_AND_OLD_IMAGES"
+  
+  tags = {
+    Name = "${var.project_name}-dynamodb-table"
+  }
+}
+
+# DynamoDB Global Secondary Index (optional)
+resource "aws_dynamodb_table" "gsi_table" {
+  count            = 0
+  name             = "${var.project_name}-gsi-table-${random_id.suffix.hex}"
+  billing_mode     = "PAY_PER_REQUEST"
+  hash_key         = "gsi_id"
+  
+  attribute {
+    name = "gsi_id"
+    type = "S"
+  }
+  
+  attribute {
+    name = "sort_key"
+    type = "S"
+  }
+  
+  global_secondary_index {
+    name     = "GSI1"
+    hash_key = "gsi_id"
+    range_key = "sort_key"
+    projection_type = "ALL"
+  }
+  
+  server_side_encryption {
+    enabled     = true
+    kms_key_arn = null
+  }
+  
+  point_in_time_recovery {
+    enabled = false
+  }
+  
+  tags = {
+    Name = "${var.project_name}-dynamodb-gsi-table"
+  }
+}
+
+# S3 Bucket
+resource "aws_s3_bucket" "main" {
+  bucket = "${var.project_name}-storage-${random_id.bucket_suffix.hex}"
+  
+  tags = {
+    Name = "${var.project_name}-storage"
+  }
+}
+
+resource "random_id" "bucket_suffix" {
+  byte_length = 4
+}
+
+# S3 Bucket Configuration
+resource "aws_s3_bucket_versioning" "main" {
+  bucket = aws_s3_bucket.main.id
+  versioning_configuration {
+    status = "Enabled"
+  }
+}
+
+resource "aws_s3_bucket_server_side_encryption_configuration" "main" {
+  bucket = aws_s3_bucket.main.id
+  
+  rule {
+    apply_server_side_encryption_by_default {
+      
+      sse_algorithm     = "AES256"
+    }
+    bucket_key_enabled = true
+  }
+}
+
+resource "aws_s3_bucket_public_access_block" "main" {
+  bucket = aws_s3_bucket.main.id
+  
+  block_public_acls       = true
+  block_public_policy     = true
+  ignore_public_acls      = true
+  restrict_public_buckets = true
+}
+
+resource "aws_s3_bucket_lifecycle_configuration" "main" {
+  bucket = aws_s3_bucket.main.id
+  
+  rule {
+    id     = "lifecycle"
+    status = "Enabled"
+    
+    expiration {
+      days = 90
+    }
+    
+    noncurrent_version_expiration {
+      noncurrent_days = 30
+    }
+  }
+}
+
+
+
+# Outputs
+output "vpc_id" {
+  description = "ID of the VPC"
+  value       = data.aws_vpc.main.id
+}
+
+output "load_balancer_dns" {
+  description = "DNS name of the load balancer"
+  value       = try(aws_lb.main.dns_name, "")
+}
+
+output "s3_bucket_name" {
+  description = "Name of the S3 bucket"
+  value       = aws_s3_bucket.main.bucket
+}
+
+output "database_endpoint" {
+  description = "Database endpoint"
+  value       = try(aws_db_instance.main.endpoint, "")
+  sensitive   = true
+}
+
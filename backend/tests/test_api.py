@@ -0,0 +1,57 @@
+import pytest
+
+from app.core.architecture_generator import ArchitectureGenerator
+from app.schemas.questionnaire import QuestionnaireRequest
+from tests.conftest import QUESTIONNAIRES
+
+ARCHITECTURE_URL = "/api/v1/architecture"
+
+def _full_architecture(case: str):
+    """The non-streaming result that the download endpoints must match"""
+    return ArchitectureGenerator().generate(QuestionnaireRequest(**QUESTIONNAIRES[case]))
+
+
+@pytest.mark.parametrize("case", sorted(QUESTIONNAIRES))
+def test_generate_terraform_streams_template(case, api_request):
+    response = api_request("POST", ARCHITECTURE_URL + "/generate/terraform", json=QUESTIONNAIRES[case])
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert response.headers["content-disposition"] == 'attachment; filename="main.tf"'
+    assert response.text == _full_architecture(case).terraform_template
+
+@pytest.mark.parametrize("case", sorted(QUESTIONNAIRES))
+def test_generate_cloudformation_streams_template(case, api_request):
+    response = api_request("POST", ARCHITECTURE_URL + "/generate/cloudformation", json=QUESTIONNAIRES[case])
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/yaml")
+    assert response.headers["content-disposition"] == 'attachment; filename="template.yaml"'
+    assert response.text == _full_architecture(case).cloudformation_template
+
+@pytest.mark.parametrize("template", ["terraform", "cloudformation"])
+def test_generate_template_rejects_invalid_questionnaire(template, api_request):
+    invalid = {**QUESTIONNAIRES["serverless_basic"], "traffic_volume": "enormous"}
+
+    response = api_request("POST", ARCHITECTURE_URL + "/generate/" + template, json=invalid)
+
+    assert response.status_code == 422
+
+def _preflight(api_request, origin: str):
+    return api_request("OPTIONS", ARCHITECTURE_URL + "/generate/terraform", headers={
+        "Origin": origin,
+        "Access-Control-Request-Method": "POST",
+    })
+
+def test_cors_allows_configured_origin_with_credentials(api_request):
+    response = _preflight(api_request, "http://localhost:3000")
+
+    assert response.status_code == 200
+    assert response.headers["access-control-allow-origin"] == "http://localhost:3000"
+    assert response.headers["access-control-allow-credentials"] == "true"
+
+def test_cors_rejects_unlisted_origin(api_request):
+    response = _preflight(api_request, "https://attacker.example")
+
+    assert response.status_code == 400
+    assert "access-control-allow-origin" not in response.headers
@@ -0,0 +1,94 @@
+import os
+
+import pytest
+
+from app.core.template_generator import TemplateGenerator
+from tests.conftest import GOLDEN_DIR, QUESTIONNAIRES, SERVICES
+
+# UPDATE_GOLDEN=1 rewrites the golden files from the current generators instead of comparing
+UPDATE_GOLDEN = os.environ.get("UPDATE_GOLDEN") == "1"
+
+def assert_matches_golden(name: str, rendered: str) -> None:
+    path = GOLDEN_DIR / name
+    if UPDATE_GOLDEN:
+        path.write_text(rendered)
+    assert rendered == path.read_text(), f"{name} differs from its golden file; rerun with UPDATE_GOLDEN=1 if the change is intended"
+
+
+@pytest.mark.parametrize("case", sorted(QUESTIONNAIRES))
+def test_terraform_matches_golden(case, template_generator, make_questionnaire):
+    rendered = template_generator.generate_terraform_template(make_questionnaire(case), SERVICES[case])
+    assert_matches_golden("%s.tf" % case, rendered)
+
+@pytest.mark.parametrize("case", sorted(QUESTIONNAIRES))
+def test_cloudformation_matches_golden(case, template_generator, make_questionnaire):
+    rendered = template_generator.generate_cloudformation_template(make_questionnaire(case), SERVICES[case])
+    assert_matches_golden("%s.yaml" % case, rendered)
+
+@pytest.mark.parametrize("case", sorted(QUESTIONNAIRES))
+def test_streamed_templates_match_rendered(case, template_generator, make_questionnaire):
+    questionnaire = make_questionnaire(case)
+    services = SERVICES[case]
+    assert "".join(template_generator.iter_terraform_template(questionnaire, services)) == \
+        template_generator.generate_terraform_template(questionnaire, services)
+    assert "".join(template_generator.iter_cloudformation_template(questionnaire, services)) == \
+        template_generator.generate_cloudformation_template(questionnaire, services)
+
+
+def test_terraform_cache_keys_on_project_name(template_generator, make_questionnaire):
+    services = SERVICES["containers_high"]
+    shop = template_generator.generate_terraform_template(make_questionnaire(project_name="Demo Shop"), services)
+    store = template_generator.generate_terraform_template(make_questionnaire(project_name="Demo Store"), services)
+
+    assert shop.startswith("# Terraform configuration for demo-shop\n")
+    assert store.startswith("# Terraform configuration for demo-store\n")
+    assert TemplateGenerator._generate_terraform_cached.cache_info().currsize == 2
+
+def test_terraform_cache_follows_renamed_questionnaire(template_generator, make_questionnaire):
+    questionnaire = make_questionnaire(project_name="Demo Shop")
+    services = SERVICES["containers_high"]
+    template_generator.generate_terraform_template(questionnaire, services)
+
+    renamed = questionnaire.model_copy(update={"project_name": "Other Shop"})
+    assert template_generator.generate_terraform_template(renamed, services).startswith("# Terraform configuration for other-shop\n")
+
+def test_cloudformation_cache_keys_on_project_name(template_generator, make_questionnaire):
+    services = SERVICES["containers_high"]
+    shop = template_generator.generate_cloudformation_template(make_questionnaire(project_name="Demo Shop"), services)
+    store = template_generator.generate_cloudformation_template(make_questionnaire(project_name="Demo Store"), services)
+
+    assert "CloudFormation template for Demo Shop -" in shop
+    assert "CloudFormation template for Demo Store -" in store
+    assert TemplateGenerator._generate_cloudformation_cached.cache_info().currsize == 2
+    # Only the header names the project, so both documents share one rendered body
+    assert TemplateGenerator._cloudformation_body_cached.cache_info().currsize == 1
+
+def test_service_order_does_not_split_cache(template_generator, make_questionnaire):
+    questionnaire = make_questionnaire()
+    services = SERVICES["containers_high"]
+    reordered = dict(reversed(list(services.items())))
+
+    assert template_generator.generate_terraform_template(questionnaire, services) == \
+        template_generator.generate_terraform_template(questionnaire, reordered)
+    assert template_generator.generate_cloudformation_template(questionnaire, services) == \
+        template_generator.generate_cloudformation_template(questionnaire, reordered)
+
+    terraform_cache = TemplateGenerator._generate_terraform_cached.cache_info()
+    cloudformation_cache = TemplateGenerator._generate_cloudformation_cached.cache_info()
+    assert (terraform_cache.currsize, terraform_cache.hits) == (1, 1)
+    assert (cloudformation_cache.currsize, cloudformation_cache.hits) == (1, 1)
+
+def test_compliance_requirements_are_part_of_cache_key(template_generator, make_questionnaire):
+    services = SERVICES["containers_high"]
+    rendered = {
+        compliance: template_generator.generate_terraform_template(
+            make_questionnaire(compliance_requirements=list(compliance)), services
+        )
+        for compliance in [(), ("gdpr",), ("hipaa", "pci")]
+    }
+
+    assert len(set(rendered.values())) == 3
+    assert TemplateGenerator._generate_terraform_cached.cache_info().currsize == 3
+
+    template_generator.generate_terraform_template(make_questionnaire(compliance_requirements=["gdpr"]), services)
+    assert TemplateGenerator._generate_terraform_cached.cache_info().hits == 1
@@ -0,0 +1,101 @@
+import pytest
+from sqlalchemy import create_engine, inspect
+from sqlalchemy.orm import sessionmaker
+
+from app import database
+from app.config import settings
+
+
+@pytest.fixture
+def temp_engine(tmp_path, monkeypatch):
+    """Point the database module at a throwaway SQLite file"""
+    engine = create_engine("sqlite:///%s" % (tmp_path / "test.db"), connect_args={"check_same_thread": False})
+    monkeypatch.setattr(database, "engine", engine)
+    monkeypatch.setattr(database, "SessionLocal", sessionmaker(autocommit=False, autoflush=False, bind=engine))
+    monkeypatch.setattr(settings, "DEBUG", False)
+    yield engine
+    engine.dispose()
+
+def _user_version(engine) -> int:
+    with engine.connect() as conn:
+        return conn.exec_driver_sql("PRAGMA user_version").scalar()
+
+
+def test_create_tables_records_schema_fingerprint(temp_engine):
+    database.create_tables()
+
+    assert {"users", "sessions", "projects", "deployments"} <= set(inspect(temp_engine).get_table_names())
+    assert _user_version(temp_engine) == database._schema_fingerprint()
+
+def test_create_tables_skips_work_on_warm_start(temp_engine, monkeypatch):
+    database.create_tables()
+    calls = []
+    monkeypatch.setattr(database.Base.metadata, "create_all", lambda **kwargs: calls.append(kwargs))
+
+    database.create_tables()
+
+    assert calls == []
+
+def test_create_tables_reruns_when_fingerprint_changes(temp_engine, monkeypatch):
+    database.create_tables()
+    with temp_engine.begin() as conn:
+        conn.exec_driver_sql("PRAGMA user_version = 1")
+    calls = []
+    create_all = database.Base.metadata.create_all
+    monkeypatch.setattr(database.Base.metadata, "create_all", lambda **kwargs: calls.append(kwargs) or create_all(**kwargs))
+
+    database.create_tables()
+
+    assert len(calls) == 1
+    assert _user_version(temp_engine) == database._schema_fingerprint()
+
+def test_create_tables_seeds_demo_user_only_in_debug(temp_engine, monkeypatch):
+    database.create_tables()
+    db = database.SessionLocal()
+    try:
+        assert db.query(database.UserDB).filter(database.UserDB.username == "demo").count() == 0
+    finally:
+        db.close()
+
+    monkeypatch.setattr(settings, "DEBUG", True)
+    with temp_engine.begin() as conn:
+        conn.exec_driver_sql("PRAGMA user_version = 0")
+    database.create_tables()
+    db = database.SessionLocal()
+    try:
+        assert db.query(database.UserDB).filter(database.UserDB.username == "demo").count() == 1
+    finally:
+        db.close()
+
+def _index_names(engine, table: str) -> set:
+    return {index["name"] for index in inspect(engine).get_indexes(table)}
+
+def test_create_tables_adds_indexes_missing_from_existing_tables(temp_engine):
+    database.create_tables()
+    with temp_engine.begin() as conn:
+        conn.exec_driver_sql("DROP INDEX ix_projects_user_created")
+        conn.exec_driver_sql("DROP INDEX ix_deployments_project_created")
+        conn.exec_driver_sql("PRAGMA user_version = 0")
+
+    database.create_tables()
+
+    assert "ix_projects_user_created" in _index_names(temp_engine, "projects")
+    assert "ix_deployments_project_created" in _index_names(temp_engine, "deployments")
+    assert _user_version(temp_engine) == database._schema_fingerprint()
+
+def test_composite_indexes_replace_their_prefixes(temp_engine):
+    database.create_tables()
+
+    # The composite index serves project_id lookups on its own, and token is already unique
+    assert "ix_deployments_project_id" not in _index_names(temp_engine, "deployments")
+    assert _index_names(temp_engine, "sessions") == {"ix_sessions_id", "ix_sessions_token"}
+
+@pytest.mark.parametrize("password, expected", [("s3cret", True), ("S3cret", False), ("", False)])
+def test_verify_password(password, expected):
+    user = database.UserDB(password_hash=database.UserDB.hash_password("s3cret"))
+
+    assert user.verify_password(password) is expected
+
+@pytest.mark.parametrize("stored_hash", [None, "", "abc", "not-a-hex-digest"])
+def test_verify_password_rejects_malformed_hash(stored_hash):
+    assert database.UserDB(password_hash=stored_hash).verify_password("s3cret") is False